@@ -19,7 +19,7 @@ import os
 from datetime import datetime
 from decimal import Decimal
 from json import JSONDecodeError
-from typing import Tuple, List, Dict, Union
+from typing import Tuple, List, Dict, Union, TYPE_CHECKING
 
 import click
 import maya
@@ -29,7 +29,6 @@ from constant_sorrow.constants import (
     WORKER_NOT_RUNNING,
     NO_WORKER_ASSIGNED
 )
-from eth_tester.exceptions import TransactionFailed
 from eth_utils import is_checksum_address
 from eth_utils import keccak
 from twisted.logger import Logger
@@ -42,14 +41,6 @@ from nucypher.blockchain.eth.agents import (
     AdjudicatorAgent
 )
 from nucypher.blockchain.eth.decorators import validate_checksum_address
-from nucypher.blockchain.eth.deployers import (
-    NucypherTokenDeployer,
-    StakingEscrowDeployer,
-    PolicyManagerDeployer,
-    UserEscrowProxyDeployer,
-    UserEscrowDeployer,
-    AdjudicatorDeployer,
-    ContractDeployer)
 from nucypher.blockchain.eth.interfaces import BlockchainDeployerInterface
 from nucypher.blockchain.eth.interfaces import BlockchainInterface
 from nucypher.blockchain.eth.registry import AllocationRegistry
@@ -61,6 +52,9 @@ from nucypher.config.base import BaseConfiguration
 from nucypher.config.constants import DEFAULT_CONFIG_ROOT
 from nucypher.crypto.powers import TransactingPower
 
+if TYPE_CHECKING:
+    from nucypher.blockchain.eth.deployers import ContractDeployer  # Imported on first use
+
 
 def only_me(func):
     """Decorator to enforce invocation of permissioned actor methods"""
@@ -132,23 +126,6 @@ class DeployerActor(NucypherTokenActor):
 
     __interface_class = BlockchainDeployerInterface
 
-    #
-    # Deployer classes sorted by deployment dependency order.
-    #
-
-    standard_deployer_classes = (
-        NucypherTokenDeployer,
-    )
-
-    upgradeable_deployer_classes = (
-        StakingEscrowDeployer,
-        PolicyManagerDeployer,
-        UserEscrowProxyDeployer,
-        AdjudicatorDeployer,
-    )
-
-    deployer_classes = (*standard_deployer_classes, *upgradeable_deployer_classes)
-
     class UnknownContract(ValueError):
         pass
 
@@ -161,6 +138,32 @@ class DeployerActor(NucypherTokenActor):
 
         self.log = Logger("Deployment-Actor")
 
+        # Deployers are only imported by those who deploy.
+        from nucypher.blockchain.eth.deployers import (
+            NucypherTokenDeployer,
+            StakingEscrowDeployer,
+            PolicyManagerDeployer,
+            UserEscrowProxyDeployer,
+            AdjudicatorDeployer
+        )
+
+        #
+        # Deployer classes sorted by deployment dependency order.
+        #
+
+        self.standard_deployer_classes = (
+            NucypherTokenDeployer,
+        )
+
+        self.upgradeable_deployer_classes = (
+            StakingEscrowDeployer,
+            PolicyManagerDeployer,
+            UserEscrowProxyDeployer,
+            AdjudicatorDeployer,
+        )
+
+        self.deployer_classes = (*self.standard_deployer_classes, *self.upgradeable_deployer_classes)
+
         self.blockchain = blockchain
         self.__deployer_address = NO_DEPLOYER_ADDRESS
         self.deployer_address = deployer_address
@@ -227,7 +230,7 @@ class DeployerActor(NucypherTokenActor):
                         gas_limit: int = None,
                         plaintext_secret: str = None,
                         progress=None
-                        ) -> Tuple[dict, ContractDeployer]:
+                        ) -> Tuple[dict, 'ContractDeployer']:
 
         Deployer = self.__get_deployer(contract_name=contract_name)
         deployer = Deployer(blockchain=self.blockchain, deployer_address=self.deployer_address)
@@ -257,6 +260,7 @@ class DeployerActor(NucypherTokenActor):
         return txhash
 
     def deploy_user_escrow(self, allocation_registry: AllocationRegistry):
+        from nucypher.blockchain.eth.deployers import UserEscrowDeployer
         user_escrow_deployer = UserEscrowDeployer(blockchain=self.blockchain,
                                                   deployer_address=self.deployer_address,
                                                   allocation_registry=allocation_registry)
@@ -341,6 +345,8 @@ class DeployerActor(NucypherTokenActor):
                 {'address': '0xabced120', 'amount': 133432, 'duration': 31536000*2},
                 {'address': '0xf7aefec2', 'amount': 999, 'duration': 31536000*3}]
         """
+        from eth_tester.exceptions import TransactionFailed
+
         if allocation_registry and allocation_outfile:
             raise self.ActorError("Pass either allocation registry or allocation_outfile, not both.")
         if allocation_registry is None:
@@ -421,11 +427,12 @@ class Staker(NucypherTokenActor):
     def __init__(self,
                  is_me: bool,
                  economics: TokenEconomics = None,
+                 stake_tracker: StakeTracker = None,
                  *args, **kwargs) -> None:
 
         super().__init__(*args, **kwargs)
         self.log = Logger("staker")
-        self.stake_tracker = StakeTracker(checksum_addresses=[self.checksum_address])
+        self.stake_tracker = stake_tracker or StakeTracker(checksum_addresses=[self.checksum_address])
         self.staking_agent = StakingEscrowAgent(blockchain=self.blockchain)
         self.economics = economics or TokenEconomics()
         self.is_me = is_me
@@ -860,10 +867,17 @@ class StakeHolder(BaseConfiguration):
         else:
             accounts = self.__accounts
 
+        if not accounts:
+            return
+
+        # Read the stakes of all accounts in one batch, shared by every staker
+        stake_tracker = StakeTracker(checksum_addresses=accounts)
         for account in accounts:
-            stakes = list(self.staking_agent.get_all_stakes(staker_address=account))
-            if stakes:
-                staker = Staker(is_me=True, checksum_address=account, blockchain=self.blockchain)
+            if stake_tracker.stakes(checksum_address=account):
+                staker = Staker(is_me=True,
+                                checksum_address=account,
+                                blockchain=self.blockchain,
+                                stake_tracker=stake_tracker)
                 self.__stakers[account] = staker
 
     @property
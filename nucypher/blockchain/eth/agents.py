@@ -17,7 +17,9 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 
 import random
-from typing import Generator, List, Tuple, Union
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generator, Iterable, List, Tuple, Union
 
 from constant_sorrow.constants import NO_CONTRACT_AVAILABLE
 from eth_utils.address import to_checksum_address
@@ -27,7 +29,7 @@ from web3.contract import Contract
 from nucypher.blockchain.eth.constants import DISPATCHER_CONTRACT_NAME, STAKING_ESCROW_CONTRACT_NAME, \
     POLICY_MANAGER_CONTRACT_NAME, USER_ESCROW_CONTRACT_NAME, USER_ESCROW_PROXY_CONTRACT_NAME, \
     LIBRARY_LINKER_CONTRACT_NAME, ADJUDICATOR_CONTRACT_NAME, NUCYPHER_TOKEN_CONTRACT_NAME
-from nucypher.blockchain.eth.decorators import validate_checksum_address
+from nucypher.blockchain.eth.decorators import validate_checksum_address, cached_view
 from nucypher.blockchain.eth.interfaces import BlockchainInterface
 from nucypher.blockchain.eth.registry import AllocationRegistry
 from nucypher.crypto.api import sha256_digest
@@ -60,6 +62,77 @@ class Agency(type):
             raise mcs.NoAgency
 
 
+class ContractReadCache:
+    """
+    Read-through cache of contract view call results keyed by (function, arguments, block number).
+
+    The latest block number is itself re-read from the provider only once the staleness window
+    has elapsed, or sooner if a transaction sent through this interface was mined in a newer block;
+    A staleness of zero reads the block number on every call, caching only within a block.
+    """
+
+    MAX_ENTRIES = 10_000
+
+    def __init__(self, blockchain: BlockchainInterface, staleness: float, max_entries: int = None):
+        self.blockchain = blockchain
+        self.staleness = staleness
+        self.max_entries = max_entries or self.MAX_ENTRIES
+
+        self.__entries = OrderedDict()
+        self.__block_number = None
+        self.__block_read_at = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def block_number(self) -> int:
+        now = time.monotonic()
+        block_number = self.__block_number
+        if block_number is None or (now - self.__block_read_at) >= self.staleness:
+            block_number = self.blockchain.client.block_number
+            self.__block_read_at = now
+        block_number = max(block_number, self.blockchain.latest_receipt_block)
+
+        if block_number != self.__block_number:
+            self.__entries.clear()  # Evict all results read at prior blocks
+            self.__block_number = block_number
+        return block_number
+
+    def read(self, function_name: str, arguments: tuple, reader: Callable):
+        key = (function_name, arguments, self.block_number)
+        try:
+            result = self.__entries[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            return result
+
+        result = reader()
+        self.__entries[key] = result
+        if len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__block_number = None
+
+    @property
+    def stats(self) -> dict:
+        reads = self.hits + self.misses
+        payload = dict(hits=self.hits,
+                       misses=self.misses,
+                       hit_rate=(self.hits / reads) if reads else 0.0,
+                       entries=len(self.__entries),
+                       block_number=self.__block_number)
+        return payload
+
+
 class EthereumContractAgent:
     """
     Base class for ethereum contract wrapper types that interact with blockchain contract instances
@@ -77,7 +150,8 @@ class EthereumContractAgent:
     def __init__(self,
                  blockchain: BlockchainInterface = None,
                  contract: Contract = None,
-                 transaction_gas: int = None
+                 transaction_gas: int = None,
+                 read_cache_staleness: float = None
                  ) -> None:
 
         self.log = Logger(self.__class__.__name__)
@@ -97,6 +171,10 @@ class EthereumContractAgent:
             transaction_gas = EthereumContractAgent.DEFAULT_TRANSACTION_GAS
         self.transaction_gas = transaction_gas
 
+        if read_cache_staleness is None:
+            read_cache_staleness = self.blockchain.BLOCK_STALENESS
+        self.read_cache = ContractReadCache(blockchain=self.blockchain, staleness=read_cache_staleness)
+
         super().__init__()
         self.log.info("Initialized new {} for {} with {} and {}".format(self.__class__.__name__,
                                                                         self.contract_address,
@@ -175,10 +253,12 @@ class StakingEscrowAgent(EthereumContractAgent, metaclass=Agency):
     # Staker Network Status
     #
 
+    @cached_view
     def get_staker_population(self) -> int:
         """Returns the number of stakers on the blockchain"""
         return self.contract.functions.getStakersLength().call()
 
+    @cached_view
     def get_current_period(self) -> int:
         """Returns the current period"""
         return self.contract.functions.getCurrentPeriod().call()
@@ -210,6 +290,7 @@ class StakingEscrowAgent(EthereumContractAgent, metaclass=Agency):
             at_period = self.contract.functions.getCurrentPeriod().call()
         return self.contract.functions.lockedPerPeriod(at_period).call()
 
+    @cached_view
     def get_locked_tokens(self, staker_address: str, periods: int = 0) -> int:
         """
         Returns the amount of tokens the specified staker has locked
@@ -233,11 +314,32 @@ class StakingEscrowAgent(EthereumContractAgent, metaclass=Agency):
         return first_period, last_period, periods, locked
 
     def get_all_stakes(self, staker_address: str):
-        stakes_length = self.contract.functions.getSubStakesLength(staker_address).call()
-        if stakes_length == 0:
-            return iter(())  # Empty iterable, There are no stakes
-        for stake_index in range(stakes_length):
-            yield self.get_substake_info(staker_address=staker_address, stake_index=stake_index)
+        all_stakes = self.get_stakes_of_stakers(staker_addresses=[staker_address])
+        return iter(all_stakes[staker_address])
+
+    def get_stakes_of_stakers(self, staker_addresses: Iterable[str]) -> Dict[str, List[Tuple[int, int, int]]]:
+        """
+        Read the sub-stakes of many stakers at once; Sub-stake counts are read in one batch,
+        followed by the info of every sub-stake in a second batch.
+        """
+        staker_addresses = list(dict.fromkeys(staker_addresses))  # Deduplicate, preserving order
+        functions = self.contract.functions
+
+        lengths = self.blockchain.batch_call(functions.getSubStakesLength(address) for address in staker_addresses)
+
+        owners, calls = list(), list()
+        for staker_address, stakes_length in zip(staker_addresses, lengths):
+            for stake_index in range(stakes_length):
+                owners.append(staker_address)
+                calls.append(functions.getSubStakeInfo(staker_address, stake_index))
+                calls.append(functions.getLastPeriodOfSubStake(staker_address, stake_index))
+        results = self.blockchain.batch_call(calls)
+
+        all_stakes = {staker_address: list() for staker_address in staker_addresses}
+        for staker_address, substake_info, last_period in zip(owners, results[::2], results[1::2]):
+            first_period, *others, locked_value = substake_info
+            all_stakes[staker_address].append((first_period, last_period, locked_value))
+        return all_stakes
 
     def deposit_tokens(self, amount: int, lock_periods: int, sender_address: str):
         """Send tokens to the escrow from the staker's address"""
@@ -255,10 +357,12 @@ class StakingEscrowAgent(EthereumContractAgent, metaclass=Agency):
         period = self.contract.functions.getLastActivePeriod(address).call()
         return int(period)
 
+    @cached_view
     def get_worker_from_staker(self, staker_address: str) -> str:
         worker = self.contract.functions.getWorkerFromStaker(staker_address).call()
         return to_checksum_address(worker)
 
+    @cached_view
     def get_staker_from_worker(self, worker_address: str) -> str:
         staker = self.contract.functions.getStakerFromWorker(worker_address).call()
         return to_checksum_address(staker)
@@ -314,6 +418,7 @@ class StakingEscrowAgent(EthereumContractAgent, metaclass=Agency):
                                                    sender_address=staker_address)
         return receipt
 
+    @cached_view
     def staking_parameters(self) -> Tuple:
         parameter_signatures = (
             # Period
@@ -349,9 +454,10 @@ class StakingEscrowAgent(EthereumContractAgent, metaclass=Agency):
 
         """
 
-        for index in range(self.get_staker_population()):
-            staker_address = self.contract.functions.stakers(index).call()
-            yield staker_address
+        population = self.get_staker_population()
+        staker_addresses = self.blockchain.batch_call(self.contract.functions.stakers(index)
+                                                      for index in range(population))
+        yield from staker_addresses
 
     def sample(self, quantity: int, duration: int, additional_ursulas: float = 1.7, attempts: int = 5) -> List[str]:
         """
@@ -429,9 +535,9 @@ class PolicyManagerAgent(EthereumContractAgent, metaclass=Agency):
 
     def fetch_policy_arrangements(self, policy_id):
         record_count = self.contract.functions.getArrangementsLength(policy_id).call()
-        for index in range(record_count):
-            arrangement = self.contract.functions.getArrangementInfo(policy_id, index).call()
-            yield arrangement
+        arrangements = self.blockchain.batch_call(self.contract.functions.getArrangementInfo(policy_id, index)
+                                                  for index in range(record_count))
+        yield from arrangements
 
     def revoke_arrangement(self, policy_id: str, node_address: str, author_address: str):
         contract_function = self.contract.functions.revokeArrangement(policy_id, node_address)
@@ -462,7 +568,7 @@ class UserEscrowAgent(EthereumContractAgent):
         _forward_address = False
 
         def _generate_beneficiary_agency(self, principal_address: str):
-            contract = self.blockchain.client.get_contract(address=principal_address, abi=self.contract.abi)
+            contract = self.blockchain.get_contract_at(address=principal_address, abi=self.contract.abi)
             return contract
 
     def __init__(self,
@@ -495,7 +601,7 @@ class UserEscrowAgent(EthereumContractAgent):
         else:
             contract_data = self.__allocation_registry.search(beneficiary_address=self.beneficiary)
         address, abi = contract_data
-        principal_contract = self.blockchain.client.get_contract(abi=abi, address=address, ContractFactoryClass=Contract)
+        principal_contract = self.blockchain.get_contract_at(address=address, abi=abi)
         self.__principal_contract = principal_contract
 
     def __set_owner(self) -> None:
@@ -105,3 +105,26 @@ def validate_secret(func: Callable) -> Callable:
             raise self.ContractDeploymentError(message)
 
     return wrapped
+
+
+def cached_view(func: Callable) -> Callable:
+    """
+    Agent method decorator to serve contract view calls through the agent's block-scoped
+    read cache; Calls are keyed by method name and bound arguments (defaults applied).
+    """
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapped(self, *args, **kwargs):
+        read_cache = getattr(self, 'read_cache', None)
+        if read_cache is None:
+            return func(self, *args, **kwargs)
+        bound_arguments = signature.bind(self, *args, **kwargs)
+        bound_arguments.apply_defaults()
+        call_arguments = tuple(bound_arguments.arguments.items())[1:]  # skip self
+        return read_cache.read(function_name=func.__name__,
+                               arguments=call_arguments,
+                               reader=lambda: func(self, *args, **kwargs))
+
+    return wrapped
@@ -15,8 +15,11 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import json
 import pprint
 import time
+from typing import Iterable
+from typing import TYPE_CHECKING
 from typing import List
 from typing import Tuple
 from typing import Union
@@ -31,10 +34,13 @@ from constant_sorrow.constants import (
     NO_PROVIDER_PROCESS,
     READ_ONLY_INTERFACE
 )
-from eth_tester import EthereumTester
+from eth_abi import decode_abi
 from eth_utils import to_checksum_address
+from hexbytes import HexBytes
 from twisted.logger import Logger
 from web3 import Web3, WebsocketProvider, HTTPProvider, IPCProvider
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.contract import Contract
 from web3.contract import ContractConstructor
 from web3.contract import ContractFunction
@@ -42,23 +48,31 @@ from web3.exceptions import TimeExhausted
 from web3.exceptions import ValidationError
 from web3.middleware import geth_poa_middleware
 
-from nucypher.blockchain.eth.clients import NuCypherGethProcess
-from nucypher.blockchain.eth.clients import Web3Client
-from nucypher.blockchain.eth.providers import (
-    _get_tester_pyevm,
-    _get_test_geth_parity_provider,
-    _get_auto_provider,
-    _get_infura_provider,
-    _get_IPC_provider,
-    _get_websocket_provider,
-    _get_HTTP_provider
-)
 from nucypher.blockchain.eth.registry import EthereumContractRegistry
-from nucypher.blockchain.eth.sol.compile import SolidityCompiler
+from nucypher.blockchain.eth.transactions import NonceAllocator, TransactionPipeline
 from nucypher.crypto.powers import TransactingPower
 from nucypher.characters.control.emitters import StdoutEmitter
 
-Web3Providers = Union[IPCProvider, WebsocketProvider, HTTPProvider, EthereumTester]
+# Clients, providers (geth, eth-tester) and the solidity compiler are imported on first use.
+if TYPE_CHECKING:
+    from eth_tester import EthereumTester
+    from nucypher.blockchain.eth.clients import NuCypherGethProcess
+    from nucypher.blockchain.eth.sol.compile import SolidityCompiler
+
+Web3Providers = Union[IPCProvider, WebsocketProvider, HTTPProvider, 'EthereumTester']
+
+# https://github.com/makerdao/multicall
+MULTICALL_ABI = [{'constant': False,
+                  'inputs': [{'components': [{'name': 'target', 'type': 'address'},
+                                             {'name': 'callData', 'type': 'bytes'}],
+                              'name': 'calls',
+                              'type': 'tuple[]'}],
+                  'name': 'aggregate',
+                  'outputs': [{'name': 'blockNumber', 'type': 'uint256'},
+                              {'name': 'returnData', 'type': 'bytes[]'}],
+                  'payable': False,
+                  'stateMutability': 'nonpayable',
+                  'type': 'function'}]
 
 
 class BlockchainInterface:
@@ -69,6 +83,9 @@ class BlockchainInterface:
 
     TIMEOUT = 180  # seconds
     NULL_ADDRESS = '0x' + '0' * 40
+    CALL_BATCH_SIZE = 100  # eth_calls per round trip
+    BLOCK_STALENESS = 15   # seconds a read block number may be reused by agent read caches
+    PROXY_TARGET_STALENESS = 60  # seconds a proxy's target address may be reused before it is read again
 
     _instance = NO_BLOCKCHAIN_CONNECTION.bool_value(False)
     process = NO_PROVIDER_PROCESS.bool_value(False)
@@ -88,13 +105,17 @@ class BlockchainInterface:
     class UnknownContract(InterfaceError):
         pass
 
+    class BatchCallFailed(InterfaceError):
+        pass
+
     def __init__(self,
                  poa: bool = True,
-                 provider_process: NuCypherGethProcess = NO_PROVIDER_PROCESS,
+                 provider_process: 'NuCypherGethProcess' = NO_PROVIDER_PROCESS,
                  provider_uri: str = NO_BLOCKCHAIN_CONNECTION,
                  transacting_power: TransactingPower = READ_ONLY_INTERFACE,
                  provider: Web3Providers = NO_BLOCKCHAIN_CONNECTION,
-                 registry: EthereumContractRegistry = None):
+                 registry: EthereumContractRegistry = None,
+                 multicall_address: str = None):
 
         """
         A blockchain "network interface"; The circumflex wraps entirely around the bounds of
@@ -158,6 +179,23 @@ class BlockchainInterface:
         * IPC Provider - Web3 File based IPC provider transported over standard I/O
         * Custom Provider - A pre-initialized web3.py provider instance to attach to this interface
 
+
+        Batched Reads
+        --------------
+        Read-only contract calls can be grouped with `batch_call`; Over HTTP, calls are sent as
+        JSON-RPC 2.0 batch requests, or aggregated on-chain if the address of a deployed
+        Multicall contract is supplied as `multicall_address`.
+
+        Contract objects are cached; The target of an upgradeable contract's proxy is read
+        again after PROXY_TARGET_STALENESS seconds, or after calling `refresh_proxy_targets`.
+
+
+        Pipelined Transactions
+        ----------------------
+        Nonces are handed out locally by a `NonceAllocator`, so several transactions from the same
+        sender can be in flight at once; `send_transactions` and `transaction_pipeline` broadcast
+        transactions back-to-back and wait for their receipts together.
+
         """
 
         self.log = Logger('Blockchain')
@@ -168,6 +206,14 @@ class BlockchainInterface:
         self.client = NO_BLOCKCHAIN_CONNECTION
         self.transacting_power = transacting_power
         self.registry = registry
+        self.multicall_address = multicall_address
+        self.latest_receipt_block = 0
+        self.nonces = NonceAllocator(get_pending_transaction_count=self._get_pending_transaction_count)
+
+        # Contract objects and proxy targets, by (name, proxy name, address), ABI, and proxy address
+        self.__contracts = dict()
+        self.__contract_classes = dict()
+        self.__proxy_targets = dict()
         BlockchainInterface._instance = self
 
     def __repr__(self):
@@ -181,13 +227,17 @@ class BlockchainInterface:
         payload.update({k: v for k, v in overrides.items() if v is not None})
 
         registry = EthereumContractRegistry(registry_filepath=payload['registry_filepath'])
-        blockchain = cls(provider_uri=payload['provider_uri'], registry=registry)
+        blockchain = cls(provider_uri=payload['provider_uri'],
+                         registry=registry,
+                         multicall_address=payload.get('multicall_address'))
         return blockchain
 
     def to_dict(self) -> dict:
         payload = dict(provider_uri=self.provider_uri,
                        poa=self.poa,
                        registry_filepath=self.registry.filepath)
+        if self.multicall_address:
+            payload['multicall_address'] = self.multicall_address
         return payload
 
     def _configure_registry(self, fetch_registry: bool = True) -> None:
@@ -243,6 +293,7 @@ class BlockchainInterface:
             raise self.NoProvider("There are no configured blockchain providers")
 
         # Connect if not connected
+        from nucypher.blockchain.eth.clients import Web3Client
         try:
             self.w3 = self.Web3(provider=self._provider)
             self.client = Web3Client.from_w3(w3=self.w3)
@@ -313,6 +364,15 @@ class BlockchainInterface:
             raise self.NoProvider("No URI or provider instances supplied.")
 
         if provider_uri and not provider:
+            from nucypher.blockchain.eth.providers import (
+                _get_tester_pyevm,
+                _get_test_geth_parity_provider,
+                _get_auto_provider,
+                _get_infura_provider,
+                _get_IPC_provider,
+                _get_websocket_provider,
+                _get_HTTP_provider
+            )
             uri_breakdown = urlparse(provider_uri)
 
             if uri_breakdown.scheme == 'tester':
@@ -348,6 +408,48 @@ class BlockchainInterface:
                          sender_address: str,
                          payload: dict = None,
                          ) -> dict:
+        nonce, = self.nonces.allocate(sender_address)
+        try:
+            txhash, transaction_name = self._broadcast_transaction(contract_function=contract_function,
+                                                                   sender_address=sender_address,
+                                                                   payload=payload,
+                                                                   nonce=nonce)
+        except Exception:
+            self.nonces.reset(sender_address)
+            raise
+        return self._confirm_transaction(txhash=txhash,
+                                         transaction_name=transaction_name,
+                                         sender_address=sender_address)
+
+    def send_transactions(self, transactions: Iterable[Tuple[ContractFunction, str, dict]]) -> List[dict]:
+        """
+        Send (contract_function, sender_address, payload) transactions back-to-back, without waiting
+        for each to be mined before sending the next, and return their receipts in the same order.
+        """
+        with self.transaction_pipeline() as pipeline:
+            for contract_function, sender_address, payload in transactions:
+                pipeline.submit(contract_function=contract_function, sender_address=sender_address, payload=payload)
+        return pipeline.receipts
+
+    def transaction_pipeline(self, **kwargs) -> TransactionPipeline:
+        if self.transacting_power is READ_ONLY_INTERFACE:
+            raise self.InterfaceError(str(READ_ONLY_INTERFACE))
+        return TransactionPipeline(blockchain=self, **kwargs)
+
+    def _get_pending_transaction_count(self, sender_address: str) -> int:
+        return self.client.w3.eth.getTransactionCount(sender_address, 'pending')
+
+    def _broadcast_transaction(self, **kwargs) -> Tuple[HexBytes, str]:
+        signed_raw_transaction, transaction_name = self._sign_transaction(**kwargs)
+        txhash = self.client.send_raw_transaction(signed_raw_transaction)
+        return txhash, transaction_name
+
+    def _sign_transaction(self,
+                          contract_function: ContractFunction,
+                          sender_address: str,
+                          nonce: int,
+                          payload: dict = None,
+                          ) -> Tuple[bytes, str]:
 
         if self.transacting_power is READ_ONLY_INTERFACE:
             raise self.InterfaceError(str(READ_ONLY_INTERFACE))
@@ -356,10 +458,7 @@ class BlockchainInterface:
         # Build
         #
 
-        if not payload:
-            payload = {}
-
-        nonce = self.client.w3.eth.getTransactionCount(sender_address)
+        payload = dict(payload or {})
         payload.update({'chainId': int(self.client.net_version),
                         'nonce': nonce,
                         'from': sender_address,
@@ -394,22 +493,21 @@ class BlockchainInterface:
             if deployment:
                 self.log.info(f"Deploying contract: {len(unsigned_transaction['data'])} bytes")
 
-
-        #
-        # Broadcast
-        #
-
         signed_raw_transaction = self.transacting_power.sign_transaction(unsigned_transaction)
-        txhash = self.client.send_raw_transaction(signed_raw_transaction)
+        return signed_raw_transaction, transaction_name
 
+    def _confirm_transaction(self, txhash: HexBytes, transaction_name: str, sender_address: str) -> dict:
 
         try:
             receipt = self.client.wait_for_receipt(txhash, timeout=self.TIMEOUT)
         except TimeExhausted:
             # TODO: Handle transaction timeout
+            # The transaction may have been dropped or replaced; Don't leave later nonces waiting behind it.
+            self.nonces.reset(sender_address)
             raise
         else:
             self.log.debug(f"[RECEIPT-{transaction_name}] | txhash: {receipt['transactionHash'].hex()}")
+            self.latest_receipt_block = max(self.latest_receipt_block, receipt['blockNumber'])
 
         #
         # Confirm
@@ -418,6 +516,7 @@ class BlockchainInterface:
         # Primary check
         deployment_status = receipt.get('status', UNKNOWN_TX_STATUS)
         if deployment_status is 0:
+            self.nonces.reset(sender_address)
             failure = f"Transaction transmitted, but receipt returned status code 0. " \
                       f"Full receipt: \n {pprint.pformat(receipt, indent=2)}"
             raise self.InterfaceError(failure)
@@ -428,11 +527,82 @@ class BlockchainInterface:
             # Secondary check TODO: Is this a sensible check?
             tx = self.client.get_transaction(txhash)
             if tx["gas"] == receipt["gasUsed"]:
+                self.nonces.reset(sender_address)
                 raise self.InterfaceError(f"Transaction consumed 100% of transaction gas."
                                           f"Full receipt: \n {pprint.pformat(receipt, indent=2)}")
 
         return receipt
 
+    def batch_call(self,
+                   contract_functions: List[ContractFunction],
+                   block_identifier: Union[int, str] = 'latest'
+                   ) -> list:
+        """
+        Execute read-only contract calls in as few provider round trips as possible.
+        Results are decoded exactly as `ContractFunction.call` would, and returned in the
+        same order as the given contract functions.
+
+        Calls are aggregated by the Multicall contract when one is configured, or sent as
+        JSON-RPC batch requests to HTTP providers; Other providers fall back to sequential calls.
+        """
+        contract_functions = list(contract_functions)
+        if not contract_functions:
+            return list()
+
+        if self.multicall_address:
+            read_batch = self.__multicall
+        elif isinstance(self._provider, HTTPProvider):
+            read_batch = self.__json_rpc_batch_call
+        else:
+            return [function.call(block_identifier=block_identifier) for function in contract_functions]
+
+        results = list()
+        for offset in range(0, len(contract_functions), self.CALL_BATCH_SIZE):
+            batch = contract_functions[offset:offset+self.CALL_BATCH_SIZE]
+            return_data = read_batch(contract_functions=batch, block_identifier=block_identifier)
+            results.extend(map(self._decode_call_result, batch, return_data))
+        self.log.debug(f"Read {len(results)} contract calls in batches of {self.CALL_BATCH_SIZE}")
+        return results
+
+    @staticmethod
+    def _decode_call_result(contract_function: ContractFunction, return_data: bytes):
+        output_types = get_abi_output_types(contract_function.abi)
+        output_data = decode_abi(output_types, return_data)
+        normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+        if len(normalized_data) == 1:
+            return normalized_data[0]
+        return normalized_data
+
+    def __json_rpc_batch_call(self, contract_functions: List[ContractFunction], block_identifier) -> List[bytes]:
+        if isinstance(block_identifier, int):
+            block_identifier = hex(block_identifier)
+
+        batch = list()
+        for request_id, function in enumerate(contract_functions):
+            call = {'to': function.address, 'data': function._encode_transaction_data()}
+            batch.append({'jsonrpc': '2.0', 'id': request_id, 'method': 'eth_call', 'params': [call, block_identifier]})
+
+        response = requests.post(self._provider.endpoint_uri, json=batch, **self._provider.get_request_kwargs())
+        response.raise_for_status()
+
+        # Batch responses may arrive in any order; Correlate by request ID.
+        responses = {item['id']: item for item in response.json()}
+        return_data = list()
+        for request_id, function in enumerate(contract_functions):
+            try:
+                result = responses[request_id]['result']
+            except KeyError:
+                error = responses.get(request_id, {}).get('error', 'No response')
+                raise self.BatchCallFailed(f"Batched call to {function.fn_name} failed: {error}")
+            return_data.append(HexBytes(result))
+        return return_data
+
+    def __multicall(self, contract_functions: List[ContractFunction], block_identifier) -> List[bytes]:
+        multicall = self.client.w3.eth.contract(abi=MULTICALL_ABI, address=self.multicall_address)
+        calls = [(function.address, function._encode_transaction_data()) for function in contract_functions]
+        _block_number, return_data = multicall.functions.aggregate(calls).call(block_identifier=block_identifier)
+        return return_data
+
     def get_contract_by_name(self,
                              name: str,
                              proxy_name: str = None,
@@ -455,12 +625,9 @@ class BlockchainInterface:
 
             results = list()
             for proxy_name, proxy_addr, proxy_abi in proxy_records:
-                proxy_contract = self.client.w3.eth.contract(abi=proxy_abi,
-                                                             address=proxy_addr,
-                                                             ContractFactoryClass=self._contract_factory)
 
                 # Read this dispatcher's target address from the blockchain
-                proxy_live_target_address = proxy_contract.functions.target().call()
+                proxy_live_target_address = self._read_proxy_target(proxy_address=proxy_addr, proxy_abi=proxy_abi)
                 for target_name, target_addr, target_abi in target_contract_records:
 
                     if target_addr == proxy_live_target_address:
@@ -487,17 +654,54 @@ class BlockchainInterface:
                 raise self.InterfaceError(m.format(name))
             _target_contract_name, selected_address, selected_abi = target_contract_records[0]
 
-        # Create the contract from selected sources
-        unified_contract = self.client.w3.eth.contract(abi=selected_abi,
-                                                       address=selected_address,
-                                                       ContractFactoryClass=self._contract_factory)
+        # Create the contract from selected sources, or reuse it
+        cache_key = (name, proxy_name, selected_address)
+        try:
+            cached_abi, unified_contract = self.__contracts[cache_key]
+            if cached_abi is not selected_abi and cached_abi != selected_abi:
+                raise KeyError(cache_key)  # Re-enrolled
+        except KeyError:
+            unified_contract = self.get_contract_at(address=selected_address, abi=selected_abi)
+            self.__contracts[cache_key] = (selected_abi, unified_contract)
 
         return unified_contract
 
+    def get_contract_at(self, address: str, abi: list) -> Contract:
+        """
+        Instantiate a contract at address, reusing the contract class
+        already built for the same ABI (ABI parsing dominates contract instantiation).
+        """
+        fingerprint = json.dumps(abi, sort_keys=True)
+        try:
+            contract_class = self.__contract_classes[fingerprint]
+        except KeyError:
+            contract_class = self.client.w3.eth.contract(abi=abi, ContractFactoryClass=self._contract_factory)
+            self.__contract_classes[fingerprint] = contract_class
+        return contract_class(address=address)
+
+    def _read_proxy_target(self, proxy_address: str, proxy_abi: list) -> str:
+        now = time.time()
+        try:
+            target_address, read_at = self.__proxy_targets[proxy_address]
+            if now - read_at < self.PROXY_TARGET_STALENESS:
+                return target_address
+        except KeyError:
+            pass
+
+        proxy_contract = self.get_contract_at(address=proxy_address, abi=proxy_abi)
+        target_address = proxy_contract.functions.target().call()
+        self.__proxy_targets[proxy_address] = (target_address, now)
+        return target_address
+
+    def refresh_proxy_targets(self) -> None:
+        """Forget the proxy targets read so far; Each is read from the blockchain again on its next use."""
+        self.__proxy_targets.clear()
+
 
 class BlockchainDeployerInterface(BlockchainInterface):
 
     TIMEOUT = 600  # seconds
+    PROXY_TARGET_STALENESS = 0  # Deployments upgrade contracts; Always read proxy targets
     _contract_factory = Contract
 
     class NoDeployerAddress(RuntimeError):
@@ -508,11 +712,14 @@ class BlockchainDeployerInterface(BlockchainInterface):
 
     def __init__(self,
                  deployer_address: str = None,
-                 compiler: SolidityCompiler = None,
+                 compiler: 'SolidityCompiler' = None,
                  *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.compiler = compiler or SolidityCompiler()
+        if compiler is None:
+            from nucypher.blockchain.eth.sol.compile import SolidityCompiler
+            compiler = SolidityCompiler()
+        self.compiler = compiler
         self.__deployer_address = deployer_address or NO_DEPLOYER_CONFIGURED
 
     def connect(self, fetch_registry: bool = False, *args, **kwargs):
@@ -528,7 +735,7 @@ class BlockchainDeployerInterface(BlockchainInterface):
     def deployer_address(self, checksum_address: str) -> None:
         self.__deployer_address = checksum_address
 
-    def _setup_solidity(self, compiler: SolidityCompiler = None):
+    def _setup_solidity(self, compiler: 'SolidityCompiler' = None):
 
         # if a SolidityCompiler class instance was passed, compile from solidity source code
         self.__sol_compiler = compiler
@@ -19,6 +19,7 @@ import json
 import os
 import pprint
 import tempfile
+from collections import defaultdict
 from json import JSONDecodeError
 from os.path import dirname, abspath
 
@@ -27,6 +28,7 @@ from twisted.logger import Logger
 
 import shutil
 from constant_sorrow import constants
+from copy import copy
 from typing import Union
 
 from nucypher.config.constants import DEFAULT_CONFIG_ROOT
@@ -76,6 +78,11 @@ class EthereumContractRegistry:
         self.log = Logger("registry")
         self.__filepath = registry_filepath or self._default_registry_filepath
 
+        # Parsed registry data, and its indexes, kept until the registry changes
+        self.__signature = None
+        self.__registry_data = None
+        self.__indexes = None
+
     @classmethod
     def _get_registry_class(cls, local=False):
         """
@@ -126,18 +133,68 @@ class EthereumContractRegistry:
 
     @property
     def enrolled_names(self):
-        entries = iter(record[0] for record in self.read())
+        entries = iter(record[0] for record in self._cached_read())
         return entries
 
     @property
     def enrolled_addresses(self):
-        entries = iter(record[1] for record in self.read())
+        entries = iter(record[1] for record in self._cached_read())
         return entries
 
     def _swap_registry(self, filepath: str) -> bool:
         self.__filepath = filepath
+        self._invalidate()
         return True
 
+    #
+    # Cache
+    #
+
+    def _signature(self):
+        """
+        Identifies the current version of the registry; The parsed registry is reused
+        for as long as this is unchanged.
+        """
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            raise self.NoRegistry("No registry at filepath: {}".format(self.filepath))
+        return self.filepath, stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _invalidate(self) -> None:
+        self.__signature = None
+        self.__registry_data = None
+        self.__indexes = None
+
+    def _cached_read(self) -> Union[list, dict]:
+        """The parsed registry, shared between callers; Do not modify it."""
+        signature = self._signature()
+        if self.__signature is None or signature != self.__signature:
+            self.__registry_data = self._read()
+            self.__indexes = None
+            self.__signature = signature
+        return self.__registry_data
+
+    def _indexes(self) -> tuple:
+        """Lookup tables for the cached registry, built on first use."""
+        registry_data = self._cached_read()
+        if self.__indexes is None:
+            self.__indexes = self._build_indexes(registry_data)
+        return self.__indexes
+
+    def _build_indexes(self, registry_data: list) -> tuple:
+        records_by_name, records_by_address = defaultdict(list), defaultdict(list)
+        try:
+            for name, addr, abi in registry_data:
+                record = (name, addr, abi)
+                records_by_name[name].append(record)
+                records_by_address[addr].append(record)
+        except ValueError:
+            message = "Missing or corrupted registry data".format(self.__filepath)
+            self.log.critical(message)
+            raise self.IllegalRegistry(message)
+        return records_by_name, records_by_address
+
     def _destroy(self) -> None:
         os.remove(self.filepath)
 
@@ -151,6 +208,7 @@ class EthereumContractRegistry:
             registry_file.seek(0)
             registry_file.write(json.dumps(registry_data))
             registry_file.truncate()
+        self._invalidate()
 
     def read(self) -> Union[list, dict]:
         """
@@ -159,7 +217,13 @@ class EthereumContractRegistry:
         If you are modifying or updating the registry file, you _must_ call
         this function first to get the current state to append to the dict or
         modify it because _write_registry_file overwrites the file.
+
+        The file is only re-read and re-parsed when its modification time or size changes.
         """
+        registry_data = self._cached_read()
+        return copy(registry_data)  # Records are shared with the cache
+
+    def _read(self) -> Union[list, dict]:
         try:
             with open(self.filepath, 'r') as registry_file:
                 self.log.debug("Reading from registrar: filepath {}".format(self.filepath))
@@ -208,17 +272,12 @@ class EthereumContractRegistry:
         if not (bool(contract_name) ^ bool(contract_address)):
             raise ValueError("Pass contract_name or contract_address, not both.")
 
-        contracts = list()
-        registry_data = self.read()
-
-        try:
-            for name, addr, abi in registry_data:
-                if contract_name == name or contract_address == addr:
-                    contracts.append((name, addr, abi))
-        except ValueError:
-            message = "Missing or corrupted registry data".format(self.__filepath)
-            self.log.critical(message)
-            raise self.IllegalRegistry(message)
+        records_by_name, records_by_address = self._indexes()
+        if contract_name:
+            contracts = records_by_name.get(contract_name, list())
+        else:
+            contracts = records_by_address.get(contract_address, list())
+        contracts = list(contracts)
 
         if not contracts:
             raise self.UnknownContract(contract_name)
@@ -254,6 +313,7 @@ class TemporaryEthereumContractRegistry(EthereumContractRegistry):
         self.log.info("Cleared temporary registry at {}".format(self.filepath))
         with open(self.filepath, 'w') as registry_file:
             registry_file.write('')
+        self._invalidate()
 
     def cleanup(self):
         os.remove(self.temp_filepath)  # remove registrar tempfile
@@ -281,14 +341,19 @@ class InMemoryEthereumContractRegistry(EthereumContractRegistry):
 
     def clear(self):
         self.__registry_data = None
+        self._invalidate()
 
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
     def write(self, registry_data: list) -> None:
         self.__registry_data = json.dumps(registry_data)
+        self._invalidate()
+
+    def _signature(self):
+        return self.__registry_data
 
-    def read(self) -> list:
+    def _read(self) -> list:
         try:
             registry_data = json.loads(self.__registry_data)
         except TypeError:
@@ -330,23 +395,22 @@ class AllocationRegistry(EthereumContractRegistry):
             raise ValueError("Pass contract_owner or contract_address, not both.")
 
         try:
-            allocation_data = self.read()
+            allocations_by_beneficiary, allocations_by_address = self._indexes()
         except EthereumContractRegistry.NoRegistry:
             raise self.NoAllocationRegistry
 
         if beneficiary_address:
             try:
-                contract_data = allocation_data[beneficiary_address]
+                contract_data = allocations_by_beneficiary[beneficiary_address]
             except KeyError:
                 raise self.UnknownBeneficiary
 
         elif contract_address:
-            records = list()
-            for beneficiary_address, contract_data in allocation_data.items():
-                contract_address, contract_abi = contract_data['address'], contract_data['abi']
-                records.append(dict(address=contract_address, abi=contract_abi))
+            records = allocations_by_address.get(contract_address, list())
+            if not records:
+                raise self.UnknownContract(contract_address)
             if len(records) > 1:
-                raise self.RegistryError("Multiple {} deployments for beneficiary {}".format(self._contract_name, beneficiary_address))
+                raise self.RegistryError("Multiple {} deployments at address {}".format(self._contract_name, contract_address))
             else:
                 contract_data = records[0]
 
@@ -355,6 +419,13 @@ class AllocationRegistry(EthereumContractRegistry):
 
         return contract_data
 
+    def _build_indexes(self, allocation_data: dict) -> tuple:
+        allocations_by_address = defaultdict(list)
+        for beneficiary_address, contract_data in allocation_data.items():
+            contract_address, contract_abi = contract_data
+            allocations_by_address[contract_address].append(contract_data)
+        return allocation_data, allocations_by_address
+
     def enroll(self, beneficiary_address, contract_address, contract_abi) -> None:
         contract_data = [contract_address, contract_abi]
         try:
@@ -379,14 +450,19 @@ class InMemoryAllocationRegistry(AllocationRegistry):
 
     def clear(self):
         self.__registry_data = None
+        self._invalidate()
 
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
     def write(self, registry_data: list) -> None:
         self.__registry_data = json.dumps(registry_data)
+        self._invalidate()
+
+    def _signature(self):
+        return self.__registry_data
 
-    def read(self) -> list:
+    def _read(self) -> list:
         try:
             registry_data = json.loads(self.__registry_data)
         except TypeError:
@@ -18,6 +18,13 @@ from twisted.logger import Logger
 from nucypher.blockchain.eth.agents import NucypherTokenAgent, StakingEscrowAgent
 from nucypher.blockchain.eth.decorators import validate_checksum_address
 from nucypher.blockchain.eth.utils import datetime_at_period, datetime_to_period
+from nucypher.utilities.metrics import REGISTRY
+
+STAKE_READ_SECONDS = REGISTRY.histogram('nucypher_stake_tracker_read_duration_seconds',
+                                        'Time spent reading tracked stakes from the blockchain')
+PERIODS_OBSERVED = REGISTRY.counter('nucypher_stake_tracker_periods_total',
+                                    'New periods observed by the stake tracker')
+TRACKED_STAKERS = REGISTRY.gauge('nucypher_stake_tracker_addresses', 'Staker addresses being tracked')
 
 
 class NU:
@@ -557,10 +564,12 @@ class StakeTracker:
         onchain_period = self.staking_agent.get_current_period()  # < -- Read from contract
         if self.__current_period != onchain_period:
             self.__current_period = onchain_period
+            PERIODS_OBSERVED.inc()
             self.__read_stakes()
             for action, args in self.__actions:
                 action(*args)
 
+    @STAKE_READ_SECONDS.time()
     @validate_checksum_address
     def __read_stakes(self, checksum_addresses: List[str] = None) -> None:
         """Rewrite the local staking cache by reading on-chain stakes"""
@@ -568,21 +577,28 @@ class StakeTracker:
         if not checksum_addresses:
             checksum_addresses = self.tracking_addresses
 
+        valid_addresses = list()
         for checksum_address in checksum_addresses:
-
             if not is_checksum_address(checksum_address):
                 if self._abort_on_stake_tracking_error:
                     raise ValueError(f'{checksum_address} is not a valid EIP-55 checksum address')
-                self.tracking_addresses.remove(checksum_address)  # Prune
+                self.tracking_addresses.discard(checksum_address)  # Prune
+            else:
+                valid_addresses.append(checksum_address)
+
+        TRACKED_STAKERS.set(len(self.tracking_addresses))
+
+        # Read from blockchain, all tracked addresses at once
+        all_stakes = self.staking_agent.get_stakes_of_stakers(staker_addresses=valid_addresses)
+
+        for checksum_address in valid_addresses:
 
             existing_records = len(self.stakes(checksum_address=checksum_address))
 
             # Candidate replacement cache values
             onchain_stakes, terminal_period = list(), 0
 
-            # Read from blockchain
-            stakes_reader = self.staking_agent.get_all_stakes(staker_address=checksum_address)
-            for onchain_index, stake_info in enumerate(stakes_reader):
+            for onchain_index, stake_info in enumerate(all_stakes[checksum_address]):
 
                 if not stake_info:
                     onchain_stake = EMPTY_STAKING_SLOT
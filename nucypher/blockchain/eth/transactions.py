@@ -0,0 +1,158 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List
+
+from twisted.logger import Logger
+from web3 import Web3
+from web3.contract import ContractFunction
+
+
+class NonceAllocator:
+    """
+    Hands out transaction nonces for each sender without asking the chain for every one of them.
+
+    The next nonce is the greater of the one after the last nonce handed out and the sender's
+    pending transaction count, which is fetched once per allocation - so that transactions sent from
+    the same account by anyone else are still accounted for - no matter how many nonces are reserved at once.
+    """
+
+    def __init__(self, get_pending_transaction_count: Callable[[str], int]):
+        self.__get_pending_transaction_count = get_pending_transaction_count
+        self.__next_nonces = dict()  # type: Dict[str, int]
+        self.__lock = threading.Lock()
+
+    def allocate(self, sender_address: str, quantity: int = 1) -> List[int]:
+        with self.__lock:
+            pending = self.__get_pending_transaction_count(sender_address)
+            first = max(pending, self.__next_nonces.get(sender_address, 0))
+            self.__next_nonces[sender_address] = first + quantity
+            return list(range(first, first + quantity))
+
+    def reset(self, sender_address: str) -> None:
+        """Forget the nonces handed out to sender_address; The next allocation starts from the chain's count."""
+        with self.__lock:
+            self.__next_nonces.pop(sender_address, None)
+
+
+class TransactionPipeline:
+    """
+    Sends transactions without waiting for each to be mined before sending the next.
+
+    Each transaction is built with a nonce from the interface's NonceAllocator, signed and broadcast
+    as it is submitted (so each sender's transactions reach the node in nonce order), and then
+    its receipt is waited for in the background; submit() returns a Future of the confirmed receipt.
+
+        with blockchain.transaction_pipeline() as pipeline:
+            approval = pipeline.submit(token.functions.approve(...), sender_address=staker)
+            deposit = pipeline.submit(escrow.functions.deposit(...), sender_address=staker)
+        receipts = pipeline.receipts   # Or, without the context manager, pipeline.wait()
+
+    Transactions can also be signed ahead of broadcasting them - their hashes are known once they are
+    signed - with sign() and broadcast(); submit() is the two in one.
+    """
+
+    SignedTransaction = namedtuple('SignedTransaction', ['txhash', 'raw', 'name', 'sender_address', 'nonce'])
+
+    DEFAULT_RECEIPT_WORKERS = 1  # Receipts come back in nonce order anyway
+
+    class TransactionFailed(RuntimeError):
+        pass
+
+    def __init__(self, blockchain, receipt_workers: int = DEFAULT_RECEIPT_WORKERS):
+        self.blockchain = blockchain
+        self.log = Logger('transaction-pipeline')
+        self.__futures = list()  # type: List[Future]
+        self.__executor = ThreadPoolExecutor(max_workers=receipt_workers,
+                                             thread_name_prefix='transaction-receipts')
+        self.receipts = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.wait()
+        else:
+            self.__executor.shutdown(wait=False)
+
+    def __len__(self):
+        return len(self.__futures)
+
+    def submit(self,
+               contract_function: ContractFunction,
+               sender_address: str,
+               payload: dict = None
+               ) -> Future:
+        transaction = self.sign(contract_function=contract_function, sender_address=sender_address, payload=payload)
+        return self.broadcast(transaction)
+
+    def sign(self,
+             contract_function: ContractFunction,
+             sender_address: str,
+             payload: dict = None
+             ) -> SignedTransaction:
+        """Build and sign a transaction with the sender's next nonce, without broadcasting it."""
+        nonce, = self.blockchain.nonces.allocate(sender_address)
+        try:
+            raw, transaction_name = self.blockchain._sign_transaction(contract_function=contract_function,
+                                                                      sender_address=sender_address,
+                                                                      payload=payload,
+                                                                      nonce=nonce)
+        except Exception:
+            self.blockchain.nonces.reset(sender_address)  # Don't leave a gap behind the unused nonce
+            raise
+        return self.SignedTransaction(txhash=Web3.keccak(raw),
+                                      raw=raw,
+                                      name=transaction_name,
+                                      sender_address=sender_address,
+                                      nonce=nonce)
+
+    def broadcast(self, transaction: SignedTransaction) -> Future:
+        """Broadcast a signed transaction, and return a Future of its confirmed receipt."""
+        try:
+            txhash = self.blockchain.client.send_raw_transaction(transaction.raw)
+        except Exception:
+            self.blockchain.nonces.reset(transaction.sender_address)
+            raise
+
+        future = self.__executor.submit(self.blockchain._confirm_transaction,
+                                        txhash,
+                                        transaction.name,
+                                        transaction.sender_address)
+        self.__futures.append(future)
+        return future
+
+    def wait(self, timeout: float = None) -> list:
+        """
+        Waits for every submitted transaction's receipt, and returns them in order of submission.
+        Raises TransactionFailed, from the first failure, if any transaction failed.
+        """
+        try:
+            wait(self.__futures, timeout=timeout)
+            failures = [f.exception() for f in self.__futures if f.done() and f.exception()]
+            if failures:
+                message = f"{len(failures)} of {len(self.__futures)} transactions failed"
+                raise self.TransactionFailed(message) from failures[0]
+            self.receipts = [f.result(timeout=0) for f in self.__futures]
+        finally:
+            self.__executor.shutdown(wait=False)
+        self.log.debug(f"Confirmed {len(self.receipts)} pipelined transactions")
+        return self.receipts
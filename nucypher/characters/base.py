@@ -15,6 +15,8 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import contextlib
+import threading
+from collections import OrderedDict
 from typing import Dict, ClassVar, Set
 from typing import Optional
 from typing import Union, List
@@ -58,6 +60,51 @@ from nucypher.network.nicknames import nickname_from_seed
 from nucypher.network.nodes import Learner
 
 
+class StrangerCache:
+    """
+    A bounded, least-recently-used collection of stranger Characters, keyed by verifying key,
+    so that parties who keep coming back (an Alice enacting policies, a Bob sending work orders)
+    are only constructed once.
+    """
+
+    MAX_ENTRIES = 1024
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.__strangers = OrderedDict()
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__strangers)
+
+    def __contains__(self, key):
+        return key in self.__strangers
+
+    def get(self, key) -> Optional['Character']:
+        with self.__lock:
+            try:
+                stranger = self.__strangers[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.__strangers.move_to_end(key)
+            self.hits += 1
+            return stranger
+
+    def put(self, key, stranger: 'Character') -> None:
+        with self.__lock:
+            self.__strangers[key] = stranger
+            self.__strangers.move_to_end(key)
+            if len(self.__strangers) > self.max_entries:
+                self.__strangers.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__strangers.clear()
+
+
 class Character(Learner):
     """
     A base-class for any character in our cryptography protocol narrative.
@@ -67,6 +114,9 @@ class Character(Learner):
     _default_crypto_powerups = None
     _stamp = None
     _crashed = False
+    _nickname = None
+    _nickname_metadata = None
+    _stranger_cache = None  # A StrangerCache, for Characters whose strangers are worth remembering
 
     from nucypher.network.protocols import SuspiciousActivity  # Ship this exception with every Character.
 
@@ -192,9 +242,13 @@ class Character(Learner):
         # Federated
         #
         elif federated_only:
-            try:
-                self._set_checksum_address()  # type: str
-            except NoSigningPower:
+            if is_me or checksum_address:
+                try:
+                    self._set_checksum_address()  # type: str
+                except NoSigningPower:
+                    self._checksum_address = NO_BLOCKCHAIN_CONNECTION
+            else:
+                # Strangers derive their address from their signing key only when it's first asked for.
                 self._checksum_address = NO_BLOCKCHAIN_CONNECTION
             if checksum_address:
                 # We'll take a checksum address, as long as it matches their singing key
@@ -205,13 +259,8 @@ class Character(Learner):
         #
         # Nicknames
         #
-        try:
-            self.nickname, self.nickname_metadata = nickname_from_seed(self.checksum_address)
-        except SigningPower.not_found_error:
-            if self.federated_only:
-                self.nickname = self.nickname_metadata = NO_NICKNAME
-            else:
-                raise
+        if is_me is True:
+            self._set_nickname()  # Strangers are named when their nickname is first asked for.
 
         #
         # Fleet state
@@ -246,6 +295,27 @@ class Character(Learner):
     def name(self):
         return self.__class__.__name__
 
+    @property
+    def nickname(self):
+        if self._nickname is None:
+            self._set_nickname()
+        return self._nickname
+
+    @property
+    def nickname_metadata(self):
+        if self._nickname_metadata is None:
+            self._set_nickname()
+        return self._nickname_metadata
+
+    def _set_nickname(self) -> None:
+        try:
+            self._nickname, self._nickname_metadata = nickname_from_seed(self.checksum_address)
+        except SigningPower.not_found_error:
+            if self.federated_only:
+                self._nickname = self._nickname_metadata = NO_NICKNAME
+            else:
+                raise
+
     @property
     def stamp(self):
         if self._stamp is NO_SIGNING_POWER:
@@ -293,9 +363,23 @@ class Character(Learner):
         Alternatively, you can pass directly a verifying public key
         (for SigningPower) and/or an encrypting public key (for DecryptionPower).
 
+        Strangers known only by their verifying key are kept in the class's StrangerCache, if it has one.
+
         # TODO: Need to be federated only until we figure out the best way to get the checksum_address in here.
         """
 
+        cacheable = all((cls._stranger_cache is not None,
+                         verifying_key,
+                         not powers_and_material,
+                         not encrypting_key,
+                         not args,
+                         not kwargs))
+        if cacheable:
+            cache_key = (cls, bytes(verifying_key), federated_only)
+            stranger = cls._stranger_cache.get(cache_key)
+            if stranger is not None:
+                return stranger
+
         crypto_power = CryptoPower()
 
         if powers_and_material is None:
@@ -314,7 +398,10 @@ class Character(Learner):
 
             crypto_power.consume_power_up(power_up(public_key=umbral_key))
 
-        return cls(is_me=False, federated_only=federated_only, crypto_power=crypto_power, *args, **kwargs)
+        stranger = cls(is_me=False, federated_only=federated_only, crypto_power=crypto_power, *args, **kwargs)
+        if cacheable:
+            cls._stranger_cache.put(cache_key, stranger)
+        return stranger
 
     def store_metadata(self, filepath: str) -> str:
         """
@@ -477,11 +564,12 @@ class Character(Learner):
 
         self._checksum_address = public_address
 
-    def make_rpc_controller(drone, crash_on_error: bool = False):
+    def make_rpc_controller(drone, crash_on_error: bool = False, batch_workers: int = JSONRPCController.DEFAULT_BATCH_WORKERS):
         app_name = bytes(drone.stamp).hex()[:6]
         controller = JSONRPCController(app_name=app_name,
                                        character_controller=drone.controller,
-                                       crash_on_error=crash_on_error)
+                                       crash_on_error=crash_on_error,
+                                       batch_workers=batch_workers)
 
         drone.controller = controller
         return controller
@@ -16,6 +16,7 @@ from sqlalchemy import create_engine, or_
 from twisted.internet import threads, reactor
 from twisted.internet.task import LoopingCall
 from twisted.logger import Logger
+from web3.exceptions import TransactionNotFound
 
 from hendrix.deploy.base import HendrixDeploy
 from hendrix.experience import hey_joe
@@ -60,14 +61,16 @@ class Moe(Character):
         new_node_or_none = super().remember_node(*args, **kwargs)
         if new_node_or_none:
             hey_joe.send(
-                {new_node_or_none.checksum_address: Moe.MonitoringTracker.abridged_node_details(new_node_or_none)},
+                {new_node_or_none.checksum_address: Moe.MonitoringTracker.abridged_node_details(new_node_or_none,
+                                                                                   self.teacher_scheduler)},
                 "nodes")
         return new_node_or_none
 
     def learn_from_teacher_node(self, *args, **kwargs):
         teacher = self.current_teacher_node(cycle=False)
         new_nodes = super().learn_from_teacher_node(*args, **kwargs)
-        hey_joe.send({teacher.checksum_address: Moe.MonitoringTracker.abridged_node_details(teacher)}, "nodes")
+        hey_joe.send({teacher.checksum_address: Moe.MonitoringTracker.abridged_node_details(teacher, self.teacher_scheduler)},
+                     "nodes")
         new_teacher = self.current_teacher_node(cycle=False)
         hey_joe.send({"current_teacher": new_teacher.checksum_address}, "teachers")
         return new_nodes
@@ -83,7 +86,7 @@ class Moe(Character):
             subscriber.sendMessage(json.dumps(message).encode())
 
         def send_nodes(subscriber):
-            message = ["nodes", self.known_nodes.abridged_nodes_dict()]
+            message = ["nodes", self.known_nodes.abridged_nodes_dict(teacher_scheduler=self.teacher_scheduler)]
             subscriber.sendMessage(json.dumps(message).encode())
 
         websocket_service = hey_joe.WebSocketService("127.0.0.1", ws_port)
@@ -137,7 +140,7 @@ class Felix(Character, NucypherTokenActor):
     STAGING_DELAY = 10              # seconds
 
     # Disbursement
-    BATCH_SIZE = 10                 # transactions
+    BATCH_SIZE = 50                 # transactions in flight at once, and recipient records per commit
     MULTIPLIER = 0.95               # 5% reduction of previous stake is 0.95, for example
     MINIMUM_DISBURSEMENT = 1e18     # NuNits
     ETHER_AIRDROP_AMOUNT = int(2e18)  # Wei
@@ -254,7 +257,26 @@ class Felix(Character, NucypherTokenActor):
             def __repr__(self):
                 return f'{self.__class__.__name__}(id={self.id})'
 
+        class Disbursement(self.db.Model):
+            """
+            Journal of signed token transfers whose recipients' records are not yet updated.
+            Entries outlive an interrupted airdrop, and are settled against the chain before the next one.
+            """
+
+            __tablename__ = 'disbursement'
+
+            id = self.db.Column(self.db.Integer, primary_key=True)
+            recipient_id = self.db.Column(self.db.Integer, self.db.ForeignKey('recipient.id'), nullable=False)
+            txhash = self.db.Column(self.db.String, unique=True, nullable=False)
+            amount = self.db.Column(self.db.String, nullable=False)
+            nonce = self.db.Column(self.db.Integer, nullable=False)
+            staged = self.db.Column(self.db.DateTime, nullable=False, default=datetime.utcnow)
+
+            def __repr__(self):
+                return f'{self.__class__.__name__}(id={self.id}, txhash={self.txhash})'
+
         self.Recipient = Recipient  # Bind to outer class
+        self.Disbursement = Disbursement
 
         # Flask decorators
         rest_app = self.rest_app
@@ -341,6 +363,7 @@ class Felix(Character, NucypherTokenActor):
         self.log.info("Starting NU Token Distribution | START")
         if self.token_balance == NU.ZERO():
             raise self.ActorError(f"Felix address {self.checksum_address} has 0 NU tokens.")
+        self.Disbursement.__table__.create(bind=self.db_engine, checkfirst=True)  # Databases predating the journal
         self._distribution_task.start(interval=self.DISTRIBUTION_INTERVAL, now=now)
         return True
 
@@ -369,31 +392,117 @@ class Felix(Character, NucypherTokenActor):
 
         return int(amount)
 
-    def __transfer(self, disbursement: int, recipient_address: str) -> str:
-        """Perform a single token transfer transaction from one account to another."""
+    def __credit(self, recipient, disbursement: int) -> None:
+        """Update a recipient's record with a confirmed disbursement (to be committed by the caller)."""
+        recipient.last_disbursement_amount = str(disbursement)
+        recipient.total_received = str(int(recipient.total_received) + disbursement)
+        recipient.last_disbursement_time = datetime.now()
+        self.__distributed += disbursement
 
-        self.__disbursement += 1
-        receipt = self.token_agent.transfer(amount=disbursement,
-                                            target_address=recipient_address,
-                                            sender_address=self.checksum_address)
-        txhash = receipt['transactionHash']
-        if self.distribute_ether:
-            ether = self.ETHER_AIRDROP_AMOUNT
-            transaction = {'to': recipient_address,
-                           'from': self.checksum_address,
-                           'value': ether,
-                           'gasPrice': self.blockchain.client.gasPrice}
-            ether_txhash = self.blockchain.client.send_transaction(transaction)
+    def __settle_disbursements(self) -> None:
+        """
+        Reconcile the disbursement journal with the chain, after an interrupted airdrop:
+        Mined transfers are credited to their recipients, transfers that failed or can no longer
+        be mined are forgotten, and those still pending are left for the next airdrop.
+        """
+        with ThreadedSession(self.db_engine) as session:
+            entries = session.query(self.Disbursement).all()
+            if not entries:
+                return
+            self.log.info(f"Settling {len(entries)} disbursements from an interrupted airdrop.")
+
+            for entry in entries:
+                try:
+                    receipt = self.blockchain.client.w3.eth.getTransactionReceipt(entry.txhash)
+                except TransactionNotFound:
+                    try:
+                        self.blockchain.client.get_transaction(entry.txhash)
+                    except TransactionNotFound:
+                        self.log.info(f"Disbursement {entry.txhash} was never mined; Forgetting it.")
+                        session.delete(entry)
+                    else:
+                        self.log.info(f"Disbursement {entry.txhash} is still pending.")
+                    continue
+
+                if receipt['status'] == 1:
+                    recipient = session.query(self.Recipient).get(entry.recipient_id)
+                    self.__credit(recipient=recipient, disbursement=int(entry.amount))
+                    self.log.info(f"Disbursement {entry.txhash} was mined; Credited {recipient.address}.")
+                else:
+                    self.log.info(f"Disbursement {entry.txhash} failed; Forgetting it.")
+                session.delete(entry)
+
+            session.commit()
+
+    def __airdrop_batch(self, staged_disbursements: list) -> int:
+        """
+        Transfer tokens to a batch of recipients, with all of the transfers in flight at once.
 
-            self.log.info(f"Disbursement #{self.__disbursement} OK | NU {txhash.hex()[-6:]} | ETH {ether_txhash.hex()[:6]} "
-                          f"({str(NU(disbursement, 'NuNit'))} + {self.ETHER_AIRDROP_AMOUNT} wei) -> {recipient_address}")
+        Every transfer is signed and journaled (in a single commit) before any is broadcast,
+        and the recipients' records are updated in a single commit once the receipts are in.
+        Returns the number of confirmed transfers.
+        """
+        pipeline = self.blockchain.transaction_pipeline()
 
-        else:
-            self.log.info(
-                f"Disbursement #{self.__disbursement} OK | {txhash.hex()[-6:]} |"
-                f"({str(NU(disbursement, 'NuNit'))} -> {recipient_address}")
+        # Sign and journal
+        transfers = list()
+        for recipient, disbursement in staged_disbursements:
+            contract_function = self.token_agent.contract.functions.transfer(recipient.address, disbursement)
+            transaction = pipeline.sign(contract_function=contract_function, sender_address=self.checksum_address)
+            entry = self.Disbursement(recipient_id=recipient.id,
+                                      txhash=transaction.txhash.hex(),
+                                      amount=str(disbursement),
+                                      nonce=transaction.nonce)
+            self.db.session.add(entry)
+            transfers.append((recipient, disbursement, transaction, entry))
+        self.db.session.commit()
+
+        # Broadcast
+        in_flight = list()
+        for recipient, disbursement, transaction, entry in transfers:
+            try:
+                future = pipeline.broadcast(transaction)
+            except Exception as e:
+                # The rest of the batch would wait on the missing nonce; Leave it to be settled next time.
+                self.log.warn(f"Failed to broadcast disbursement to {recipient.address}: {e}")
+                break
+            in_flight.append((recipient, disbursement, transaction, entry, future))
+
+        # Ether is sent from the node's own nonce count, so only after the token transfers are broadcast
+        if self.distribute_ether:
+            for recipient, *_ in in_flight:
+                transaction = {'to': recipient.address,
+                               'from': self.checksum_address,
+                               'value': self.ETHER_AIRDROP_AMOUNT,
+                               'gasPrice': self.blockchain.client.gas_price}
+                self.blockchain.client.send_transaction(transaction)
+
+        # Confirm
+        try:
+            pipeline.wait()
+        except pipeline.TransactionFailed as e:
+            self.log.warn(str(e))
+
+        confirmed = 0
+        for recipient, disbursement, transaction, entry, future in in_flight:
+            self.__disbursement += 1
+            error = future.exception()
+            if error is None:
+                self.__credit(recipient=recipient, disbursement=disbursement)
+                self.db.session.add(recipient)
+                self.db.session.delete(entry)
+                confirmed += 1
+                self.log.info(f"Disbursement #{self.__disbursement} OK | {transaction.txhash.hex()[-6:]} | "
+                              f"({str(NU(disbursement, 'NuNit'))} -> {recipient.address}")
+            elif isinstance(error, BlockchainInterface.InterfaceError):
+                self.db.session.delete(entry)  # Mined, but failed; Nothing was paid.
+                self.log.warn(f"Disbursement #{self.__disbursement} FAILED | {recipient.address} | {error}")
+            else:
+                # Perhaps still pending; Keep the journal entry to be settled before the next airdrop.
+                self.log.warn(f"Disbursement #{self.__disbursement} UNCONFIRMED | {recipient.address} | {error}")
 
-        return txhash
+        self.db.session.commit()
+        return confirmed
 
     def airdrop_tokens(self):
         """
@@ -401,6 +510,8 @@ class Felix(Character, NucypherTokenActor):
         and transfer tokens to selected recipients.
         """
 
+        self.__settle_disbursements()
+
         with ThreadedSession(self.db_engine) as session:
             population = session.query(self.Recipient).count()
 
@@ -417,7 +528,9 @@ class Felix(Character, NucypherTokenActor):
                               self.Recipient.last_disbursement_time == None)  # This must be `==` not `is`
 
         with ThreadedSession(self.db_engine) as session:
-            candidates = session.query(self.Recipient).filter(datetime_filter).all()
+            unsettled = session.query(self.Disbursement.recipient_id)
+            candidates = session.query(self.Recipient).filter(datetime_filter,
+                                                              ~self.Recipient.id.in_(unsettled)).all()
             if not candidates:
                 self.log.info("No eligible recipients this round.")
                 return
@@ -474,26 +587,17 @@ class Felix(Character, NucypherTokenActor):
             time.sleep(1)
             self.log.info(f"NU Token airdrop starting in {3 - i} seconds...")
 
-        # Slowly, in series...
+        # Concurrently, in batches...
         for batch, staged_disbursement in enumerate(batches, start=1):
             self.log.info(f"======= Batch #{batch} ========")
 
-            for recipient, disbursement in staged_disbursement:
-
-                # Perform the transfer... leaky faucet.
-                self.__transfer(disbursement=disbursement, recipient_address=recipient.address)
-                self.__distributed += disbursement
-
-                # Update the database record
-                recipient.last_disbursement_amount = str(disbursement)
-                recipient.total_received = str(int(recipient.total_received) + disbursement)
-                recipient.last_disbursement_time = datetime.now()
-
-                self.db.session.add(recipient)
-                self.db.session.commit()
+            batch_start = time.time()
+            confirmed = self.__airdrop_batch(staged_disbursements=staged_disbursement)
+            elapsed = time.time() - batch_start
 
-            # end inner loop
-            self.log.info(f"Completed Airdrop #{self.__airdrop} Batch #{batch} of {total_batches}.")
+            self.log.info(f"Completed Airdrop #{self.__airdrop} Batch #{batch} of {total_batches} | "
+                          f"{confirmed} of {len(staged_disbursement)} transfers confirmed in {elapsed:.1f}s "
+                          f"({confirmed / elapsed:.2f} transfers/s).")
 
         # end outer loop
         now = maya.now()
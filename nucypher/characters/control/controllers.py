@@ -1,6 +1,7 @@
 import inspect
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 from typing import Callable
 
@@ -202,6 +203,13 @@ class CharacterControlServer(CharacterControllerBase):
 class JSONRPCController(CharacterControlServer):
 
     _emitter_class = JSONRPCStdoutEmitter
+    DEFAULT_BATCH_WORKERS = 8
+
+    def __init__(self, batch_workers: int = DEFAULT_BATCH_WORKERS, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if batch_workers < 1:
+            raise ValueError("At least one batch worker is required.")
+        self.batch_workers = batch_workers
 
     def start(self):
         _transport = self.make_control_transport()
@@ -320,10 +328,29 @@ class JSONRPCController(CharacterControlServer):
             e = self.emitter.InvalidRequest()
             return self.emitter.error(e)
 
+        def handle_batched_message(message: dict) -> list:
+            # Responses are emitted by the character's controller; errors, by this one.
+            with self.emitter.capture() as output, self._internal_controller.emitter.capture(output):
+                try:
+                    self.handle_message(message=message)
+                except self.emitter.JSONRPCError as e:
+                    self.emitter.error(e)
+                except Exception as e:
+                    if self.crash_on_error:
+                        raise
+                    # One failed request doesn't fail the rest of the batch.
+                    self.log.warn(f"Batched request failed: {e}")
+                    self.emitter.error(self.emitter.InternalError())
+            return output
+
+        # Requests run concurrently, but responses are written in request order.
+        workers = min(self.batch_workers, len(control_requests))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f'{self.app_name}-batch') as executor:
+            outputs = list(executor.map(handle_batched_message, control_requests))
+
         batch_size = 0
-        for request in control_requests:  # TODO: parallelism
-            response_size = self.handle_message(message=request)
-            batch_size += response_size
+        for output in outputs:
+            batch_size += self.emitter.write_captured(output)
         return batch_size
 
     def handle_request(self, control_request: bytes, *args, **kwargs) -> int:
@@ -1,6 +1,8 @@
 import json
 import sys
-from typing import Callable, Union
+import threading
+from contextlib import contextmanager
+from typing import Callable, List, Union
 
 import click
 from flask import Response
@@ -72,6 +74,7 @@ class JSONRPCStdoutEmitter(StdoutEmitter):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.log = Logger("JSON-RPC-Emitter")
+        self.__captured = threading.local()
 
     class JSONRPCError(RuntimeError):
         code = None
@@ -134,10 +137,34 @@ class JSONRPCStdoutEmitter(StdoutEmitter):
 
         serialized_response = self.__serialize(data=data)
 
+        # Hold this thread's output back, if it's being captured
+        captured_output = getattr(self.__captured, 'output', None)
+        if captured_output is not None:
+            captured_output.append(serialized_response)
+            return len(serialized_response)
+
         # Write to stdout file descriptor
         number_of_written_bytes = self.sink(serialized_response)  # < ------ OUTLET
         return number_of_written_bytes
 
+    @contextmanager
+    def capture(self, output: List[str] = None) -> List[str]:
+        """
+        Collect the serialized output of the current thread (into output, if given) instead of writing it,
+        so that concurrently produced responses can be written later, in order (see write_captured).
+        """
+        output = output if output is not None else list()
+        previous_output = getattr(self.__captured, 'output', None)
+        self.__captured.output = output
+        try:
+            yield output
+        finally:
+            self.__captured.output = previous_output
+
+    def write_captured(self, output: List[str]) -> int:
+        """Write previously captured output and return the number of bytes written."""
+        return sum(self.sink(serialized_response) for serialized_response in output)
+
     def clear(self):
         pass
 
@@ -19,9 +19,10 @@ import random
 import time
 from base64 import b64encode
 from collections import OrderedDict
+from contextlib import suppress
 from functools import partial
 from json.decoder import JSONDecodeError
-from typing import Dict, Iterable, List, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Union
 
 import maya
 import requests
@@ -49,14 +50,14 @@ from nucypher.blockchain.eth.interfaces import BlockchainInterface
 from nucypher.blockchain.eth.token import StakeTracker
 from nucypher.blockchain.eth.utils import calculate_period_duration, datetime_at_period
 from nucypher.characters.banners import ALICE_BANNER, BOB_BANNER, ENRICO_BANNER, URSULA_BANNER
-from nucypher.characters.base import Character, Learner
+from nucypher.characters.base import Character, Learner, StrangerCache
 from nucypher.characters.control.controllers import (
     AliceJSONController,
     BobJSONController,
     EnricoJSONController,
     WebController
 )
-from nucypher.config.storages import NodeStorage, ForgetfulNodeStorage
+from nucypher.config.storages import NodeStorage
 from nucypher.crypto.api import keccak_digest, encrypt_and_sign
 from nucypher.crypto.constants import PUBLIC_KEY_LENGTH, PUBLIC_ADDRESS_LENGTH
 from nucypher.crypto.kits import UmbralMessageKit
@@ -76,6 +77,7 @@ class Alice(Character, PolicyAuthor):
     banner = ALICE_BANNER
     _controller_class = AliceJSONController
     _default_crypto_powerups = [SigningPower, DecryptingPower, DelegatingPower]
+    _stranger_cache = StrangerCache()
 
     def __init__(self,
                  checksum_address: str = None,
@@ -485,6 +487,7 @@ class Bob(Character):
     _controller_class = BobJSONController
 
     _default_crypto_powerups = [SigningPower, DecryptingPower]
+    _stranger_cache = StrangerCache()
 
     class IncorrectCFragsReceived(Exception):
         """
@@ -837,6 +840,9 @@ class Ursula(Teacher, Character, Worker):
                  is_me: bool = True,
                  interface_signature=None,
                  timestamp=None,
+                 verification_workers: int = None,
+                 verification_queue_size: int = None,
+                 serve_metrics: bool = False,
 
                  # Blockchain
                  blockchain: BlockchainInterface = None,
@@ -909,6 +915,9 @@ class Ursula(Teacher, Character, Worker):
                                 worker_address=worker_address,
                                 stake_tracker=stake_tracker)
 
+                # Verification results are only good for the period in which they were obtained
+                self.stake_tracker.add_action(self.verification_cache.clear)
+
         #
         # ProxyRESTServer and TLSHostingPower #
         #
@@ -923,10 +932,13 @@ class Ursula(Teacher, Character, Worker):
                 #
                 # REST Server (Ephemeral Self-Ursula)
                 #
-                rest_app, datastore = make_rest_app(
+                rest_app, datastore, verification_queue = make_rest_app(
                     this_node=self,
                     db_filepath=db_filepath,
                     serving_domains=domains,
+                    verification_workers=verification_workers,
+                    verification_queue_size=verification_queue_size,
+                    serve_metrics=serve_metrics,
                 )
 
                 #
@@ -937,6 +949,7 @@ class Ursula(Teacher, Character, Worker):
                 tls_hosting_power = TLSHostingPower(keypair=tls_hosting_keypair, host=rest_host)
                 self.rest_server = ProxyRESTServer(rest_host=rest_host, rest_port=rest_port,
                                                    rest_app=rest_app, datastore=datastore,
+                                                   verification_queue=verification_queue,
                                                    hosting_power=tls_hosting_power)
 
             #
@@ -989,8 +1002,10 @@ class Ursula(Teacher, Character, Worker):
             self.log.info(message)
             self.log.info(self.banner.format(self.nickname))
         else:
-            message = "Initialized Stranger {} | {}".format(self.__class__.__name__, self)
-            self.log.debug(message)
+            # Formatted only if someone is listening; naming a stranger isn't free.
+            self.log.debug("Initialized Stranger {class_name} | {stranger}",
+                           class_name=self.__class__.__name__,
+                           stranger=self)
 
     def rest_information(self):
         hosting_power = self._crypto_power.power_ups(TLSHostingPower)
@@ -1047,9 +1062,12 @@ class Ursula(Teacher, Character, Worker):
                       port: int,
                       certificate_filepath,
                       federated_only: bool,
+                      certificate: Certificate = None,
                       *args, **kwargs
                       ):
-        response_data = network_middleware.node_information(host, port, certificate_filepath=certificate_filepath)
+        response_data = network_middleware.node_information(host, port,
+                                                            certificate_filepath=certificate_filepath,
+                                                            certificate=certificate)
 
         stranger_ursula_from_public_keys = cls.from_bytes(response_data,
                                                           federated_only=federated_only,
@@ -1105,6 +1123,8 @@ class Ursula(Teacher, Character, Worker):
                                  minimum_stake: int = 0,
                                  blockchain: BlockchainInterface = None,
                                  network_middleware: RestMiddleware = None,
+                                 timeout: int = 3,
+                                 retry_attempts: int = 3,
                                  *args,
                                  **kwargs
                                  ) -> 'Ursula':
@@ -1121,20 +1141,20 @@ class Ursula(Teacher, Character, Worker):
         host, port, checksum_address = parse_node_uri(seed_uri)
 
         # Fetch the hosts TLS certificate and read the common name
-        certificate = network_middleware.get_certificate(host=host, port=port)
+        certificate = network_middleware.get_certificate(host=host,
+                                                         port=port,
+                                                         timeout=timeout,
+                                                         retry_attempts=retry_attempts)
         real_host = certificate.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
 
-        # Create a temporary certificate storage area
-        temp_node_storage = ForgetfulNodeStorage(federated_only=federated_only)
-        temp_certificate_filepath = temp_node_storage.store_node_certificate(certificate=certificate)
-
-        # Load the host as a potential seed node
+        # Load the host as a potential seed node, pinning the certificate it presented
         potential_seed_node = cls.from_rest_url(
             blockchain=blockchain,
             host=real_host,
             port=port,
             network_middleware=network_middleware,
-            certificate_filepath=temp_certificate_filepath,
+            certificate_filepath=None,
+            certificate=certificate,
             federated_only=federated_only,
             *args,
             **kwargs
@@ -1150,16 +1170,17 @@ class Ursula(Teacher, Character, Worker):
         # Verify the node's TLS certificate
         try:
             potential_seed_node.verify_node(network_middleware=network_middleware,
-                                            accept_federated_only=federated_only,
-                                            certificate_filepath=temp_certificate_filepath)
+                                            accept_federated_only=federated_only)
         except potential_seed_node.InvalidNode:
             # TODO: What if our seed node fails verification?
             raise
 
-        # OK - everyone get out
-        temp_node_storage.forget()
         return potential_seed_node
 
+    _header_splitter = BytestringSplitter(PUBLIC_ADDRESS_LENGTH,
+                                          VariableLengthBytestring,  # domains
+                                          (int, 4, {'byteorder': 'big'}))  # timestamp
+
     @classmethod
     def internal_splitter(cls, splittable):
         result = BytestringKwargifier(
@@ -1221,21 +1242,57 @@ class Ursula(Teacher, Character, Worker):
         ursula = cls.from_public_keys(blockchain=blockchain, federated_only=federated_only, **node_info)
         return ursula
 
+    @classmethod
+    def peek_bytes(cls, ursula_as_bytes: bytes) -> Tuple[str, maya.MayaDT, Set[str]]:
+        """
+        Reads the checksum address, timestamp and serving domains of a serialized
+        (and already version-stripped) Ursula without deserializing any keys, signatures,
+        or the TLS certificate, so that callers can decide if the node is worth building.
+        """
+        public_address, domains_vbytes, timestamp, _remainder = cls._header_splitter(ursula_as_bytes,
+                                                                                     return_remainder=True)
+        domains = set(d.decode('utf-8') for d in VariableLengthBytestring.dispense(domains_vbytes))
+        return to_checksum_address(public_address), maya.MayaDT(timestamp), domains
+
     @classmethod
     def batch_from_bytes(cls,
                          ursulas_as_bytes: Iterable[bytes],
                          federated_only: bool = False,
                          fail_fast: bool = False,
                          blockchain: BlockchainInterface = None,
+                         node_filter: Callable[[str, maya.MayaDT, Set[str]], bool] = None,
                          ) -> List['Ursula']:
+        """
+        Deserializes a bundle of Ursulas in two phases: first the cheap header of each
+        node (see peek_bytes) is read, duplicate entries for the same address are dropped
+        in favor of the most recent one, and the rest are passed to node_filter, if one is given.
+        Only nodes for which it returns True are then fully materialized.
+        """
 
         node_splitter = BytestringSplitter(VariableLengthBytestring)
         nodes_vbytes = node_splitter.repeat(ursulas_as_bytes)
         version_splitter = BytestringSplitter((int, 2, {"byteorder": "big"}))
         versions_and_node_bytes = [version_splitter(n, return_remainder=True) for n in nodes_vbytes]
 
+        # Phase one: read headers, keeping only the most recent entry for each address.
+        # Nodes from the future are still sent through from_bytes to be reported.
+        latest_entries = dict()
+        for index, (version, node_bytes) in enumerate(versions_and_node_bytes):
+            if version <= cls.LEARNER_VERSION:
+                header = cls.peek_bytes(node_bytes)
+                checksum_address, timestamp, _domains = header
+                with suppress(KeyError):
+                    if not timestamp > latest_entries[checksum_address][1][1]:
+                        continue
+                latest_entries[checksum_address] = index, header
+        selected = {index for index, header in latest_entries.values() if not node_filter or node_filter(*header)}
+
+        # Phase two: materialize the selected nodes.
         ursulas = []
-        for version, node_bytes in versions_and_node_bytes:
+        for index, (version, node_bytes) in enumerate(versions_and_node_bytes):
+            if version <= cls.LEARNER_VERSION and index not in selected:
+                continue
+
             try:
                 ursula = cls.from_bytes(node_bytes, version, federated_only=federated_only, blockchain=blockchain)
             except Ursula.IsFromTheFuture as e:
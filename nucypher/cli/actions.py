@@ -31,7 +31,6 @@ from constant_sorrow.constants import (
 from nacl.exceptions import CryptoError
 from twisted.logger import Logger
 
-from nucypher.blockchain.eth.clients import NuCypherGethGoerliProcess
 from nucypher.blockchain.eth.decorators import validate_checksum_address
 from nucypher.blockchain.eth.token import Stake
 from nucypher.characters.lawful import Ursula
@@ -237,6 +236,7 @@ def get_provider_process(start_now: bool = False):
     Stage integrated ethereum node process
     # TODO: Support domains and non-geth clients
     """
+    from nucypher.blockchain.eth.clients import NuCypherGethGoerliProcess
     process = NuCypherGethGoerliProcess()
     if start_now:
         process.start()
@@ -40,6 +40,7 @@ from nucypher.cli.types import (
 )
 from nucypher.config.characters import UrsulaConfiguration
 from nucypher.config.keyring import NucypherKeyring
+from nucypher.utilities.profiling import SamplingProfiler, profile_for
 from nucypher.utilities.sandbox.constants import (
     TEMPORARY_DOMAIN,
 )
@@ -69,6 +70,9 @@ from nucypher.utilities.sandbox.constants import (
 @click.option('--provider', 'provider_uri', help="Blockchain provider's URI", type=click.STRING)
 @click.option('--registry-filepath', help="Custom contract registry filepath", type=EXISTING_READABLE_FILE)
 @click.option('--sync/--no-sync', default=False)
+@click.option('--metrics', help="Serve Prometheus metrics at /metrics", is_flag=True, default=False)
+@click.option('--profile-seconds', help="Sample the running node for this many seconds and write a stack dump to the config root", type=click.IntRange(min=1))
+@click.option('--profile-interval', help="Seconds between profiler samples", type=click.FloatRange(min=0.001), default=SamplingProfiler.DEFAULT_INTERVAL)
 @nucypher_click_config
 def ursula(click_config,
            action,
@@ -93,6 +97,9 @@ def ursula(click_config,
            registry_filepath,
            interactive,
            sync,
+           metrics,
+           profile_seconds,
+           profile_interval,
            ) -> None:
     """
     "Ursula the Untrusted" PRE Re-encryption node management commands.
@@ -272,7 +279,8 @@ def ursula(click_config,
                                             teacher_uri=teacher_uri,
                                             dev=dev,
                                             lonely=lonely,
-                                            client_password=client_password)
+                                            client_password=client_password,
+                                            serve_metrics=metrics)
     except NucypherKeyring.AuthenticationFailed as e:
         emitter.echo(str(e), color='red', bold=True)
         click.get_current_context().exit(1)
@@ -305,7 +313,17 @@ def ursula(click_config,
                 bold=True)
 
             if interactive:
-                stdio.StandardIO(UrsulaCommandProtocol(ursula=URSULA, emitter=emitter))
+                stdio.StandardIO(UrsulaCommandProtocol(ursula=URSULA,
+                                                       emitter=emitter,
+                                                       config_root=ursula_config.config_root))
+
+            if profile_seconds:
+                emitter.message(f"Profiling for {profile_seconds} seconds", color='yellow')
+                profile_for(seconds=profile_seconds,
+                            interval=profile_interval,
+                            output_dir=ursula_config.config_root,
+                            prefix=f'ursula-{URSULA.checksum_address[:9]}',
+                            callback=lambda filepath: emitter.message(f"Wrote profile to {filepath}", color='green'))
 
             if dry_run:
                 return  # <-- ABORT - (Last Chance)
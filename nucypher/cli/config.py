@@ -28,7 +28,6 @@ from nucypher.characters.control.emitters import StdoutEmitter, JSONRPCStdoutEmi
 from nucypher.config.constants import NUCYPHER_SENTRY_ENDPOINT
 from nucypher.network.middleware import RestMiddleware
 from nucypher.utilities.logging import GlobalLoggerSettings
-from nucypher.utilities.sandbox.middleware import MockRestMiddleware
 
 
 def get_env_bool(var_name: str, default: bool) -> bool:
@@ -140,6 +139,7 @@ class NucypherClickConfig:
         # Redirects outputs to in-memory python containers.
         if mock_networking:
             self.emitter.message("WARNING: Mock networking is enabled")
+            from nucypher.utilities.sandbox.middleware import MockRestMiddleware
             self.middleware = MockRestMiddleware()
         else:
             self.middleware = RestMiddleware()
@@ -17,17 +17,55 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
-import click
-
-from nucypher.cli import status, stake
-from nucypher.cli.characters import moe, ursula, alice, bob, enrico, felix
-from nucypher.cli.painting import echo_version
-
+import importlib
 
-@click.group()
-@click.option('--version', help="Echo the CLI version", is_flag=True, callback=echo_version, expose_value=False, is_eager=True)
-def nucypher_cli():
-    pass
+import click
+from click.utils import make_default_short_help
+
+
+def echo_version(ctx, param, value):
+    if not value or ctx.resilient_parsing:
+        return
+    from nucypher.cli.painting import echo_version as paint_version
+    paint_version(ctx, param, value)
+
+
+class LazyGroup(click.Group):
+    """
+    A click group whose sub-commands are only imported when one is invoked, so that `nucypher --help`
+    and federated character processes don't pay for importing every other command's dependencies
+    (deployers, the solidity compiler, geth, ...).  The commands' short help is given up front.
+    """
+
+    def __init__(self, *args, lazy_commands: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or dict()  # name -> (module, attribute, short help)
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, name):
+        if name not in self.commands and name in self.lazy_commands:
+            module_name, attribute, _short_help = self.lazy_commands[name]
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, name=name)
+        return super().get_command(ctx, name)
+
+    def format_commands(self, ctx, formatter):
+        limit = formatter.width - 6 - max(len(name) for name in self.list_commands(ctx))
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_commands and name not in self.commands:
+                _module_name, _attribute, short_help = self.lazy_commands[name]
+                rows.append((name, make_default_short_help(short_help, limit)))
+                continue
+            command = self.get_command(ctx, name)
+            if command is None or command.hidden:
+                continue
+            rows.append((name, command.get_short_help_str(limit)))
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
 
 
 #
@@ -55,22 +93,25 @@ for the entry point to be attached to the nucypher base command.
 Inversely, commenting out an entry point here will disable it.
 """
 
-ENTRY_POINTS = (
+ENTRY_POINTS = {
 
-    # Utility Sub-Commands
     # Utility Commands
-    status.status,  # Network Status
-    stake.stake,    # Stake Management
-    # device.device,  # TODO: nucypher device  # Hardware Wallet Management
+    'status': ('nucypher.cli.status', 'status', 'Echo a snapshot of live network metadata.'),  # Network Status
+    'stake': ('nucypher.cli.stake', 'stake', 'Manage stakes and other staker-related operations.'),  # Stake Management
+    # 'device': ...,  # TODO: nucypher device  # Hardware Wallet Management
 
     # Characters
-    alice.alice,    # Author of Policies
-    bob.bob,        # Builder of Capsules
-    enrico.enrico,  # Encryptor of Data
-    moe.moe,        # Monitor
-    ursula.ursula,  # Untrusted Re-Encryption Proxy
-    felix.felix     # Faucet
-)
-
-for entry_point in ENTRY_POINTS:
-    nucypher_cli.add_command(entry_point)
+    'alice': ('nucypher.cli.characters.alice', 'alice', '"Alice the Policy Authority" management commands.'),
+    'bob': ('nucypher.cli.characters.bob', 'bob', '"Bob" management commands.'),
+    'enrico': ('nucypher.cli.characters.enrico', 'enrico', '"Enrico the Encryptor" management commands.'),
+    'moe': ('nucypher.cli.characters.moe', 'moe', '"Moe the Monitor" management commands.'),
+    'ursula': ('nucypher.cli.characters.ursula', 'ursula',
+               '"Ursula the Untrusted" PRE Re-encryption node management commands.'),
+    'felix': ('nucypher.cli.characters.felix', 'felix', '"Felix the Faucet" management commands.'),
+}
+
+
+@click.group(cls=LazyGroup, lazy_commands=ENTRY_POINTS)
+@click.option('--version', help="Echo the CLI version", is_flag=True, callback=echo_version, expose_value=False, is_eager=True)
+def nucypher_cli():
+    pass
@@ -14,6 +14,7 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import inspect
 import json
 import os
 from collections import deque
@@ -28,6 +29,8 @@ from twisted.logger import Logger
 from twisted.protocols.basic import LineReceiver
 
 from nucypher.cli.painting import build_fleet_state_status
+from nucypher.config.constants import DEFAULT_CONFIG_ROOT
+from nucypher.utilities.profiling import profile_for
 
 
 class UrsulaCommandProtocol(LineReceiver):
@@ -35,12 +38,16 @@ class UrsulaCommandProtocol(LineReceiver):
     encoding = 'utf-8'
     delimiter = os.linesep.encode(encoding=encoding)
 
-    def __init__(self, ursula, emitter):
+    DEFAULT_PROFILE_SECONDS = 30
+
+    def __init__(self, ursula, emitter, config_root: str = None):
         super().__init__()
 
         self.ursula = ursula
         self.emitter = emitter
+        self.config_root = config_root or DEFAULT_CONFIG_ROOT
         self.start_time = maya.now()
+        self.profiler = None
 
         self.__history = deque(maxlen=10)
         self.prompt = bytes('Ursula({}) >>> '.format(self.ursula.checksum_address[:9]), encoding='utf-8')
@@ -66,6 +73,9 @@ class UrsulaCommandProtocol(LineReceiver):
             'start_learning': self.start_learning,
             'stop_learning': self.stop_learning,
 
+            # Diagnostics
+            'profile': self.profile,
+
             # Process Control
             'stop': self.stop,
 
@@ -144,15 +154,20 @@ class UrsulaCommandProtocol(LineReceiver):
         line = raw_line.strip().lower()
 
         # Evaluate
+        command, *args = line.split() or ('',)
         try:
-            self.__commands[line]()
+            method = self.__commands[command]
+            inspect.signature(method).bind(*args)
 
         # Print
         except KeyError:
             if line:  # allow for empty string
                 self.emitter.echo("Invalid input. Options are {}".format(', '.join(self.__commands.keys())))
+        except TypeError:
+            self.emitter.echo(f"Invalid arguments for '{command}'. Type 'help' for usage.", color='red')
 
         else:
+            method(*args)
             self.__history.append(raw_line)
 
         # Loop
@@ -182,6 +197,30 @@ class UrsulaCommandProtocol(LineReceiver):
         """
         return self.ursula.confirm_activity()
 
+    def profile(self, seconds=DEFAULT_PROFILE_SECONDS):
+        """
+        Sample the running node for [seconds] (default 30) and write a flamegraph-compatible stack dump to the config root.
+        """
+        try:
+            seconds = float(seconds)
+        except ValueError:
+            seconds = 0
+        if not seconds > 0:
+            self.emitter.echo("Profiling duration must be a positive number of seconds.", color='red')
+            return
+        if self.profiler and self.profiler.running:
+            self.emitter.echo("A profiling session is already running.", color='yellow')
+            return
+
+        def report(filepath: str) -> None:
+            self.emitter.echo(f"Wrote profile to {filepath}", color='green')
+
+        self.profiler = profile_for(seconds=seconds,
+                                    output_dir=self.config_root,
+                                    prefix=f'ursula-{self.ursula.checksum_address[:9]}',
+                                    callback=report)
+        self.emitter.echo(f"Profiling for {seconds:g} seconds...")
+
     def stop(self):
         """
         Shutdown the attached running Ursula node.
@@ -19,6 +19,7 @@ import contextlib
 import json
 import os
 import stat
+import weakref
 from json import JSONDecodeError
 from typing import ClassVar, Tuple, Callable, Union, Dict, List
 
@@ -47,6 +48,7 @@ from nucypher.crypto.constants import BLAKE2B
 from nucypher.crypto.powers import (
     SigningPower,
     DecryptingPower,
+    DelegatingPower,
     KeyPairBasedPower,
     DerivedKeyBasedPower,
     TransactingPower
@@ -346,6 +348,11 @@ class NucypherKeyring:
         Generates a NuCypherKeyring instance with the provided key paths falling back to default keyring paths.
         """
 
+        # Unlocked state, all dropped by lock()
+        self.__key_data = dict()                   # keypath -> wrapped key data, read at unlock
+        self.__unwrapped_keys = dict()             # keypath -> plaintext key (or keying material)
+        self.__derived_powers = weakref.WeakSet()  # Derived powers holding key material of their own
+
         # Identity
         self.__account = account
         self.__keyring_root = keyring_root or self.__default_keyring_root
@@ -425,14 +432,45 @@ class NucypherKeyring:
 
         return __key_filepaths
 
+    def __read_key_data(self, key_path: str) -> Dict[str, bytes]:
+        try:
+            return self.__key_data[key_path]
+        except KeyError:
+            key_data = _read_keyfile(key_path, deserializer=self._private_key_serializer)
+            self.__key_data[key_path] = key_data
+            return key_data
+
+    def __read_all_key_data(self) -> None:
+        """Reads every private keyfile this keyring has, in one pass."""
+        for key_path in (self.__root_keypath, self.__signing_keypath, self.__delegating_keypath):
+            if key_path not in self.__key_data:
+                with contextlib.suppress(FileNotFoundError):
+                    self.__read_key_data(key_path)
+
+    def __unwrap_key_data(self, key_path: str, unwrap: Callable) -> Union[UmbralPrivateKey, bytes]:
+        try:
+            return self.__unwrapped_keys[key_path]
+        except KeyError:
+            key_data = self.__read_key_data(key_path)
+            wrap_key = _derive_wrapping_key_from_key_material(salt=key_data['wrap_salt'],
+                                                              key_material=self.__derived_key_material)
+            plaintext = unwrap(key_data['key'], wrap_key)
+            self.__unwrapped_keys[key_path] = plaintext
+            return plaintext
+
     @unlock_required
     def __decrypt_keyfile(self, key_path: str) -> UmbralPrivateKey:
         """Returns plaintext version of decrypting key."""
-        key_data = _read_keyfile(key_path, deserializer=self._private_key_serializer)
-        wrap_key = _derive_wrapping_key_from_key_material(salt=key_data['wrap_salt'],
-                                                          key_material=self.__derived_key_material)
-        plain_umbral_key = UmbralPrivateKey.from_bytes(key_bytes=key_data['key'], wrapping_key=wrap_key)
-        return plain_umbral_key
+        def unwrap(key_bytes, wrap_key):
+            return UmbralPrivateKey.from_bytes(key_bytes=key_bytes, wrapping_key=wrap_key)
+        return self.__unwrap_key_data(key_path, unwrap=unwrap)
+
+    @unlock_required
+    def __decrypt_keying_material(self, key_path: str) -> bytes:
+        """Returns the plaintext keying material for derived key powers."""
+        def unwrap(key_bytes, wrap_key):
+            return SecretBox(wrap_key).decrypt(key_bytes)
+        return self.__unwrap_key_data(key_path, unwrap=unwrap)
 
     #
     # Public API
@@ -448,17 +486,23 @@ class NucypherKeyring:
     def lock(self) -> bool:
         """Make efforts to remove references to the cached key data"""
         self.__derived_key_material = KEYRING_LOCKED
+        self.__unwrapped_keys.clear()
+        self.__key_data.clear()
+        for power in list(self.__derived_powers):
+            power.clear_label_cache()
         return self.is_unlocked
 
     def unlock(self, password: str) -> bool:
         if self.is_unlocked:
             return self.is_unlocked
-        key_data = _read_keyfile(keypath=self.__root_keypath, deserializer=self._private_key_serializer)
+        self.__read_all_key_data()
+        key_data = self.__read_key_data(self.__root_keypath)
         self.log.info("Unlocking keyring.")
         try:
             derived_key = derive_key_from_password(password=password.encode(), salt=key_data['master_salt'])
         except CryptoError:
             self.log.info("Keyring unlock failed.")
+            self.__key_data.clear()
             raise self.AuthenticationFailed
         else:
             self.__derived_key_material = derived_key
@@ -492,10 +536,10 @@ class NucypherKeyring:
 
         # Derived
         elif issubclass(power_class, DerivedKeyBasedPower):
-            key_data = _read_keyfile(self.__delegating_keypath, deserializer=self._private_key_serializer)
-            wrap_key = _derive_wrapping_key_from_key_material(salt=key_data['wrap_salt'], key_material=self.__derived_key_material)
-            keying_material = SecretBox(wrap_key).decrypt(key_data['key'])
+            keying_material = self.__decrypt_keying_material(self.__delegating_keypath)
             new_cryptopower = power_class(keying_material=keying_material)
+            if isinstance(new_cryptopower, DelegatingPower):
+                self.__derived_powers.add(new_cryptopower)
 
         else:
             failure_message = "{} is an invalid type for deriving a CryptoPower.".format(power_class.__name__)
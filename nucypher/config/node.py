@@ -234,7 +234,7 @@ class CharacterConfiguration(BaseConfiguration):
             known_nodes.update({node.checksum_address: node for node in additional_nodes})
         if self.__known_nodes:
             known_nodes.update({node.checksum_address: node for node in self.__known_nodes})
-        self.__fleet_state._nodes.update(known_nodes)
+        self.__fleet_state.update(known_nodes)
         self.__fleet_state.record_fleet_state(additional_nodes_to_track=self.__known_nodes)
 
     def forget_nodes(self) -> None:
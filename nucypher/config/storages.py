@@ -17,11 +17,14 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import binascii
 import os
+import sqlite3
 import tempfile
+import threading
 from abc import abstractmethod, ABC
 
 import OpenSSL
 import shutil
+from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.serialization import Encoding
@@ -134,6 +137,15 @@ class NodeStorage(ABC):
         """Save a single node's metadata and tls certificate"""
         raise NotImplementedError
 
+    def store_nodes(self, nodes) -> None:
+        """Save the metadata of many nodes; Backends may override this with a bulk write."""
+        for node in nodes:
+            self.store_node_metadata(node=node)
+
+    def iter_nodes(self, federated_only: bool):
+        """Iterate over all stored nodes; Backends may override this to deserialize them lazily."""
+        return iter(self.all(federated_only=federated_only))
+
     @abstractmethod
     def generate_certificate_filepath(self, checksum_address: str) -> str:
         raise NotImplementedError
@@ -532,6 +544,206 @@ class TemporaryFileBasedNodeStorage(LocalFileBasedNodeStorage):
         return bool(os.path.isdir(self.metadata_dir) and os.path.isdir(self.certificates_dir))
 
 
+class SQLiteNodeStorage(NodeStorage):
+    """
+    Keeps all node metadata and certificates in a single SQLite database file,
+    indexed by checksum address and node timestamp.
+
+    No PEM files are written: Remote nodes' certificates are pinned from memory (see CertificateStore),
+    so there is no certificate filepath to report (CERTIFICATE_NOT_SAVED).
+    Stored nodes are read back a page at a time.
+    """
+
+    _name = 'sqlite'
+    DB_FILENAME = 'known_nodes.sqlite'
+    PAGE_SIZE = 100  # Nodes deserialized per read, when iterating over stored nodes
+
+    __SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS nodes ("
+        "checksum_address TEXT PRIMARY KEY, "
+        "timestamp INTEGER NOT NULL, "
+        "metadata BLOB NOT NULL)",
+
+        "CREATE INDEX IF NOT EXISTS nodes_by_timestamp ON nodes (timestamp)",
+
+        "CREATE TABLE IF NOT EXISTS certificates ("
+        "checksum_address TEXT PRIMARY KEY, "
+        "certificate BLOB NOT NULL)",
+    )
+
+    def __init__(self,
+                 config_root: str = None,
+                 db_filepath: str = None,
+                 *args, **kwargs
+                 ) -> None:
+
+        super().__init__(*args, **kwargs)
+        storage_root = os.path.join(config_root or DEFAULT_CONFIG_ROOT, 'known_nodes')
+        self.db_filepath = db_filepath or os.path.join(storage_root, self.DB_FILENAME)
+
+        self.__lock = threading.Lock()
+        self.__connection = None
+
+    def __del__(self):
+        if self.__connection is not None:
+            self.__connection.close()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            # Learning happens off the main thread; Access is serialized by the storage lock.
+            self.__connection = sqlite3.connect(self.db_filepath, check_same_thread=False)
+            with self.__connection:
+                for statement in self.__SCHEMA:
+                    self.__connection.execute(statement)
+        return self.__connection
+
+    def __execute(self, statement: str, parameters: tuple = ()) -> list:
+        with self.__lock, self._connection as connection:
+            return connection.execute(statement, parameters).fetchall()
+
+    def __executemany(self, statement: str, rows) -> None:
+        with self.__lock, self._connection as connection:
+            connection.executemany(statement, rows)
+
+    #
+    # Certificates
+    #
+
+    @validate_checksum_address
+    def generate_certificate_filepath(self, checksum_address: str):
+        return CERTIFICATE_NOT_SAVED
+
+    @staticmethod
+    def __read_certificate_address(certificate: Certificate) -> str:
+        pseudonym = certificate.subject.get_attributes_for_oid(NameOID.PSEUDONYM)[0]
+        checksum_address = pseudonym.value
+        if not is_checksum_address(checksum_address):
+            raise RuntimeError("Invalid certificate checksum address encountered: {}".format(checksum_address))
+        return checksum_address
+
+    def store_node_certificate(self, certificate: Certificate):
+        checksum_address = self.__read_certificate_address(certificate)
+        certificate_bytes = certificate.public_bytes(self.TLS_CERTIFICATE_ENCODING)
+        self.__execute("INSERT OR REPLACE INTO certificates (checksum_address, certificate) VALUES (?, ?)",
+                       (checksum_address, certificate_bytes))
+        return self.generate_certificate_filepath(checksum_address=checksum_address)
+
+    def __read_certificate(self, checksum_address: str) -> Certificate:
+        rows = self.__execute("SELECT certificate FROM certificates WHERE checksum_address = ?", (checksum_address,))
+        if not rows:
+            raise self.UnknownNode(checksum_address)
+        return x509.load_pem_x509_certificate(rows[0][0], backend=default_backend())
+
+    #
+    # Metadata
+    #
+
+    def __deserialize_node(self, node_bytes: bytes, federated_only: bool):
+        # TODO: Use blockchain None to indicate federated only
+        from nucypher.characters.lawful import Ursula
+        return Ursula.from_bytes(node_bytes, blockchain=self.blockchain, federated_only=federated_only)
+
+    def __metadata_row(self, node) -> tuple:
+        return node.checksum_address, node.timestamp.epoch, self.character_class.__bytes__(node)
+
+    def store_node_metadata(self, node, filepath: str = None) -> str:
+        self.__execute("INSERT OR REPLACE INTO nodes (checksum_address, timestamp, metadata) VALUES (?, ?, ?)",
+                       self.__metadata_row(node))
+        return self.db_filepath
+
+    def store_nodes(self, nodes) -> None:
+        """Upsert the metadata of many nodes in a single transaction"""
+        rows = [self.__metadata_row(node) for node in nodes]
+        self.__executemany("INSERT OR REPLACE INTO nodes (checksum_address, timestamp, metadata) VALUES (?, ?, ?)",
+                           rows)
+        self.log.debug("Stored metadata for {} nodes".format(len(rows)))
+
+    def iter_nodes(self, federated_only: bool, updated_since: int = None):
+        """
+        Deserialize stored nodes as they are iterated over (reading PAGE_SIZE rows at a time),
+        most recently updated first, optionally only those with a timestamp (epoch) newer than `updated_since`.
+        """
+        since = -1 if updated_since is None else updated_since
+        rows = self.__execute("SELECT checksum_address, timestamp, metadata FROM nodes "
+                              "WHERE timestamp > ? "
+                              "ORDER BY timestamp DESC, checksum_address DESC LIMIT ?",
+                              (since, self.PAGE_SIZE))
+        while rows:
+            for _checksum_address, _timestamp, node_bytes in rows:
+                yield self.__deserialize_node(node_bytes, federated_only=federated_only)
+
+            # The next page starts after the last row of this one (the lock isn't held in between).
+            last_checksum_address, last_timestamp, _node_bytes = rows[-1]
+            rows = self.__execute("SELECT checksum_address, timestamp, metadata FROM nodes "
+                                  "WHERE timestamp > ? "
+                                  "AND (timestamp < ? OR (timestamp = ? AND checksum_address < ?)) "
+                                  "ORDER BY timestamp DESC, checksum_address DESC LIMIT ?",
+                                  (since, last_timestamp, last_timestamp, last_checksum_address, self.PAGE_SIZE))
+
+    #
+    # API
+    #
+
+    def all(self, federated_only: bool, certificates_only: bool = False) -> Set[Union[Any, Certificate]]:
+        if certificates_only:
+            rows = self.__execute("SELECT certificate FROM certificates")
+            return {x509.load_pem_x509_certificate(certificate_bytes, backend=default_backend())
+                    for certificate_bytes, in rows}
+        known_nodes = set(self.iter_nodes(federated_only=federated_only))
+        self.log.info("Found {} known nodes in {}".format(len(known_nodes), self.db_filepath))
+        return known_nodes
+
+    @validate_checksum_address
+    def get(self, checksum_address: str, federated_only: bool, certificate_only: bool = False):
+        if certificate_only is True:
+            return self.__read_certificate(checksum_address=checksum_address)
+        rows = self.__execute("SELECT metadata FROM nodes WHERE checksum_address = ?", (checksum_address,))
+        if not rows:
+            raise self.UnknownNode(checksum_address)
+        return self.__deserialize_node(rows[0][0], federated_only=federated_only)
+
+    @validate_checksum_address
+    def remove(self, checksum_address: str, metadata: bool = True, certificate: bool = True) -> None:
+        if metadata is True:
+            self.__execute("DELETE FROM nodes WHERE checksum_address = ?", (checksum_address,))
+        if certificate is True:
+            self.__execute("DELETE FROM certificates WHERE checksum_address = ?", (checksum_address,))
+        self.log.debug("Deleted {} from {}".format(checksum_address, self.db_filepath))
+
+    def clear(self, metadata: bool = True, certificates: bool = True) -> None:
+        """Forget all stored nodes and certificates"""
+        if metadata is True:
+            self.__execute("DELETE FROM nodes")
+        if certificates is True:
+            self.__execute("DELETE FROM certificates")
+
+    def payload(self) -> dict:
+        payload = {
+            'storage_type': self._name,
+            'db_filepath': self.db_filepath,
+        }
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: dict, *args, **kwargs) -> 'SQLiteNodeStorage':
+        storage_type = payload[cls._TYPE_LABEL]
+        if not storage_type == cls._name:
+            raise cls.NodeStorageError("Wrong storage type. got {}".format(storage_type))
+        del payload['storage_type']
+
+        return cls(*args, **payload, **kwargs)
+
+    def initialize(self) -> bool:
+        storage_dir = os.path.dirname(self.db_filepath)
+        if storage_dir:
+            try:
+                os.makedirs(storage_dir, mode=0o755, exist_ok=True)
+            except FileNotFoundError:
+                raise self.NodeStorageError("There is no existing configuration at {}".format(storage_dir))
+        return bool(self._connection)
+
+
 #
 # Node Storage Registry
 #
@@ -17,9 +17,13 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 
 import inspect
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from typing import List, Tuple, Optional
 
-from constant_sorrow.constants import NO_BLOCKCHAIN_CONNECTION
+from constant_sorrow.constants import NO_BLOCKCHAIN_CONNECTION, PUBLIC_ONLY
 from hexbytes import HexBytes
 from umbral import pre
 from umbral.keys import UmbralPublicKey, UmbralPrivateKey, UmbralKeyingMaterial
@@ -248,18 +252,78 @@ class DerivedKeyBasedPower(CryptoPowerUp):
 
 
 class DelegatingPower(DerivedKeyBasedPower):
+    """
+    Derives a private key for each policy label from its keying material.
+
+    Derivation isn't free, and the same few labels are asked for over and over, so the most recently
+    used label keys are cached, for up to label_cache_ttl seconds if given.  Cached keys are zeroized
+    however they leave the cache - evicted for space, expired, or cleared by clear_label_cache()
+    (called when the keyring that derived this power is locked).
+
+    Callers are handed their own DecryptingPowers rather than the cache's, so that evictions
+    don't pull keys out from under them; those are only zeroized by clear_label_cache().
+    """
+
+    LABEL_CACHE_SIZE = 128
+    LABEL_CACHE_TTL = None  # seconds
+
+    _clock = time.monotonic
 
     def __init__(self,
                  keying_material: Optional[bytes] = None,
-                 password: Optional[bytes] = None) -> None:
+                 password: Optional[bytes] = None,
+                 label_cache_size: int = LABEL_CACHE_SIZE,
+                 label_cache_ttl: Optional[float] = LABEL_CACHE_TTL) -> None:
         if keying_material is None:
             self.__umbral_keying_material = UmbralKeyingMaterial()
         else:
             self.__umbral_keying_material = UmbralKeyingMaterial.from_bytes(key_bytes=keying_material,
                                                                             password=password)
+        self.label_cache_size = label_cache_size
+        self.label_cache_ttl = label_cache_ttl
+        self.__label_keys = OrderedDict()  # label -> (DecryptingKeypair, expiry)
+        self.__label_cache_lock = threading.Lock()
+        self.__decrypting_powers = weakref.WeakSet()  # Handed out to callers
+
+    def __cached_label_key(self, label: bytes) -> UmbralPrivateKey:
+        now = self._clock()
+        with self.__label_cache_lock:
+            try:
+                keypair, expiry = self.__label_keys[label]
+            except KeyError:
+                pass
+            else:
+                if expiry is None or now < expiry:
+                    self.__label_keys.move_to_end(label)
+                    return keypair._privkey
+                del self.__label_keys[label]
+                self.__zeroize(keypair)
+
+        privkey = self.__umbral_keying_material.derive_privkey_by_label(label)
+        if self.label_cache_size:
+            expiry = None if self.label_cache_ttl is None else now + self.label_cache_ttl
+            with self.__label_cache_lock:
+                self.__label_keys[label] = keypairs.DecryptingKeypair(private_key=privkey), expiry
+                while len(self.__label_keys) > self.label_cache_size:
+                    _label, (evicted_keypair, _expiry) = self.__label_keys.popitem(last=False)
+                    self.__zeroize(evicted_keypair)
+        return privkey
+
+    @staticmethod
+    def __zeroize(keypair: keypairs.Keypair) -> None:
+        keypair._privkey = PUBLIC_ONLY
+
+    def clear_label_cache(self) -> None:
+        with self.__label_cache_lock:
+            for keypair, _expiry in self.__label_keys.values():
+                self.__zeroize(keypair)
+            self.__label_keys.clear()
+            for decrypting_power in self.__decrypting_powers:
+                self.__zeroize(decrypting_power.keypair)
+            self.__decrypting_powers.clear()
 
     def _get_privkey_from_label(self, label):
-        return self.__umbral_keying_material.derive_privkey_by_label(label)
+        return self.__cached_label_key(label)
 
     def get_pubkey_from_label(self, label):
         return self._get_privkey_from_label(label).get_pubkey()
@@ -288,7 +352,8 @@ class DelegatingPower(DerivedKeyBasedPower):
         return __private_key.get_pubkey(), kfrags
 
     def get_decrypting_power_from_label(self, label):
-        label_privkey = self._get_privkey_from_label(label)
-        label_keypair = keypairs.DecryptingKeypair(private_key=label_privkey)
-        decrypting_power = DecryptingPower(keypair=label_keypair)
+        privkey = self.__cached_label_key(label)
+        decrypting_power = DecryptingPower(keypair=keypairs.DecryptingKeypair(private_key=privkey))
+        with self.__label_cache_lock:
+            self.__decrypting_powers.add(decrypting_power)
         return decrypting_power
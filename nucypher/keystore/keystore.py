@@ -23,8 +23,23 @@ from umbral.keys import UmbralPublicKey
 from nucypher.crypto.signing import Signature
 from nucypher.crypto.utils import fingerprint_from_key
 from nucypher.keystore.db.models import Key, PolicyArrangement, Workorder
+from nucypher.utilities.metrics import REGISTRY
 from . import keypairs
 
+OPERATION_SECONDS = REGISTRY.histogram('nucypher_keystore_operation_duration_seconds',
+                                       'Time spent in KeyStore database operations, by operation',
+                                       labelnames=('operation',))
+ADD_KEY_SECONDS = OPERATION_SECONDS.labels('add_key')
+GET_KEY_SECONDS = OPERATION_SECONDS.labels('get_key')
+DEL_KEY_SECONDS = OPERATION_SECONDS.labels('del_key')
+ADD_POLICY_ARRANGEMENT_SECONDS = OPERATION_SECONDS.labels('add_policy_arrangement')
+GET_POLICY_ARRANGEMENT_SECONDS = OPERATION_SECONDS.labels('get_policy_arrangement')
+DEL_POLICY_ARRANGEMENT_SECONDS = OPERATION_SECONDS.labels('del_policy_arrangement')
+ATTACH_KFRAG_TO_SAVED_ARRANGEMENT_SECONDS = OPERATION_SECONDS.labels('attach_kfrag_to_saved_arrangement')
+ADD_WORKORDER_SECONDS = OPERATION_SECONDS.labels('add_workorder')
+GET_WORKORDERS_SECONDS = OPERATION_SECONDS.labels('get_workorders')
+DEL_WORKORDERS_SECONDS = OPERATION_SECONDS.labels('del_workorders')
+
 
 class NotFound(Exception):
     """
@@ -52,6 +67,7 @@ class KeyStore(object):
         # Best to treat like hot lava.
         self._session_on_init_thread = Session()
 
+    @ADD_KEY_SECONDS.time()
     def add_key(self, key, is_signing=True, session=None) -> Key:
         """
         :param key: Keypair object to store in the keystore.
@@ -68,6 +84,7 @@ class KeyStore(object):
 
         return new_key
 
+    @GET_KEY_SECONDS.time()
     def get_key(self, fingerprint: bytes, session=None) -> Union[keypairs.DecryptingKeypair, keypairs.SigningKeypair]:
         """
         Returns a key from the KeyStore.
@@ -87,6 +104,7 @@ class KeyStore(object):
         pubkey = UmbralPublicKey.from_bytes(key.key_data)
         return pubkey
 
+    @DEL_KEY_SECONDS.time()
     def del_key(self, fingerprint: bytes, session=None):
         """
         Deletes a key from the KeyStore.
@@ -98,6 +116,7 @@ class KeyStore(object):
         session.query(Key).filter_by(fingerprint=fingerprint).delete()
         session.commit()
 
+    @ADD_POLICY_ARRANGEMENT_SECONDS.time()
     def add_policy_arrangement(self, expiration, id, kfrag=None,
                                alice_verifying_key=None,
                                alice_signature=None,
@@ -123,6 +142,7 @@ class KeyStore(object):
 
         return new_policy_arrangement
 
+    @GET_POLICY_ARRANGEMENT_SECONDS.time()
     def get_policy_arrangement(self, arrangement_id: bytes, session=None) -> PolicyArrangement:
         """
         Returns the PolicyArrangement by its HRAC.
@@ -137,6 +157,7 @@ class KeyStore(object):
               raise NotFound("No PolicyArrangement {} found.".format(arrangement_id))
         return policy_arrangement
 
+    @DEL_POLICY_ARRANGEMENT_SECONDS.time()
     def del_policy_arrangement(self, arrangement_id: bytes, session=None):
         """
         Deletes a PolicyArrangement from the Keystore.
@@ -146,6 +167,7 @@ class KeyStore(object):
         session.query(PolicyArrangement).filter_by(id=arrangement_id).delete()
         session.commit()
 
+    @ATTACH_KFRAG_TO_SAVED_ARRANGEMENT_SECONDS.time()
     def attach_kfrag_to_saved_arrangement(self, alice, id_as_hex, kfrag, session=None):
         session = session or self._session_on_init_thread
         
@@ -160,6 +182,7 @@ class KeyStore(object):
         policy_arrangement.kfrag = bytes(kfrag)
         session.commit()
 
+    @ADD_WORKORDER_SECONDS.time()
     def add_workorder(self, bob_verifying_key, bob_signature, arrangement_id, session=None) -> Workorder:
         """
         Adds a Workorder to the keystore.
@@ -173,6 +196,7 @@ class KeyStore(object):
 
         return new_workorder
 
+    @GET_WORKORDERS_SECONDS.time()
     def get_workorders(self, arrangement_id: bytes, session=None) -> Workorder:
         """
         Returns a list of Workorders by HRAC.
@@ -185,6 +209,7 @@ class KeyStore(object):
             raise NotFound("No Workorders with {} HRAC found.".format(arrangement_id))
         return workorders
 
+    @DEL_WORKORDERS_SECONDS.time()
     def del_workorders(self, arrangement_id: bytes, session=None):
         """
         Deletes a Workorder from the Keystore.
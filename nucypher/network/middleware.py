@@ -16,11 +16,16 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import socket
 import ssl
+import threading
+from collections import OrderedDict
 
 import requests
 import time
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.serialization import Encoding
+from requests.adapters import HTTPAdapter
 from twisted.logger import Logger
 from umbral.cfrags import CapsuleFrag
 from umbral.signing import Signature
@@ -37,9 +42,89 @@ class NotFound(UnexpectedResponse):
     pass
 
 
+class _PinnedCertificateAdapter(HTTPAdapter):
+    """Transport adapter which connects using a prepared SSLContext."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, *args, **kwargs):
+        self.ssl_context = ssl_context  # Needed by init_poolmanager, which is called by HTTPAdapter.__init__
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        """
+        Verify against the pinned certificate only.  Otherwise requests points the connection at its CA bundle,
+        which urllib3 then loads into the shared SSLContext - trusting any public CA from then on.
+        """
+        super().cert_verify(conn, url, verify=False, cert=cert)  # No CA bundle...
+        conn.cert_reqs = 'CERT_REQUIRED'                         # ...but still verified.
+
+
+class CertificateStore:
+    """
+    In-memory store of pinned node certificates.
+
+    For each certificate (keyed by its SHA-256 fingerprint), an SSLContext trusting only that
+    certificate is built once, along with a requests session using it, so that nodes can be
+    contacted without first writing their certificates to disk.
+    """
+
+    MAX_ENTRIES = 10_000
+
+    def __init__(self, max_entries: int = None):
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self.__sessions = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__sessions)
+
+    def __contains__(self, certificate) -> bool:
+        return self.fingerprint(certificate) in self.__sessions
+
+    @staticmethod
+    def fingerprint(certificate) -> bytes:
+        return certificate.fingerprint(hashes.SHA256())
+
+    @staticmethod
+    def build_ssl_context(certificate) -> ssl.SSLContext:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ssl_context.check_hostname = False  # The host is matched by urllib3, as with a certificate file.
+        ssl_context.verify_mode = ssl.CERT_REQUIRED
+        ssl_context.load_verify_locations(cadata=certificate.public_bytes(Encoding.PEM).decode())
+        return ssl_context
+
+    def session(self, certificate) -> requests.Session:
+        fingerprint = self.fingerprint(certificate)
+        with self.__lock:
+            try:
+                self.__sessions.move_to_end(fingerprint)
+                return self.__sessions[fingerprint]
+            except KeyError:
+                session = requests.Session()
+                session.mount('https://', _PinnedCertificateAdapter(self.build_ssl_context(certificate)))
+                self.__sessions[fingerprint] = session
+                if len(self.__sessions) > self.max_entries:
+                    _fingerprint, evicted_session = self.__sessions.popitem(last=False)
+                    evicted_session.close()
+                return session
+
+    def ssl_context(self, certificate) -> ssl.SSLContext:
+        return self.session(certificate).get_adapter('https://').ssl_context
+
+    def forget(self, certificate) -> None:
+        with self.__lock:
+            session = self.__sessions.pop(self.fingerprint(certificate), None)
+        if session is not None:
+            session.close()
+
+
 class NucypherMiddlewareClient:
     library = requests
     timeout = 1.2
+    certificate_store = CertificateStore()
 
     @staticmethod
     def response_cleaner(response):
@@ -72,6 +157,12 @@ class NucypherMiddlewareClient:
         No cleaning needed.
         """
 
+    def pinned_client(self, certificate, http_client):
+        """
+        The client to use for a host presenting the given certificate.
+        """
+        return self.certificate_store.session(certificate)
+
     def __getattr__(self, method_name):
         # Quick sanity check.
         if not method_name in ("post", "get", "put", "patch", "delete"):
@@ -83,10 +174,21 @@ class NucypherMiddlewareClient:
                            host=None,
                            port=None,
                            certificate_filepath=None,
+                           certificate=None,
                            *args, **kwargs):
             host, node_certificate_filepath, http_client = self.parse_node_or_host_and_port(node, host, port)
 
-            if certificate_filepath:
+            # Unless told to use a certificate file, pin the node's certificate from memory.
+            if node and not certificate and not certificate_filepath:
+                certificate = node.certificate
+
+            if certificate:
+                if certificate_filepath:
+                    raise ValueError("Pass either a certificate or a certificate_filepath, not both.")
+                http_client = self.pinned_client(certificate, http_client)
+                certificate_filepath = True  # Verified against the pinned certificate
+
+            elif certificate_filepath:
                 filepaths_are_different = node_certificate_filepath != certificate_filepath
                 node_has_a_cert = node_certificate_filepath is not CERTIFICATE_NOT_SAVED
                 if node_has_a_cert and filepaths_are_different:
@@ -123,25 +225,37 @@ class RestMiddleware:
     def get_certificate(self, host, port, timeout=3, retry_attempts: int = 3, retry_rate: int = 2,
                         current_attempt: int = 0):
 
-        socket.setdefaulttimeout(timeout)  # Set Socket Timeout
+        for attempt in range(current_attempt, retry_attempts + 1):
+            try:
+                self.log.info(f"Fetching seednode {host}:{port} TLS certificate")
+                seednode_certificate = self._fetch_server_certificate(host=host, port=port, timeout=timeout)
 
-        try:
-            self.log.info(f"Fetching seednode {host}:{port} TLS certificate")
-            seednode_certificate = ssl.get_server_certificate(addr=(host, port))
+            except socket.timeout:
+                if attempt == retry_attempts:
+                    message = f"No Response from seednode {host}:{port} after {retry_attempts} attempts"
+                    self.log.info(message)
+                    raise RuntimeError("No response from {}:{}".format(host, port))
+                self.log.info("No Response from seednode {}. Retrying in {} seconds...".format(host, retry_rate))
+                time.sleep(retry_rate)
 
-        except socket.timeout:
-            if current_attempt == retry_attempts:
-                message = f"No Response from seednode {host}:{port} after {retry_attempts} attempts"
-                self.log.info(message)
-                raise RuntimeError("No response from {}:{}".format(host, port))
-            self.log.info("No Response from seednode {}. Retrying in {} seconds...".format(host, retry_rate))
-            time.sleep(retry_rate)
-            return self.get_certificate(host, port, timeout, retry_attempts, retry_rate, current_attempt + 1)
+            else:
+                certificate = x509.load_pem_x509_certificate(seednode_certificate.encode(),
+                                                             backend=default_backend())
+                return certificate
 
-        else:
-            certificate = x509.load_pem_x509_certificate(seednode_certificate.encode(),
-                                                         backend=default_backend())
-            return certificate
+    @staticmethod
+    def _fetch_server_certificate(host, port, timeout) -> str:
+        """
+        Like ssl.get_server_certificate, but with a timeout for this connection only
+        (rather than setting the process-wide default socket timeout).
+        """
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        with socket.create_connection((host, port), timeout=timeout) as connection:
+            with context.wrap_socket(connection) as tls_connection:
+                der_certificate = tls_connection.getpeercert(binary_form=True)
+        return ssl.DER_cert_to_PEM_cert(der_certificate)
 
     def consider_arrangement(self, arrangement):
         node = arrangement.ursula
@@ -199,11 +313,12 @@ class RestMiddleware:
             path=f"kFrag/{id_as_hex}/reencrypt",
             data=payload, timeout=2)
 
-    def node_information(self, host, port, certificate_filepath=None):
+    def node_information(self, host, port, certificate_filepath=None, certificate=None):
         response = self.client.get(host=host, port=port,
                                    path="public_information",
                                    timeout=2,
-                                   certificate_filepath=certificate_filepath)
+                                   certificate_filepath=certificate_filepath,
+                                   certificate=certificate)
         return response.content
 
     def get_nodes_via_rest(self,
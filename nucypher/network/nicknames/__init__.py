@@ -16,6 +16,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import json
 import random
+from functools import lru_cache
 from os.path import abspath, dirname, join
 
 import unicodedata
@@ -42,15 +43,22 @@ def nicename(symbol):
     return final_word.capitalize()
 
 
-def nickname_from_seed(seed, number_of_pairs=2):
+@lru_cache(maxsize=4096)
+def _nickname_pairs(seed, number_of_pairs: int) -> tuple:
     symbols = list(symbols_tuple)
 
-    random.seed(seed)
+    # A private generator, so that naming things doesn't reseed the global one.
+    generator = random.Random(seed)
     pairs = []
     for pair in range(number_of_pairs):
-        color = random.choice(colors)
-        symbol = random.choice(symbols)
+        color = generator.choice(colors)
+        symbol = generator.choice(symbols)
         symbols.remove(symbol)
         pairs.append((color, symbol))
     nickname = " ".join(("{} {}".format(c['color'], nicename(s)) for c, s in pairs))
-    return nickname, pairs
+    return nickname, tuple(pairs)
+
+
+def nickname_from_seed(seed, number_of_pairs=2):
+    nickname, pairs = _nickname_pairs(seed, number_of_pairs)
+    return nickname, list(pairs)
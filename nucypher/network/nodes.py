@@ -16,7 +16,9 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import binascii
+import queue
 import random
+import threading
 import time
 from collections import defaultdict, OrderedDict
 from collections import deque
@@ -30,19 +32,18 @@ from bytestring_splitter import BytestringSplitter
 from bytestring_splitter import VariableLengthBytestring, BytestringSplittingError
 from constant_sorrow import constant_or_bytes
 from constant_sorrow.constants import (
+    CERTIFICATE_NOT_SAVED,
     NO_KNOWN_NODES,
     NOT_SIGNED,
     NEVER_SEEN,
     NO_STORAGE_AVAILIBLE,
     FLEET_STATES_MATCH,
-    CERTIFICATE_NOT_SAVED,
     UNKNOWN_FLEET_STATE
 )
 from cryptography.x509 import Certificate
 from requests.exceptions import SSLError
 from twisted.internet import reactor, defer
 from twisted.internet import task
-from twisted.internet.threads import deferToThread
 from twisted.logger import Logger
 
 from nucypher.blockchain.eth.interfaces import BlockchainInterface
@@ -55,8 +56,18 @@ from nucypher.network import LEARNING_LOOP_VERSION
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nicknames import nickname_from_seed
-from nucypher.network.protocols import SuspiciousActivity
+from nucypher.network.protocols import InterfaceInfo, SuspiciousActivity
 from nucypher.network.server import TLSHostingPower
+from nucypher.utilities.metrics import REGISTRY
+
+LEARNING_ROUND_SECONDS = REGISTRY.histogram('nucypher_learning_round_duration_seconds',
+                                            'Time spent in each round of learning from a teacher')
+FLEET_STATE_CHANGES = REGISTRY.counter('nucypher_fleet_state_changes_total',
+                                       'New fleet states recorded')
+NEW_NODES_LEARNED = REGISTRY.counter('nucypher_learned_nodes_total',
+                                     'Previously unknown nodes learned from teachers')
+NODE_DESERIALIZATION_SECONDS = REGISTRY.histogram('nucypher_node_deserialization_seconds',
+                                                  'Time spent deserializing node payloads from teachers')
 
 
 def icon_from_checksum(checksum,
@@ -85,6 +96,9 @@ def icon_from_checksum(checksum,
 class FleetStateTracker:
     """
     A representation of a fleet of NuCypher nodes.
+
+    Known nodes are also indexed by stamp, REST interface and serving domain, so that those lookups
+    (and membership tests for node objects) don't scan the fleet.
     """
     _checksum = NO_KNOWN_NODES.bool_value(False)
     _nickname = NO_KNOWN_NODES
@@ -101,8 +115,14 @@ class FleetStateTracker:
         self._nodes = OrderedDict()
         self.states = OrderedDict()
 
+        # Secondary indexes, all leading to checksum addresses
+        self._by_stamp = dict()
+        self._by_rest_interface = dict()
+        self._by_domain = defaultdict(set)
+        self._index_entries = dict()  # checksum address -> (stamp, rest interface, domains), for replacement
+
     def __setitem__(self, key, value):
-        self._nodes[key] = value
+        self._store(key, value)
 
         if self._tracking:
             self.log.info("Updating fleet state after saving node {}".format(value))
@@ -117,7 +137,13 @@ class FleetStateTracker:
         return bool(self._nodes)
 
     def __contains__(self, item):
-        return item in self._nodes.keys() or item in self._nodes.values()
+        if item in self._nodes.keys():
+            return True
+        try:
+            stamp = bytes(item.stamp)
+        except (AttributeError, NoSigningPower):
+            return False
+        return self._by_stamp.get(stamp) in self._nodes
 
     def __iter__(self):
         yield from self._nodes.values()
@@ -131,6 +157,77 @@ class FleetStateTracker:
     def __repr__(self):
         return self._nodes.__repr__()
 
+    def update(self, nodes: dict) -> None:
+        for checksum_address, node in nodes.items():
+            self._store(checksum_address, node)
+
+    def clear(self) -> None:
+        """Forget every known node (fleet states are kept)."""
+        self._nodes.clear()
+        self._by_stamp.clear()
+        self._by_rest_interface.clear()
+        self._by_domain.clear()
+        self._index_entries.clear()
+
+    def _store(self, checksum_address: str, node) -> None:
+        self._unindex(checksum_address)
+        self._nodes[checksum_address] = node
+        self._index(checksum_address, node)
+
+    def _index(self, checksum_address: str, node) -> None:
+        try:
+            stamp = bytes(node.stamp)
+        except (AttributeError, NoSigningPower):
+            stamp = None
+        try:
+            rest_interface = node.rest_interface.uri
+        except AttributeError:
+            rest_interface = None
+        domains = frozenset(getattr(node, 'serving_domains', None) or ())
+
+        if stamp is not None:
+            self._by_stamp[stamp] = checksum_address
+        if rest_interface is not None:
+            self._by_rest_interface[rest_interface] = checksum_address
+        for domain in domains:
+            self._by_domain[domain].add(checksum_address)
+        self._index_entries[checksum_address] = stamp, rest_interface, domains
+
+    def _unindex(self, checksum_address: str) -> None:
+        try:
+            stamp, rest_interface, domains = self._index_entries.pop(checksum_address)
+        except KeyError:
+            return
+        # Another node may have taken over the stamp or interface since; leave theirs alone.
+        if self._by_stamp.get(stamp) == checksum_address:
+            del self._by_stamp[stamp]
+        if self._by_rest_interface.get(rest_interface) == checksum_address:
+            del self._by_rest_interface[rest_interface]
+        for domain in domains:
+            addresses = self._by_domain[domain]
+            addresses.discard(checksum_address)
+            if not addresses:
+                del self._by_domain[domain]
+
+    def by_stamp(self, stamp):
+        """The known node with this stamp (or verifying key); Raises KeyError if there isn't one."""
+        return self[self._by_stamp[bytes(stamp)]]
+
+    def by_rest_interface(self, host: str, port: int):
+        """The known node serving REST on host:port; Raises KeyError if there isn't one."""
+        return self[self._by_rest_interface[InterfaceInfo(host=host, port=port).uri]]
+
+    def addresses_serving(self, domains) -> Set[str]:
+        """Checksum addresses of the known nodes serving any of the given domains."""
+        addresses = set()
+        for domain in domains:
+            addresses.update(self._by_domain.get(domain, ()))
+        return addresses.intersection(self._nodes.keys())  # In case an index outlived its node
+
+    def serving(self, domains) -> list:
+        """The known nodes serving any of the given domains."""
+        return [self[address] for address in self.addresses_serving(domains)]
+
     @property
     def checksum(self):
         return self._checksum
@@ -178,7 +275,7 @@ class FleetStateTracker:
         sorted_nodes_joined = b"".join(bytes(n) for n in sorted_nodes)
         checksum = keccak_digest(sorted_nodes_joined).hex()
         if checksum not in self.states:
-            self.checksum = keccak_digest(b"".join(bytes(n) for n in self.sorted())).hex()
+            self.checksum = checksum
             self.updated = maya.now()
             # For now we store the sorted node list.  Someday we probably spin this out into
             # its own class, FleetState, and use it as the basis for partial updates.
@@ -189,6 +286,7 @@ class FleetStateTracker:
                                             updated=self.updated,
                                             )
             self.states[checksum] = new_state
+            FLEET_STATE_CHANGES.inc()
             return checksum, new_state
 
     def start_tracking_state(self, additional_nodes_to_track=None):
@@ -214,10 +312,10 @@ class FleetStateTracker:
 
         return abridged_states
 
-    def abridged_nodes_dict(self):
+    def abridged_nodes_dict(self, teacher_scheduler: 'TeacherScheduler' = None):
         abridged_nodes = {}
         for checksum_address, node in self._nodes.items():
-            abridged_nodes[checksum_address] = self.abridged_node_details(node)
+            abridged_nodes[checksum_address] = self.abridged_node_details(node, teacher_scheduler=teacher_scheduler)
 
         return abridged_nodes
 
@@ -231,12 +329,12 @@ class FleetStateTracker:
                 }
 
     @staticmethod
-    def abridged_node_details(node):
+    def abridged_node_details(node, teacher_scheduler: 'TeacherScheduler' = None):
         try:
             last_seen = node.last_seen.iso8601()
         except AttributeError:  # TODO: This logic belongs somewhere - anywhere - else.
             last_seen = str(node.last_seen)  # In case it's the constant NEVER_SEEN
-        return {
+        details = {
                 "icon_details": node.nickname_icon_details(),  # TODO: Mix this in better.
                 "rest_url": node.rest_url(),
                 "nickname": node.nickname,
@@ -245,6 +343,184 @@ class FleetStateTracker:
                 "last_seen": last_seen,
                 "fleet_state_icon": node.fleet_state_icon,
                 }
+        if teacher_scheduler is not None:
+            details["teacher"] = teacher_scheduler.details(node.checksum_address)
+        return details
+
+
+class VerificationCache:
+    """
+    Worker verification results shared by all the nodes a Learner knows about.
+
+    Worker addresses recovered from stamp signatures are memoized by (stamp, signature),
+    and successful on-chain bonding and staking checks by (staker address, worker address, period);
+    The latter are all dropped as soon as a new period is observed.
+    """
+
+    MAX_RECOVERED_WORKERS = 10_000
+
+    def __init__(self):
+        self.__period = None
+        self.__verified = set()
+        self.__recovered_workers = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__verified)
+
+    @property
+    def period(self):
+        return self.__period
+
+    def recover_worker_address(self, stamp: bytes, signature: bytes) -> str:
+        key = (stamp, signature)
+        try:
+            return self.__recovered_workers[key]
+        except KeyError:
+            worker_address = recover_address_eip_191(message=stamp, signature=signature)
+            self.__recovered_workers[key] = worker_address
+            if len(self.__recovered_workers) > self.MAX_RECOVERED_WORKERS:
+                self.__recovered_workers.popitem(last=False)
+            return worker_address
+
+    def update_period(self, period: int) -> None:
+        if period != self.__period:
+            self.__verified.clear()
+            self.__period = period
+
+    def is_verified(self, staker_address: str, worker_address: str, period: int) -> bool:
+        self.update_period(period)
+        verified = (staker_address, worker_address, period) in self.__verified
+        if verified:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return verified
+
+    def record_verified(self, staker_address: str, worker_address: str, period: int) -> None:
+        self.update_period(period)
+        self.__verified.add((staker_address, worker_address, period))
+
+    def clear(self) -> None:
+        self.__verified.clear()
+        self.__period = None
+
+
+class TeacherScheduler:
+    """
+    Keeps a record of how each node performed as a teacher - response latency, consecutive
+    failures and last success - and uses it to order the next teachers to learn from.
+
+    Fast teachers that answered recently are preferred; nodes that fail are benched for
+    an exponentially growing period (capped at MAX_BACKOFF seconds) and forgiven on their next success.
+    Lower scores are better.
+
+    Records may be written from seeder threads, so they're only changed (or listed) while holding a lock.
+    """
+
+    UNKNOWN_LATENCY = 1.0  # seconds; assumed for nodes we've never learned from
+    LATENCY_SMOOTHING = 0.3
+    STALE_AFTER = 600
+    STALENESS_PENALTY = 1.0
+    BASE_BACKOFF = 5
+    MAX_BACKOFF = 60 * 30
+
+    class TeacherRecord:
+        __slots__ = ('latency', 'failures', 'last_success', 'last_failure', 'backoff_until')
+
+        def __init__(self):
+            self.latency = None
+            self.failures = 0
+            self.last_success = None
+            self.last_failure = None
+            self.backoff_until = 0
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self.__records = defaultdict(self.TeacherRecord)
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__records)
+
+    def record_success(self, checksum_address: str, latency: float) -> None:
+        with self.__lock:
+            record = self.__records[checksum_address]
+            if record.latency is None:
+                record.latency = latency
+            else:
+                record.latency += self.LATENCY_SMOOTHING * (latency - record.latency)
+            record.failures = 0
+            record.backoff_until = 0
+            record.last_success = self._clock()
+
+    def record_failure(self, checksum_address: str) -> None:
+        with self.__lock:
+            record = self.__records[checksum_address]
+            record.failures += 1
+            record.last_failure = self._clock()
+            backoff = min(self.BASE_BACKOFF * 2 ** (record.failures - 1), self.MAX_BACKOFF)
+            record.backoff_until = record.last_failure + backoff
+
+    def forget(self, checksum_address: str) -> None:
+        with self.__lock:
+            self.__records.pop(checksum_address, None)
+
+    def backoff_remaining(self, checksum_address: str) -> float:
+        record = self.__records.get(checksum_address)
+        if record is None:
+            return 0
+        return max(0, record.backoff_until - self._clock())
+
+    def is_backed_off(self, checksum_address: str) -> bool:
+        return self.backoff_remaining(checksum_address) > 0
+
+    def score(self, checksum_address: str) -> float:
+        record = self.__records.get(checksum_address)
+        if record is None:
+            return self.UNKNOWN_LATENCY + self.STALENESS_PENALTY
+
+        latency = self.UNKNOWN_LATENCY if record.latency is None else record.latency
+        if record.last_success is None:
+            staleness = 1
+        else:
+            staleness = min(1, (self._clock() - record.last_success) / self.STALE_AFTER)
+        return latency + self.STALENESS_PENALTY * staleness
+
+    def rank(self, nodes) -> list:
+        """
+        Returns the given nodes that aren't backed off, best teacher first.
+        If every node is backed off, the one whose backoff ends soonest is returned alone.
+        """
+        nodes = list(nodes)
+        random.shuffle(nodes)  # Break ties randomly
+
+        available = [n for n in nodes if not self.is_backed_off(n.checksum_address)]
+        if not available and nodes:
+            soonest = min(nodes, key=lambda n: self.__records[n.checksum_address].backoff_until)  # All recorded
+            return [soonest]
+        return sorted(available, key=lambda n: self.score(n.checksum_address))
+
+    def details(self, checksum_address: str) -> dict:
+        record = self.__records.get(checksum_address)
+        if record is None:
+            return {"score": self.score(checksum_address), "latency": None, "failures": 0,
+                    "last_success": None, "backed_off": False}
+
+        last_success = record.last_success
+        if last_success is not None:
+            last_success = maya.MayaDT(last_success).iso8601()
+        return {"score": round(self.score(checksum_address), 3),
+                "latency": None if record.latency is None else round(record.latency, 3),
+                "failures": record.failures,
+                "last_success": last_success,
+                "backed_off": self.is_backed_off(checksum_address)}
+
+    def scores(self) -> dict:
+        with self.__lock:
+            checksum_addresses = list(self.__records)
+        return {checksum_address: self.details(checksum_address) for checksum_address in checksum_addresses}
 
 
 class Learner:
@@ -258,6 +534,8 @@ class Learner:
     _SHORT_LEARNING_DELAY = 5
     _LONG_LEARNING_DELAY = 90
     LEARNING_TIMEOUT = 10
+    SEEDNODE_TIMEOUT = 5  # seconds, for each attempt to reach a seednode
+    SEEDNODE_RETRY_ATTEMPTS = 3
     _ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN = 10
 
     # For Keeps
@@ -315,6 +593,7 @@ class Learner:
         self._node_ids_to_learn_about_immediately = set()
 
         self.__known_nodes = self.tracker_class()
+        self.verification_cache = VerificationCache()
 
         self.lonely = lonely
         self.done_seeding = False
@@ -337,12 +616,18 @@ class Learner:
                 self.unresponsive_startup_nodes.append(node)
 
         self.teacher_nodes = deque()
+        self.teacher_scheduler = TeacherScheduler()
         self._current_teacher_node = None  # type: Teacher
         self._learning_task = task.LoopingCall(self.keep_learning_about_nodes)
         self._learning_round = 0  # type: int
         self._rounds_without_new_nodes = 0  # type: int
         self._seed_nodes = seed_nodes or []
         self.unresponsive_seed_nodes = set()
+        self._seeding_condition = threading.Condition()
+        self._seed_nodes_in_flight = set()
+        self._answered_seed_nodes = set()
+        self._seeded_nodes = queue.Queue()  # Handed from seeder threads to the learning thread
+        self._read_storages = False
 
         if self.start_learning_now:
             self.start_learning_loop(now=self.learn_on_same_thread)
@@ -353,49 +638,116 @@ class Learner:
 
     def load_seednodes(self,
                        read_storages: bool = True,
-                       retry_attempts: int = 3):  # TODO: why are these unused?
+                       retry_attempts: int = None,
+                       wait_for: int = None):
         """
         Engage known nodes from storages and pre-fetch hardcoded seednode certificates for node learning.
+
+        Seednodes are contacted concurrently, each on its own background thread, and unresponsive
+        ones are retried with the same backoff used for teachers (see TeacherScheduler).
+        By default, this blocks until every seednode has answered or run out of attempts;
+        pass wait_for to return as soon as that many seednodes have answered (0 to not block at all).
+
+        Seeder threads don't remember the nodes they reach; those are handed back and remembered
+        on the calling thread, here or at the start of the next learning round.
         """
-        if self.done_seeding:
+        if self.done_seeding and not self.unresponsive_seed_nodes:
             self.log.debug("Already done seeding; won't try again.")
             return
 
-        from nucypher.characters.lawful import Ursula
-        for seednode_metadata in self._seed_nodes:
-
-            self.log.debug(
-                "Seeding from: {}|{}:{}".format(seednode_metadata.checksum_address,
-                                                seednode_metadata.rest_host,
-                                                seednode_metadata.rest_port))
-
-            seed_node = Ursula.from_seednode_metadata(seednode_metadata=seednode_metadata,
-                                                      network_middleware=self.network_middleware,
-                                                      federated_only=self.federated_only)  # TODO: 466
-            if seed_node is False:
-                self.unresponsive_seed_nodes.add(seednode_metadata)
-            else:
-                self.unresponsive_seed_nodes.discard(seednode_metadata)
-                self.remember_node(seed_node)
+        if retry_attempts is None:
+            retry_attempts = self.SEEDNODE_RETRY_ATTEMPTS
 
-        if not self.unresponsive_seed_nodes:
-            self.log.info("Finished learning about all seednodes.")
+        with self._seeding_condition:
+            for seednode_metadata in self._seed_nodes:
+                if seednode_metadata in self._answered_seed_nodes | self._seed_nodes_in_flight:
+                    continue
+                if self.teacher_scheduler.is_backed_off(seednode_metadata.checksum_address):
+                    continue  # It'll be retried by a later cycle.
+                self._seed_nodes_in_flight.add(seednode_metadata)
+                seeder = threading.Thread(target=self.__seed_from,
+                                          args=(seednode_metadata, retry_attempts),
+                                          name=f"seeder-{seednode_metadata.checksum_address}",
+                                          daemon=True)
+                seeder.start()
+
+            if wait_for is None:
+                self._seeding_condition.wait_for(lambda: not self._seed_nodes_in_flight)
+            elif wait_for:
+                wanted = min(wait_for, len(self._seed_nodes))
+                self._seeding_condition.wait_for(lambda: len(self._answered_seed_nodes) >= wanted
+                                                 or not self._seed_nodes_in_flight)
+
+            all_seeding_finished = not self._seed_nodes_in_flight
+            if all_seeding_finished and not self.unresponsive_seed_nodes:
+                self.done_seeding = True
 
-        self.done_seeding = True
+        self._remember_seeded_nodes()
+        if all_seeding_finished and not self.unresponsive_seed_nodes:
+            self.log.info("Finished learning about all seednodes.")
 
-        if read_storages is True:
+        if read_storages is True and not self._read_storages:
+            self._read_storages = True
             self.read_nodes_from_storage()
 
-        if not self.known_nodes:
+        if all_seeding_finished and not self.known_nodes:
             self.log.warn("No seednodes were available after {} attempts".format(retry_attempts))
             # TODO: Need some actual logic here for situation with no seed nodes (ie, maybe try again much later)
 
+    def __seed_from(self, seednode_metadata: SeednodeMetadata, retry_attempts: int) -> None:
+        from nucypher.characters.lawful import Ursula
+        checksum_address = seednode_metadata.checksum_address
+        try:
+            for attempt in range(1, retry_attempts + 1):
+                self.log.debug("Seeding from: {}|{}:{} (attempt {})".format(checksum_address,
+                                                                            seednode_metadata.rest_host,
+                                                                            seednode_metadata.rest_port,
+                                                                            attempt))
+                started = time.time()
+                try:
+                    seed_node = Ursula.from_seednode_metadata(seednode_metadata=seednode_metadata,
+                                                              network_middleware=self.network_middleware,
+                                                              federated_only=self.federated_only,  # TODO: 466
+                                                              timeout=self.SEEDNODE_TIMEOUT,
+                                                              retry_attempts=0)  # Retried here, with backoff
+                except NodeSeemsToBeDown + (RuntimeError,) as e:
+                    self.teacher_scheduler.record_failure(checksum_address)
+                    with self._seeding_condition:
+                        self.unresponsive_seed_nodes.add(seednode_metadata)
+                    self.log.info(f"Seednode {checksum_address} is unresponsive: {e}")
+                    if attempt < retry_attempts:
+                        time.sleep(self.teacher_scheduler.backoff_remaining(checksum_address))
+                else:
+                    self.teacher_scheduler.record_success(checksum_address, latency=time.time() - started)
+                    self._seeded_nodes.put(seed_node)
+                    with self._seeding_condition:
+                        self.unresponsive_seed_nodes.discard(seednode_metadata)
+                        self._answered_seed_nodes.add(seednode_metadata)
+                    return
+        finally:
+            with self._seeding_condition:
+                self._seed_nodes_in_flight.discard(seednode_metadata)
+                if not self._seed_nodes_in_flight and not self.unresponsive_seed_nodes:
+                    self.done_seeding = True
+                self._seeding_condition.notify_all()
+
+    def _remember_seeded_nodes(self) -> None:
+        """
+        Remembers the seednodes reached by seeder threads since the last call; Only to be called from the learning thread.
+        """
+        while True:
+            try:
+                seed_node = self._seeded_nodes.get_nowait()
+            except queue.Empty:
+                return
+            self.remember_node(seed_node)
+
     def read_nodes_from_storage(self) -> None:
-        stored_nodes = self.node_storage.all(federated_only=self.federated_only)  # TODO: #466
+        stored_nodes = self.node_storage.iter_nodes(federated_only=self.federated_only)  # TODO: #466
         for node in stored_nodes:
-            self.remember_node(node)
+            self.remember_node(node, store_metadata=False)  # It's already stored
 
-    def remember_node(self, node, force_verification_check=False, record_fleet_state=True):
+    def remember_node(self, node, force_verification_check=False, record_fleet_state=True, store_metadata=True):
 
         if node == self:  # No need to remember self.
             return False
@@ -416,18 +768,21 @@ class Learner:
             raise self.NotATeacher(f"{node.__class__.__name__} does not have a certificate and cannot be remembered.")
 
         # Store node's certificate - It has been seen.
-        certificate_filepath = self.node_storage.store_node_certificate(certificate=stranger_certificate)
+        # Otherwise, it's only kept in memory; see CertificateStore.
+        if self.save_metadata:
+            certificate_filepath = self.node_storage.store_node_certificate(certificate=stranger_certificate)
 
-        # In some cases (seed nodes or other temp stored certs),
-        # this will update the filepath from the temp location to this one.
-        node.certificate_filepath = certificate_filepath
-        self.log.info(f"Saved TLS certificate for {node.nickname}: {certificate_filepath}")
+            # In some cases (seed nodes or other temp stored certs),
+            # this will update the filepath from the temp location to this one.
+            if certificate_filepath is not CERTIFICATE_NOT_SAVED:
+                node.certificate_filepath = certificate_filepath
+            self.log.info(f"Saved TLS certificate for {node.nickname}: {certificate_filepath}")
 
         try:
             node.verify_node(force=force_verification_check,
                              network_middleware=self.network_middleware,
                              accept_federated_only=self.federated_only,  # TODO: 466 - move federated-only up to Learner?
-                             )
+                             verification_cache=self.verification_cache)
         except SSLError:
             return False  # TODO: Bucket this node as having bad TLS info - maybe it's an update that hasn't fully propagated?
 
@@ -440,7 +795,7 @@ class Learner:
 
         self.known_nodes[address] = node
 
-        if self.save_metadata:
+        if self.save_metadata and store_metadata:
             self.node_storage.store_node_metadata(node=node)
 
         self.log.info("Remembering {} ({}), popping {} listeners.".format(node.nickname, node.checksum_address, len(listeners)))
@@ -464,7 +819,8 @@ class Learner:
                 self.read_nodes_from_storage()
 
             else:
-                self.load_seednodes()
+                # Start learning from the first seednode to answer; the rest are remembered as they come in.
+                self.load_seednodes(wait_for=1)
 
             self.learn_from_teacher_node()
             self.learning_deferred = self._learning_task.start(interval=self._SHORT_LEARNING_DELAY)
@@ -473,17 +829,14 @@ class Learner:
         else:
             self.log.info("Starting Learning Loop.")
 
-            learning_deferreds = list()
             if not self.lonely:
-                seeder_deferred = deferToThread(self.load_seednodes)
-                seeder_deferred.addErrback(self.handle_learning_errors)
-                learning_deferreds.append(seeder_deferred)
+                # Seednodes are contacted in the background, and remembered by the learning loop as they answer.
+                self.load_seednodes(wait_for=0)
 
             learner_deferred = self._learning_task.start(interval=self._SHORT_LEARNING_DELAY, now=now)
             learner_deferred.addErrback(self.handle_learning_errors)
-            learning_deferreds.append(learner_deferred)
 
-            self.learning_deferred = defer.DeferredList(learning_deferreds)
+            self.learning_deferred = defer.DeferredList([learner_deferred])
             return self.learning_deferred
 
     def stop_learning_loop(self, reason=None):
@@ -514,19 +867,22 @@ class Learner:
         self.log.critical("{} crashed with {}".format(self.checksum_address, failure))
 
     def select_teacher_nodes(self):
-        nodes_we_know_about = self.known_nodes.shuffled()
+        # Prefer teachers from our own domains, if we know any.
+        candidates = self.known_nodes.serving(self.learning_domains) or self.known_nodes
+        nodes_we_know_about = self.teacher_scheduler.rank(candidates)
 
         if not nodes_we_know_about:
             raise self.NotEnoughTeachers("Need some nodes to start learning from.")
 
-        self.teacher_nodes.extend(nodes_we_know_about)
+        # Teachers are popped from the right; put the best one there.
+        self.teacher_nodes.extend(reversed(nodes_we_know_about))
 
     def cycle_teacher_node(self):
         # To ensure that all the best teachers are available, first let's make sure
         # that we have connected to all the seed nodes.
         if self.unresponsive_seed_nodes and not self.lonely:
             self.log.info("Still have unresponsive seed nodes; trying again to connect.")
-            self.load_seednodes()  # Ideally, this is async and singular.
+            self.load_seednodes(wait_for=0)  # Retried in the background
 
         if not self.teacher_nodes:
             self.select_teacher_nodes()
@@ -688,11 +1044,13 @@ class Learner:
     def write_node_metadata(self, node, serializer=bytes) -> str:
         return self.node_storage.store_node_metadata(node=node)
 
+    @LEARNING_ROUND_SECONDS.time()
     def learn_from_teacher_node(self, eager=True):
         """
         Sends a request to node_url to find out about known nodes.
         """
         self._learning_round += 1
+        self._remember_seeded_nodes()
 
         try:
             current_teacher = self.current_teacher_node()
@@ -705,12 +1063,11 @@ class Learner:
         else:
             announce_nodes = None
 
-        unresponsive_nodes = set()
-
         #
         # Request
         #
 
+        request_started = time.time()
         try:
 
             response = self.network_middleware.get_nodes_via_rest(node=current_teacher,
@@ -718,10 +1075,17 @@ class Learner:
                                                                   announce_nodes=announce_nodes,
                                                                   fleet_checksum=self.known_nodes.checksum)
         except NodeSeemsToBeDown as e:
-            unresponsive_nodes.add(current_teacher)
+            self.teacher_scheduler.record_failure(current_teacher.checksum_address)
             self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
             return
 
+        else:
+            if response.status_code in (200, 204):
+                self.teacher_scheduler.record_success(current_teacher.checksum_address,
+                                                      latency=time.time() - request_started)
+            else:
+                self.teacher_scheduler.record_failure(current_teacher.checksum_address)
+
         finally:
             self.cycle_teacher_node()
 
@@ -770,43 +1134,54 @@ class Learner:
                                             number_of_known_nodes=len(self.known_nodes))
             return FLEET_STATES_MATCH
 
-        node_list = Ursula.batch_from_bytes(node_payload,
-                                            federated_only=self.federated_only,
-                                            blockchain=self.blockchain)  # TODO: 466
+        nodes_in_payload = 0
 
-        current_teacher.update_snapshot(checksum=checksum,
-                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                        number_of_known_nodes=len(node_list))
+        def worth_materializing(checksum_address: str, timestamp: maya.MayaDT, serving_domains: set) -> bool:
+            nonlocal nodes_in_payload
+            nodes_in_payload += 1
 
-        new_nodes = []
-        for node in node_list:
-            if not set(self.learning_domains).intersection(set(node.serving_domains)):
-                self.log.debug(f"Teacher {node} is serving {node.serving_domains}, but we're only learning {self.learning_domains}.")
-                continue  # This node is not serving any of our domains.
+            if not set(self.learning_domains).intersection(serving_domains):
+                self.log.debug(f"Teacher {checksum_address} is serving {serving_domains}, "
+                               f"but we're only learning {self.learning_domains}.")
+                return False  # This node is not serving any of our domains.
 
-            # First, determine if this is an outdated representation of an already known node.
+            # Determine if this is an outdated representation of an already known node.
             # TODO: #1032
             with suppress(KeyError):
-                already_known_node = self.known_nodes[node.checksum_address]
-                if not node.timestamp > already_known_node.timestamp:
+                already_known_node = self.known_nodes[checksum_address]
+                if not timestamp > already_known_node.timestamp:
                     self.log.debug("Skipping already known node {}".format(already_known_node))
-                    # This node is already known.  We can safely continue to the next.
-                    continue
+                    return False  # This node is already known.
+            return True
+
+        # Only nodes passing the filter are fully deserialized.
+        with NODE_DESERIALIZATION_SECONDS.time():
+            node_list = Ursula.batch_from_bytes(node_payload,
+                                                federated_only=self.federated_only,
+                                                blockchain=self.blockchain,  # TODO: 466
+                                                node_filter=worth_materializing)
+
+        current_teacher.update_snapshot(checksum=checksum,
+                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                        number_of_known_nodes=nodes_in_payload)
+
+        new_nodes = []
+        for node in node_list:
 
             #
             # Verify Node
             #
 
-            certificate_filepath = self.node_storage.store_node_certificate(certificate=node.certificate)
             try:
                 if eager:
                     node.verify_node(self.network_middleware,
                                      accept_federated_only=self.federated_only,  # TODO: 466
-                                     certificate_filepath=certificate_filepath)
+                                     verification_cache=self.verification_cache)
                     self.log.debug("Verified node: {}".format(node.checksum_address))
 
                 else:
-                    node.validate_metadata(accept_federated_only=self.federated_only)  # TODO: 466
+                    node.validate_metadata(accept_federated_only=self.federated_only,  # TODO: 466
+                                           verification_cache=self.verification_cache)
 
             #
             # Report Failure
@@ -846,10 +1221,13 @@ class Learner:
             #
 
             else:
-                new = self.remember_node(node, record_fleet_state=False)
+                new = self.remember_node(node, record_fleet_state=False, store_metadata=False)
                 if new:
                     new_nodes.append(node)
 
+        if new_nodes and self.save_metadata:
+            self.node_storage.store_nodes(new_nodes)  # All at once
+
         #
         # Continue
         #
@@ -861,9 +1239,8 @@ class Learner:
                                                         len(node_list),
                                                         len(new_nodes)))
         if new_nodes:
+            NEW_NODES_LEARNED.inc(len(new_nodes))
             self.known_nodes.record_fleet_state()
-            for node in new_nodes:
-                self.node_storage.store_node_certificate(certificate=node.certificate)
         return new_nodes
 
 
@@ -1015,7 +1392,7 @@ class Teacher:
         locked_tokens = self.staking_agent.get_locked_tokens(staker_address=self.checksum_address)
         return locked_tokens > 0  # TODO: Consider min stake size #1115
 
-    def validate_worker(self, verify_staking: bool = True) -> None:
+    def validate_worker(self, verify_staking: bool = True, verification_cache: VerificationCache = None) -> None:
 
         # Federated
         if self.federated_only:
@@ -1031,13 +1408,32 @@ class Teacher:
                 raise self.StampNotSigned
 
             # Off-chain signature verification
-            if not self._stamp_has_valid_signature_by_worker():
+            if verification_cache is not None:
+                recovered_worker = verification_cache.recover_worker_address(
+                    stamp=bytes(self.stamp),
+                    signature=self.__decentralized_identity_evidence)
+                if not self.__worker_address:
+                    self.__worker_address = recovered_worker
+                signature_is_valid = recovered_worker == self.__worker_address
+            else:
+                signature_is_valid = self._stamp_has_valid_signature_by_worker()
+
+            if not signature_is_valid:
                 message = f"Invalid signature {self.__decentralized_identity_evidence.hex()} " \
                           f"from worker {self.worker_address} for stamp {bytes(self.stamp).hex()} "
                 raise self.InvalidWorkerSignature(message)
 
             # On-chain staking check
             if verify_staking:
+                if verification_cache is not None:
+                    period = self.staking_agent.get_current_period()
+                    if verification_cache.is_verified(staker_address=self.checksum_address,
+                                                      worker_address=self.worker_address,
+                                                      period=period):
+                        self.verified_worker = True
+                        self.verified_stamp = True
+                        return
+
                 if not self._worker_is_bonded_to_staker():  # <-- Blockchain CALL
                     message = f"Worker {self.worker_address} is not bonded to staker {self.checksum_address}"
                     raise self.DetachedWorker(message)
@@ -1047,11 +1443,17 @@ class Teacher:
                 else:
                     raise self.NotStaking(f"Staker {self.checksum_address} is not staking")
 
+                if verification_cache is not None:
+                    verification_cache.record_verified(staker_address=self.checksum_address,
+                                                       worker_address=self.worker_address,
+                                                       period=period)
+
             self.verified_stamp = True
 
     def validate_metadata(self,
                           accept_federated_only: bool = False,
-                          verify_staking: bool = True):
+                          verify_staking: bool = True,
+                          verification_cache: VerificationCache = None):
 
         # Verify the interface signature
         if not self.verified_interface:
@@ -1063,7 +1465,7 @@ class Teacher:
 
         # Offline check of valid stamp signature by worker
         try:
-            self.validate_worker(verify_staking=verify_staking)
+            self.validate_worker(verify_staking=verify_staking, verification_cache=verification_cache)
         except self.WrongMode:
             if not accept_federated_only:
                 raise
@@ -1072,7 +1474,8 @@ class Teacher:
                     network_middleware,
                     certificate_filepath: str = None,
                     accept_federated_only: bool = False,
-                    force: bool = False
+                    force: bool = False,
+                    verification_cache: VerificationCache = None
                     ) -> bool:
         """
         Three things happening here:
@@ -1086,6 +1489,8 @@ class Teacher:
           checked are the same ones this node is using now. (raises InvalidNode if not valid;
           also emits a specific warning depending on which check failed).
 
+        On-chain checks are served from the given verification cache (if any) when this
+        node's staker and worker were already verified during the current period.
         """
 
         if force:
@@ -1098,18 +1503,14 @@ class Teacher:
             return True
 
         # This is both the stamp's client signature and interface metadata check; May raise InvalidNode
-        self.validate_metadata(accept_federated_only=accept_federated_only)
+        self.validate_metadata(accept_federated_only=accept_federated_only, verification_cache=verification_cache)
 
         # The node's metadata is valid; let's be sure the interface is in order.
-        if not certificate_filepath:
-            if self.certificate_filepath is CERTIFICATE_NOT_SAVED:
-                raise TypeError("We haven't saved a certificate for this node yet.")
-            else:
-                certificate_filepath = self.certificate_filepath
-
+        # Unless a certificate file is given, the node's certificate is pinned from memory.
         response_data = network_middleware.node_information(host=self.rest_interface.host,
                                                             port=self.rest_interface.port,
-                                                            certificate_filepath=certificate_filepath)
+                                                            certificate_filepath=certificate_filepath,
+                                                            certificate=None if certificate_filepath else self.certificate)
 
         version, node_bytes = self.version_splitter(response_data, return_remainder=True)
         node_details = self.internal_splitter(node_bytes)
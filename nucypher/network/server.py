@@ -17,9 +17,15 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import binascii
 import os
-from typing import Tuple
-
-from flask import Flask, Response
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from functools import partial
+from typing import Callable, Tuple
+
+from flask import Flask, Response, g
 from flask import request
 from jinja2 import Template, TemplateError
 from twisted.logger import Logger
@@ -33,7 +39,6 @@ from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
 from hendrix.experience import crosstown_traffic
 
 import nucypher
-from nucypher.config.storages import ForgetfulNodeStorage
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import KeyPairBasedPower, PowerUpError
 from nucypher.crypto.signing import InvalidSignature
@@ -44,6 +49,25 @@ from nucypher.keystore.threading import ThreadedSession
 from nucypher.network import LEARNING_LOOP_VERSION
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.protocols import InterfaceInfo
+from nucypher.utilities.metrics import REGISTRY, MetricsRegistry
+
+#
+# Metrics
+#
+
+REQUESTS = REGISTRY.counter('nucypher_http_requests_total',
+                            'REST requests served, by endpoint, method and status code',
+                            labelnames=('endpoint', 'method', 'status'))
+REQUEST_SECONDS = REGISTRY.histogram('nucypher_http_request_duration_seconds',
+                                     'Time spent serving REST requests, by endpoint',
+                                     labelnames=('endpoint',))
+REENCRYPTIONS = REGISTRY.counter('nucypher_reencryptions_total', 'Capsules re-encrypted')
+TREASURE_MAPS_STORED = REGISTRY.counter('nucypher_treasure_maps_stored_total', 'Treasure maps received and stored')
+VERIFICATION_QUEUE_SECONDS = REGISTRY.histogram('nucypher_node_verification_seconds',
+                                                'Time from announcement to completed verification of a node')
+VERIFICATION_QUEUE_OUTCOMES = REGISTRY.counter('nucypher_node_verifications_total',
+                                               'Announced nodes by verification queue outcome',
+                                               labelnames=('outcome',))
 
 HERE = BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 TEMPLATES_DIR = os.path.join(HERE, "templates")
@@ -63,12 +87,14 @@ class ProxyRESTServer:
                  hosting_power=None,
                  rest_app=None,
                  datastore=None,
+                 verification_queue=None,
                  ) -> None:
 
         self.rest_interface = InterfaceInfo(host=rest_host, port=rest_port)
         if rest_app:  # if is me
             self.rest_app = rest_app
             self.datastore = datastore
+            self.verification_queue = verification_queue
         else:
             self.rest_app = constants.PUBLIC_ONLY
 
@@ -78,15 +104,175 @@ class ProxyRESTServer:
         return "{}:{}".format(self.rest_interface.host, self.rest_interface.port)
 
 
+class NodeVerificationQueue:
+    """
+    A single work queue for verifying the nodes announced to us via node_metadata_exchange.
+
+    Pending verifications are coalesced by (checksum address, timestamp), so a node announced by
+    many learners at once is only verified once.  At most `workers` tasks drain the queue at a time,
+    and once `max_size` verifications are pending, new ones are dropped; the learners announcing
+    them will do so again in a later round.
+
+    A worker that hasn't started DISPATCH_TIMEOUT seconds after being dispatched (say, a crosstown_traffic
+    task dropped along with its failed request) gives up its slot, so the work it was meant to do isn't stranded.
+    """
+
+    WORKERS = 4
+    MAX_SIZE = 1000
+    DISPATCH_TIMEOUT = 60
+
+    def __init__(self,
+                 verifier: Callable,
+                 dispatcher: Callable = None,
+                 workers: int = None,
+                 max_size: int = None,
+                 log: Logger = None,
+                 clock: Callable = time.time):
+        self.verifier = verifier
+        self.dispatcher = dispatcher or (lambda work: crosstown_traffic()(work))
+        self.workers = workers or self.WORKERS
+        self.max_size = max_size or self.MAX_SIZE
+        self.log = log or Logger("node-verification-queue")
+        self._clock = clock
+
+        self.__lock = threading.Lock()
+        self.__pending = OrderedDict()  # (checksum address, timestamp) -> (node, enqueued at)
+        self.__in_progress = set()
+        self.__active_workers = 0
+        self.__unstarted_workers = dict()  # worker id -> dispatched at
+        self.__worker_ids = itertools.count()
+
+        self.enqueued = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.verified = 0
+        self.failed = 0
+        self.__total_latency = 0.0
+        self.__max_latency = 0.0
+
+    def __len__(self):
+        return len(self.__pending)
+
+    @staticmethod
+    def _key(checksum_address: str, timestamp) -> tuple:
+        return checksum_address, timestamp.epoch
+
+    def is_pending(self, checksum_address: str, timestamp) -> bool:
+        key = self._key(checksum_address, timestamp)
+        with self.__lock:
+            pending = key in self.__pending or key in self.__in_progress
+            if pending:
+                self.coalesced += 1
+                VERIFICATION_QUEUE_OUTCOMES.labels('coalesced').inc()
+        if pending:
+            with suppress(Exception):  # Logged; The work stays queued for the next announcement.
+                self.__dispatch_worker()
+        return pending
+
+    def enqueue(self, node) -> bool:
+        key = self._key(node.checksum_address, node.timestamp)
+        with self.__lock:
+            if key in self.__pending or key in self.__in_progress:
+                self.coalesced += 1
+                VERIFICATION_QUEUE_OUTCOMES.labels('coalesced').inc()
+                return False
+            if len(self.__pending) >= self.max_size:
+                self.dropped += 1
+                VERIFICATION_QUEUE_OUTCOMES.labels('dropped').inc()
+                self.log.debug(f"Verification queue is full; dropping {node}.")
+                return False
+            self.__pending[key] = node, self._clock()
+            self.enqueued += 1
+
+        try:
+            self.__dispatch_worker()
+        except Exception:
+            with self.__lock:
+                if self.__pending.pop(key, None) is not None:
+                    self.enqueued -= 1
+            return False
+        return True
+
+    def __dispatch_worker(self) -> None:
+        """Dispatches another worker if there's pending work and a free worker slot."""
+        with self.__lock:
+            now = self._clock()
+            for worker_id, dispatched_at in list(self.__unstarted_workers.items()):
+                if now - dispatched_at > self.DISPATCH_TIMEOUT:
+                    del self.__unstarted_workers[worker_id]
+                    self.__active_workers -= 1
+                    self.log.warn(f"Verification worker #{worker_id} never started; Dispatching another.")
+            if not self.__pending or self.__active_workers >= self.workers:
+                return
+            worker_id = next(self.__worker_ids)
+            self.__unstarted_workers[worker_id] = now
+            self.__active_workers += 1
+
+        try:
+            self.dispatcher(partial(self._work, worker_id))
+        except Exception as e:
+            with self.__lock:
+                if self.__unstarted_workers.pop(worker_id, None) is not None:
+                    self.__active_workers -= 1
+            self.log.warn(f"Failed to dispatch a verification worker: {e}")
+            raise
+
+    def _work(self, worker_id: int) -> None:
+        with self.__lock:
+            if self.__unstarted_workers.pop(worker_id, None) is None:
+                self.__active_workers += 1  # Started after its slot was given up on
+        while True:
+            with self.__lock:
+                if not self.__pending:
+                    self.__active_workers -= 1
+                    return
+                key, (node, enqueued_at) = self.__pending.popitem(last=False)
+                self.__in_progress.add(key)
+
+            try:
+                verified = self.verifier(node)
+            except Exception as e:
+                self.log.critical(f"This exception really needs to be handled differently: {e}")
+                verified = False
+
+            latency = self._clock() - enqueued_at
+            VERIFICATION_QUEUE_SECONDS.observe(latency)
+            VERIFICATION_QUEUE_OUTCOMES.labels('verified' if verified else 'failed').inc()
+            with self.__lock:
+                self.__in_progress.discard(key)
+                if verified:
+                    self.verified += 1
+                else:
+                    self.failed += 1
+                self.__total_latency += latency
+                self.__max_latency = max(self.__max_latency, latency)
+
+    @property
+    def stats(self) -> dict:
+        with self.__lock:
+            completed = self.verified + self.failed
+            return {"depth": len(self.__pending),
+                    "in_progress": len(self.__in_progress),
+                    "workers": self.__active_workers,
+                    "enqueued": self.enqueued,
+                    "coalesced": self.coalesced,
+                    "dropped": self.dropped,
+                    "verified": self.verified,
+                    "failed": self.failed,
+                    "mean_latency": self.__total_latency / completed if completed else 0.0,
+                    "max_latency": self.__max_latency}
+
+
 def make_rest_app(
         db_filepath: str,
         this_node,
         serving_domains,
+        verification_workers: int = None,
+        verification_queue_size: int = None,
+        serve_metrics: bool = False,
         log=Logger("http-application-layer")
         ) -> Tuple:
 
-    forgetful_node_storage = ForgetfulNodeStorage(federated_only=this_node.federated_only)
-
     from nucypher.keystore import keystore
     from nucypher.keystore.db import Base
     from sqlalchemy.engine import create_engine
@@ -111,6 +297,75 @@ def make_rest_app(
 
     rest_app = Flask("ursula-service")
 
+    def verify_announced_node(node) -> bool:
+        try:
+            node.verify_node(this_node.network_middleware,
+                             accept_federated_only=this_node.federated_only,  # TODO: 466
+                             verification_cache=this_node.verification_cache)
+
+        # Suspicion
+        except node.SuspiciousActivity as e:
+            # TODO: Include data about caller?
+            # TODO: Account for possibility that stamp, rather than interface, was bad.
+            # TODO: Maybe also record the bytes representation separately to disk?
+            message = f"Suspicious Activity about {node}: {str(e)}.  Announced via REST."
+            log.warn(message)
+            this_node.suspicious_activities_witnessed['vladimirs'].append(node)
+        except NodeSeemsToBeDown as e:
+            # This is a rather odd situation - this node *just* contacted us and asked to be verified.  Where'd it go?  Maybe a NAT problem?
+            log.info(f"Node announced itself to us just now, but seems to be down: {node}.  Response was {e}.")
+            log.debug(f"Phantom node certificate: {node.certificate}")
+
+        # Believable
+        else:
+            log.info("Learned about previously unknown node: {}".format(node))
+            this_node.remember_node(node)
+            # TODO: Record new fleet state
+            return True
+
+        return False
+
+    verification_queue = NodeVerificationQueue(verifier=verify_announced_node,
+                                               workers=verification_workers,
+                                               max_size=verification_queue_size,
+                                               log=log)
+
+    #
+    # Metrics
+    #
+
+    # Gauges of this node's own state live and die with its app, and are served next to the process-wide metrics
+    node_metrics = MetricsRegistry()
+    known_nodes = node_metrics.gauge('nucypher_known_nodes', 'Nodes currently known to this node')
+    known_nodes.set_function(lambda: len(this_node.known_nodes))
+    verification_queue_depth = node_metrics.gauge('nucypher_node_verification_queue_depth',
+                                                  'Announced nodes waiting to be verified')
+    verification_queue_depth.set_function(lambda: len(verification_queue))
+
+    @rest_app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @rest_app.after_request
+    def record_request_metrics(response):
+        endpoint = request.endpoint or 'unknown'
+        with suppress(AttributeError):
+            duration = time.perf_counter() - g.request_started
+            REQUEST_SECONDS.labels(endpoint).observe(duration)
+            response.headers.add('Server-Timing', f'{endpoint};dur={duration * 1000:.3f}')
+            log.debug(f"{request.method} {request.path} ({endpoint}) -> {response.status_code} in {duration * 1000:.3f}ms")
+        REQUESTS.labels(endpoint, request.method, response.status_code).inc()
+        return response
+
+    if serve_metrics:
+        @rest_app.route('/metrics')
+        def metrics():
+            """
+            Metrics in the Prometheus text exposition format.
+            """
+            rendering = REGISTRY.render() + node_metrics.render()
+            return Response(response=rendering, headers={'Content-Type': REGISTRY.CONTENT_TYPE})
+
     @rest_app.route("/public_information")
     def public_information():
         """
@@ -151,57 +406,26 @@ def make_rest_app(
             signature = this_node.stamp(payload)
             return Response(bytes(signature) + payload, headers=headers)
 
+        def worth_verifying(checksum_address, timestamp, domains) -> bool:
+            # TODO: This logic is basically repeated in learn_from_teacher_node and remember_node.
+            # Let's find a better way.  #555
+            if not set(serving_domains).intersection(domains):
+                return False  # This node is not serving any of our domains.
+
+            with suppress(KeyError):
+                if timestamp <= this_node.known_nodes[checksum_address].timestamp:
+                    return False
+
+            # Another learner announced this very node; it's already on its way.
+            return not verification_queue.is_pending(checksum_address, timestamp)
+
         nodes = _node_class.batch_from_bytes(request.data,
                                              federated_only=this_node.federated_only,
-                                             blockchain=this_node.blockchain)  # TODO: 466
+                                             blockchain=this_node.blockchain,  # TODO: 466
+                                             node_filter=worth_verifying)
 
-        # TODO: This logic is basically repeated in learn_from_teacher_node and remember_node.
-        # Let's find a better way.  #555
         for node in nodes:
-            if not set(serving_domains).intersection(set(node.serving_domains)):
-                continue  # This node is not serving any of our domains.
-
-            if node in this_node.known_nodes:
-                if node.timestamp <= this_node.known_nodes[node.checksum_address].timestamp:
-                    continue
-
-            @crosstown_traffic()
-            def learn_about_announced_nodes():
-
-                try:
-                    certificate_filepath = forgetful_node_storage.store_node_certificate(
-                        certificate=node.certificate)
-
-                    node.verify_node(this_node.network_middleware,
-                                     accept_federated_only=this_node.federated_only,  # TODO: 466
-                                     certificate_filepath=certificate_filepath)
-
-                # Suspicion
-                except node.SuspiciousActivity as e:
-                    # TODO: Include data about caller?
-                    # TODO: Account for possibility that stamp, rather than interface, was bad.
-                    # TODO: Maybe also record the bytes representation separately to disk?
-                    message = f"Suspicious Activity about {node}: {str(e)}.  Announced via REST."
-                    log.warn(message)
-                    this_node.suspicious_activities_witnessed['vladimirs'].append(node)
-                except NodeSeemsToBeDown as e:
-                    # This is a rather odd situation - this node *just* contacted us and asked to be verified.  Where'd it go?  Maybe a NAT problem?
-                    log.info(f"Node announced itself to us just now, but seems to be down: {node}.  Response was {e}.")
-                    log.debug(f"Phantom node certificate: {node.certificate}")
-                # Async Sentinel
-                except Exception as e:
-                    log.critical(f"This exception really needs to be handled differently: {e}")
-                    raise
-
-                # Believable
-                else:
-                    log.info("Learned about previously unknown node: {}".format(node))
-                    this_node.remember_node(node)
-                    # TODO: Record new fleet state
-
-                # Cleanup
-                finally:
-                    forgetful_node_storage.forget()
+            verification_queue.enqueue(node)
 
         # TODO: What's the right status code here?  202?  Different if we already knew about the node?
         return all_known_nodes()
@@ -331,6 +555,7 @@ def make_rest_app(
             # Finally, Ursula commits to her result
             reencryption_signature = this_node.stamp(bytes(cfrag))
             cfrag_byte_stream += VariableLengthBytestring(cfrag) + reencryption_signature
+            REENCRYPTIONS.inc()
 
         # TODO: Put this in Ursula's datastore
         this_node._work_orders.append(work_order)
@@ -375,6 +600,7 @@ def make_rest_app(
             # TODO 341 - what if we already have this TreasureMap?
             treasure_map_index = bytes.fromhex(treasure_map_id)
             this_node.treasure_maps[treasure_map_index] = treasure_map
+            TREASURE_MAPS_STORED.inc()
             return Response(bytes(treasure_map), status=202)
         else:
             # TODO: Make this a proper 500 or whatever.
@@ -390,6 +616,8 @@ def make_rest_app(
             content = status_template.render(this_node=this_node,
                                              known_nodes=this_node.known_nodes,
                                              previous_states=previous_states,
+                                             teacher_scores=this_node.teacher_scheduler.scores(),
+                                             verification_queue=verification_queue.stats,
                                              domains=serving_domains,
                                              version=nucypher.__version__)
         except Exception as e:
@@ -398,7 +626,7 @@ def make_rest_app(
 
         return Response(response=content, headers=headers)
 
-    return rest_app, datastore
+    return rest_app, datastore, verification_queue
 
 
 class TLSHostingPower(KeyPairBasedPower):
@@ -0,0 +1,237 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Tuple
+
+
+class MetricsRegistry:
+    """
+    A minimal, dependency-free registry of counters, gauges and histograms which
+    renders in the Prometheus text exposition format (version 0.0.4).
+
+    Registration is idempotent: asking for a metric that already exists
+    with the same name returns the existing one.
+    """
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    class MetricTypeMismatch(ValueError):
+        """Raised when a metric is re-registered with a different type."""
+
+    def __init__(self):
+        self.__metrics = dict()
+        self.__lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__metrics
+
+    def __getitem__(self, name: str) -> 'Metric':
+        return self.__metrics[name]
+
+    def __iter__(self):
+        return iter(list(self.__metrics.values()))
+
+    def register(self, metric_class, name: str, documentation: str, **kwargs) -> 'Metric':
+        with self.__lock:
+            try:
+                metric = self.__metrics[name]
+            except KeyError:
+                metric = metric_class(name=name, documentation=documentation, **kwargs)
+                self.__metrics[name] = metric
+                return metric
+        if not isinstance(metric, metric_class):
+            raise self.MetricTypeMismatch(f"{name} is already registered as a {metric.type_name}.")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> 'Counter':
+        return self.register(Counter, name=name, documentation=documentation, labelnames=labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> 'Gauge':
+        return self.register(Gauge, name=name, documentation=documentation, labelnames=labelnames)
+
+    def histogram(self,
+                  name: str,
+                  documentation: str,
+                  labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = None) -> 'Histogram':
+        return self.register(Histogram, name=name, documentation=documentation, labelnames=labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        lines = list()
+        for metric in self:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type_name}')
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    def escape(value) -> str:
+        return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class Metric:
+
+    type_name = NotImplemented
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children = dict()
+
+    def labels(self, *labelvalues, **labelkwargs) -> 'Metric':
+        """Returns the child metric for the given label values, creating it if needed."""
+        if labelkwargs:
+            labelvalues = tuple(labelkwargs[name] for name in self.labelnames)
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        labelvalues = tuple(str(v) for v in labelvalues)
+        try:
+            return self._children[labelvalues]
+        except KeyError:
+            with self._lock:
+                return self._children.setdefault(labelvalues, self._make_child())
+
+    def _make_child(self) -> 'Metric':
+        return self.__class__(name=self.name, documentation=self.documentation)
+
+    def _samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        raise NotImplementedError
+
+    def render(self) -> Iterable[str]:
+        if self.labelnames:
+            children = list(self._children.items())
+        else:
+            children = [((), self)]
+        for labelvalues, child in children:
+            labels = dict(zip(self.labelnames, labelvalues))
+            for suffix, extra_labels, value in child._samples():
+                yield f'{self.name}{suffix}{_format_labels({**labels, **extra_labels})} {_format_value(value)}'
+
+
+class Counter(Metric):
+    """
+    A monotonically increasing value, such as a number of requests served.
+    By convention, counter names end in _total.
+    """
+
+    type_name = 'counter'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented.")
+        with self._lock:
+            self.value += amount
+
+    def _samples(self):
+        yield '', {}, self.value
+
+
+class Gauge(Metric):
+    """A value that can go up and down, or be read from a callable when rendered."""
+
+    type_name = 'gauge'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.value = 0
+        self.__function = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.__function = function
+
+    def _samples(self):
+        value = self.value if self.__function is None else self.__function()
+        yield '', {}, value
+
+
+class Histogram(Metric):
+    """Counts observations (such as durations, in seconds) in cumulative buckets."""
+
+    type_name = 'histogram'
+    DEFAULT_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, float('inf'))
+
+    def __init__(self, *args, buckets: Iterable[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        buckets = sorted(buckets or self.DEFAULT_BUCKETS)
+        if buckets[-1] != float('inf'):
+            buckets.append(float('inf'))
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def _make_child(self) -> 'Histogram':
+        return self.__class__(name=self.name, documentation=self.documentation, buckets=self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self):
+        """Observes the duration of the enclosed block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def _samples(self):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield '_bucket', {'le': _format_value(bound)}, cumulative
+        yield '_sum', {}, self.sum
+        yield '_count', {}, self.count
+
+
+# The process-wide registry, served by Ursula's /metrics endpoint
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,126 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import os
+import sys
+import threading
+from collections import Counter
+from typing import Callable
+
+import maya
+from twisted.logger import Logger
+
+
+class SamplingProfiler:
+    """
+    A low-overhead statistical profiler for live nodes.
+
+    A background thread samples the stacks of all other threads every `interval` seconds,
+    so the profiled code runs unmodified.  Samples are written in the "collapsed stacks"
+    format (one `frame;frame;frame count` line per distinct stack), which can be rendered
+    by flamegraph.pl, speedscope, or similar tools.
+    """
+
+    DEFAULT_INTERVAL = 0.005  # seconds
+    FILE_EXTENSION = 'folded'
+
+    class AlreadyRunning(RuntimeError):
+        pass
+
+    def __init__(self, interval: float = None):
+        self.interval = interval or self.DEFAULT_INTERVAL
+        self.samples = Counter()
+        self.sample_count = 0
+        self.log = Logger('sampling-profiler')
+        self.__thread = None
+        self.__stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        stack = list()
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+            frame = frame.f_back
+        return ';'.join(reversed(stack))
+
+    def _sample(self) -> None:
+        own_ident = threading.get_ident()
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_ident:
+                continue
+            thread_name = thread_names.get(thread_id, thread_id)
+            self.samples[f'{thread_name};{self._collapse(frame)}'] += 1
+        self.sample_count += 1
+
+    def _run(self) -> None:
+        while not self.__stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        if self.running:
+            raise self.AlreadyRunning("This profiler is already sampling.")
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self.__thread.start()
+        self.log.info(f"Started sampling every {self.interval * 1000:.1f}ms")
+
+    def stop(self) -> Counter:
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+        self.log.info(f"Stopped after {self.sample_count} samples")
+        return self.samples
+
+    def write(self, filepath: str) -> str:
+        with open(filepath, 'w') as profile_file:
+            for stack, count in self.samples.most_common():
+                profile_file.write(f'{stack} {count}\n')
+        return filepath
+
+
+def profile_for(seconds: float,
+                output_dir: str,
+                interval: float = None,
+                prefix: str = 'profile',
+                callback: Callable[[str], None] = None) -> SamplingProfiler:
+    """
+    Samples the running process for `seconds`, then writes the collapsed stacks to a timestamped file
+    in `output_dir`, and passes its path to `callback` (if any).  Returns immediately.
+    """
+    profiler = SamplingProfiler(interval=interval)
+
+    def finish() -> None:
+        profiler.stop()
+        os.makedirs(output_dir, exist_ok=True)
+        timestamp = maya.now().datetime().strftime('%Y%m%d-%H%M%S')
+        filename = f'{prefix}-{timestamp}.{SamplingProfiler.FILE_EXTENSION}'
+        filepath = profiler.write(os.path.join(output_dir, filename))
+        if callback:
+            callback(filepath)
+
+    profiler.start()
+    timer = threading.Timer(seconds, finish)
+    timer.daemon = True
+    timer.start()
+    return profiler
@@ -49,18 +49,9 @@ from nucypher.utilities.sandbox.constants import (
 def token_airdrop(token_agent, amount: NU, origin: str, addresses: List[str]):
     """Airdrops tokens from creator address to all other addresses!"""
 
-    def txs():
-        args = {'from': origin, 'gasPrice': token_agent.blockchain.client.gas_price}
-        for address in addresses:
-            contract_function = token_agent.contract.functions.transfer(address, int(amount))
-            _receipt = token_agent.blockchain.send_transaction(contract_function=contract_function,
-                                                               sender_address=origin,
-                                                               payload=args)
-            yield _receipt
-
-    receipts = list()
-    for receipt in txs():  # One at a time
-        receipts.append(receipt)
+    args = {'from': origin, 'gasPrice': token_agent.blockchain.client.gas_price}
+    transfers = ((token_agent.contract.functions.transfer(address, int(amount)), origin, args) for address in addresses)
+    receipts = token_agent.blockchain.send_transactions(transfers)  # Pipelined
     return receipts
 
 
@@ -72,6 +63,7 @@ class TesterBlockchain(BlockchainDeployerInterface):
     _instance = None
 
     _PROVIDER_URI = 'tester://pyevm'
+    BLOCK_STALENESS = 0  # Blocks are mined on demand; Always read the latest block number
     TEST_CONTRACTS_DIR = os.path.join(BASE_DIR, 'tests', 'blockchain', 'eth', 'contracts', 'contracts')
     _compiler = SolidityCompiler(test_contract_dir=TEST_CONTRACTS_DIR)
     _test_account_cache = list()
@@ -78,6 +78,9 @@ class _TestMiddlewareClient(NucypherMiddlewareClient):
     def clean_params(self, request_kwargs):
         request_kwargs["query_string"] = request_kwargs.pop("params", {})
 
+    def pinned_client(self, certificate, http_client):
+        return http_client  # The test client doesn't do TLS.
+
 
 class MockRestMiddleware(RestMiddleware):
     _ursulas = None
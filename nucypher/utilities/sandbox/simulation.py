@@ -0,0 +1,219 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+import time
+from typing import Dict, List, Optional
+
+from twisted.internet.task import Clock
+from twisted.logger import Logger
+
+from nucypher.characters.lawful import Ursula
+from nucypher.config.characters import UrsulaConfiguration
+from nucypher.network.nodes import NODE_DESERIALIZATION_SECONDS, TeacherScheduler
+from nucypher.utilities.sandbox.constants import MOCK_URSULA_DB_FILEPATH
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware, _TestMiddlewareClient
+
+
+class _MeteredTestMiddlewareClient(_TestMiddlewareClient):
+    """
+    An in-process client that routes requests to the Ursulas of a single simulation,
+    counting requests and the bytes carried in each direction.
+    """
+
+    def __init__(self, ursulas_by_port: Dict[int, Ursula]):
+        super().__init__()
+        self.ursulas_by_port = ursulas_by_port
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def _get_ursula_by_port(self, port):
+        try:
+            return self.ursulas_by_port[port]
+        except KeyError:
+            raise RuntimeError(f"There is no simulated Ursula on port {port}.")
+
+    def invoke_method(self, method, url, *args, **kwargs):
+        self.requests += 1
+        self.bytes_sent += len(kwargs.get('data') or b'')
+        return super().invoke_method(method, url, *args, **kwargs)
+
+    def response_cleaner(self, response):
+        response = super().response_cleaner(response)
+        self.bytes_received += len(response.content)
+        return response
+
+
+class SimulatedNetworkMiddleware(MockRestMiddleware):
+
+    def __init__(self, ursulas_by_port: Dict[int, Ursula]):
+        super().__init__()
+        self.client = _MeteredTestMiddlewareClient(ursulas_by_port=ursulas_by_port)
+
+    def get_certificate(self, host, port, *args, **kwargs):
+        return self.client._get_ursula_by_port(port).certificate
+
+
+class FleetSimulation:
+    """
+    Thousands of in-process federated Ursulas, learning about each other through the real
+    Learner logic over a metered MockRestMiddleware, on a virtual clock.
+
+    Each Ursula's learning loop runs on a shared twisted Clock (as do their TeacherSchedulers),
+    so learning intervals, backoffs, and the slow-down after quiet rounds are simulated rather than waited out.
+    Everything else - serialization, signatures, fleet state checksums - is real, so bytes and CPU time are too.
+    """
+
+    STARTING_PORT = 20000
+    STEP = 1  # virtual seconds
+
+    log = Logger('fleet-simulation')
+
+    def __init__(self,
+                 quantity: int,
+                 initial_peers: int = 1,
+                 seed: Optional[int] = None,
+                 ursula_config: UrsulaConfiguration = None):
+
+        if quantity < 2:
+            raise ValueError("A fleet needs at least two Ursulas.")
+        self.quantity = quantity
+        self.initial_peers = min(initial_peers, quantity - 1)
+        self.random = random.Random(seed)
+
+        self.clock = Clock()
+        self.ursulas_by_port = dict()  # type: Dict[int, Ursula]
+        self.network_middleware = SimulatedNetworkMiddleware(ursulas_by_port=self.ursulas_by_port)
+        self.ursula_config = ursula_config or UrsulaConfiguration(dev_mode=True,
+                                                                  federated_only=True,
+                                                                  start_learning_now=False,
+                                                                  save_metadata=False,
+                                                                  reload_metadata=False,
+                                                                  download_registry=False)
+        self.ursulas = list()  # type: List[Ursula]
+        self.learning_errors = 0
+        self.timeline = list()
+
+    @property
+    def client(self) -> _MeteredTestMiddlewareClient:
+        return self.network_middleware.client
+
+    def spawn(self) -> None:
+        """Produces the fleet, and introduces each Ursula to a few random peers (the first is always the seed)."""
+        for port in range(self.STARTING_PORT, self.STARTING_PORT + self.quantity):
+            ursula = self.ursula_config.produce(rest_port=port,
+                                                db_filepath=MOCK_URSULA_DB_FILEPATH,
+                                                network_middleware=self.network_middleware)
+            ursula.teacher_scheduler = TeacherScheduler(clock=self.clock.seconds)
+            ursula._learning_task.clock = self.clock
+            self.ursulas_by_port[port] = ursula
+            self.ursulas.append(ursula)
+
+        seed, *others = self.ursulas
+        for ursula in others:
+            strangers = [peer for peer in self.random.sample(others, self.initial_peers) if peer is not ursula]
+            for peer in [seed, *strangers][:self.initial_peers]:
+                ursula.remember_node(peer)
+
+    def start_learning(self) -> None:
+        """Starts every learning loop at a random offset within one learning interval, as real nodes would."""
+        for ursula in self.ursulas:
+            offset = self.random.uniform(0, ursula._SHORT_LEARNING_DELAY)
+            self.clock.callLater(offset, self._start_learning_loop, ursula)
+
+    def _start_learning_loop(self, ursula: Ursula) -> None:
+        learning_deferred = ursula._learning_task.start(interval=ursula._SHORT_LEARNING_DELAY, now=True)
+        learning_deferred.addErrback(self._handle_learning_error, ursula=ursula)
+
+    def _handle_learning_error(self, failure, ursula: Ursula) -> None:
+        self.learning_errors += 1
+        self.log.warn(f"Learning error on {ursula}: {failure.getErrorMessage()}")
+        self._start_learning_loop(ursula)
+
+    def fleet_states(self) -> set:
+        return {ursula.known_nodes.checksum for ursula in self.ursulas}
+
+    def converged_nodes(self) -> int:
+        return sum(len(ursula.known_nodes) == self.quantity - 1 for ursula in self.ursulas)
+
+    def converged(self) -> bool:
+        return self.converged_nodes() == self.quantity and len(self.fleet_states()) == 1
+
+    def learning_rounds(self) -> int:
+        return sum(ursula._learning_round for ursula in self.ursulas)
+
+    def run(self, max_virtual_seconds: float = 3600, sample_every: float = 30) -> dict:
+        """
+        Advances the virtual clock until the fleet agrees on a single fleet state (or time runs out),
+        sampling traffic and deserialization costs every `sample_every` virtual seconds.
+        """
+        if not self.ursulas:
+            self.spawn()
+
+        # Measure only the learning loop, not bootstrapping.
+        self.client.requests = self.client.bytes_sent = self.client.bytes_received = 0
+        starting_rounds = self.learning_rounds()
+        deserialization_seconds_at_start = NODE_DESERIALIZATION_SECONDS.sum
+        wall_clock_start = time.perf_counter()
+
+        previous_sample = dict(rounds=starting_rounds, bytes=0, deserialization=deserialization_seconds_at_start)
+        self.start_learning()
+        convergence_time = None
+        while self.clock.seconds() < max_virtual_seconds:
+            self.clock.advance(self.STEP)
+            now = self.clock.seconds()
+            if self.converged():
+                convergence_time = now
+            if convergence_time is not None or now % sample_every == 0:
+                previous_sample = self._sample(previous_sample)
+            if convergence_time is not None:
+                break
+
+        for ursula in self.ursulas:
+            if ursula._learning_task.running:
+                ursula._learning_task.stop()
+
+        rounds = self.learning_rounds() - starting_rounds
+        bytes_exchanged = self.client.bytes_sent + self.client.bytes_received
+        deserialization_seconds = NODE_DESERIALIZATION_SECONDS.sum - deserialization_seconds_at_start
+        return dict(quantity=self.quantity,
+                    initial_peers=self.initial_peers,
+                    converged=convergence_time is not None,
+                    convergence_time=convergence_time,
+                    virtual_seconds=self.clock.seconds(),
+                    wall_clock_seconds=time.perf_counter() - wall_clock_start,
+                    learning_rounds=rounds,
+                    learning_errors=self.learning_errors,
+                    requests=self.client.requests,
+                    bytes_sent=self.client.bytes_sent,
+                    bytes_received=self.client.bytes_received,
+                    bytes_per_round=bytes_exchanged / rounds if rounds else 0,
+                    deserialization_seconds=deserialization_seconds,
+                    deserialization_seconds_per_round=deserialization_seconds / rounds if rounds else 0,
+                    timeline=self.timeline)
+
+    def _sample(self, previous: dict) -> dict:
+        current = dict(rounds=self.learning_rounds(),
+                       bytes=self.client.bytes_sent + self.client.bytes_received,
+                       deserialization=NODE_DESERIALIZATION_SECONDS.sum)
+        self.timeline.append(dict(virtual_time=self.clock.seconds(),
+                                  learning_rounds=current['rounds'] - previous['rounds'],
+                                  bytes_exchanged=current['bytes'] - previous['bytes'],
+                                  deserialization_seconds=current['deserialization'] - previous['deserialization'],
+                                  converged_nodes=self.converged_nodes(),
+                                  fleet_states=len(self.fleet_states())))
+        return current
@@ -0,0 +1,298 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+# Drives a scripted mix of grant / encrypt / retrieve / revoke traffic at a local federated fleet
+# and reports throughput, latency percentiles, and error rates per operation.
+#
+#     python3 scripts/local_fleet/generate_fleet_load.py --ursulas 5 --alices 2 --bobs 4 --rate 5 --duration 120
+#
+# Pass --no-fleet to aim the load at an already-running fleet (for example, one started with run_local_fleet.sh).
+
+
+import datetime
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+import maya
+
+from nucypher.characters.lawful import Alice, Bob, Enrico, Ursula
+from nucypher.network.middleware import RestMiddleware
+from nucypher.utilities.sandbox.constants import TEMPORARY_DOMAIN
+
+
+FLEET_STARTING_PORT = 11500
+OPERATIONS = ('grant', 'encrypt', 'retrieve', 'revoke')
+DEFAULT_MIX = 'grant=1,encrypt=4,retrieve=4,revoke=1'
+MESSAGE_KITS_PER_POLICY = 100
+PERCENTILES = (50, 95, 99)
+
+
+class OperationStats:
+    """
+    Latency samples and error counts for a single kind of operation.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies = list()
+        self.errors = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, error: Exception = None) -> None:
+        with self._lock:
+            if error is None:
+                self.latencies.append(latency)
+            else:
+                self.errors[error.__class__.__name__] += 1
+
+    @property
+    def attempts(self) -> int:
+        return len(self.latencies) + sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.attempts if self.attempts else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Nearest-rank percentile of successful latencies, in seconds."""
+        if not self.latencies:
+            return float('nan')
+        ranked = sorted(self.latencies)
+        index = max(0, int(round(percent / 100 * len(ranked))) - 1)
+        return ranked[index]
+
+    def summary(self, elapsed: float) -> dict:
+        return {'attempts': self.attempts,
+                'successes': len(self.latencies),
+                'throughput': len(self.latencies) / elapsed if elapsed else 0.0,
+                'error_rate': self.error_rate,
+                'errors': dict(self.errors),
+                **{f'p{p}': self.percentile(p) for p in PERCENTILES}}
+
+
+class FleetLoadGenerator:
+    """
+    Issues operations at a fixed target rate (open loop), so that a slow fleet shows up as growing latency
+    rather than as a quietly reduced request rate.  Each character handles one operation at a time.
+    """
+
+    class NothingToDo(Exception):
+        """Raised with the name of a prerequisite operation when there is nothing yet to act on."""
+
+    def __init__(self, seed_uri: str, alices: int, bobs: int, m: int, n: int, mix: dict, workers: int):
+        self.m, self.n = m, n
+        self.mix = mix
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.stats = {operation: OperationStats(operation) for operation in OPERATIONS}
+        self.late_dispatches = 0
+
+        seed = Ursula.from_teacher_uri(teacher_uri=seed_uri, federated_only=True, min_stake=0)
+        character_kwargs = dict(known_nodes=[seed],
+                                domains={TEMPORARY_DOMAIN},
+                                network_middleware=RestMiddleware(),
+                                federated_only=True,
+                                learn_on_same_thread=True,
+                                abort_on_learning_error=False)
+        self.alices = [Alice(**character_kwargs) for _ in range(alices)]
+        self.bobs = [Bob(**character_kwargs) for _ in range(bobs)]
+        for character in self.alices + self.bobs:
+            character.start_learning_loop(now=True)
+            character.block_until_number_of_known_nodes_is(n, timeout=60, learn_on_this_thread=True)
+        self._locks = {id(character): threading.Lock() for character in self.alices + self.bobs}
+
+        self._policies = list()  # [(alice, bob, policy, message_kits)]
+        self._policies_lock = threading.Lock()
+
+    #
+    # Operations
+    #
+
+    def grant(self):
+        alice, bob = random.choice(self.alices), random.choice(self.bobs)
+        label = b'load://' + os.urandom(16)
+        with self._locks[id(alice)]:
+            policy = alice.grant(bob, label,
+                                 m=self.m, n=self.n,
+                                 expiration=maya.now() + datetime.timedelta(days=1))
+        with self._policies_lock:
+            self._policies.append((alice, bob, policy, deque(maxlen=MESSAGE_KITS_PER_POLICY)))
+
+    def encrypt(self):
+        _alice, _bob, policy, message_kits = self._pick_policy()
+        enrico = Enrico(policy_encrypting_key=policy.public_key)
+        message_kit, _signature = enrico.encrypt_message(os.urandom(256))
+        message_kits.append((message_kit, enrico))
+
+    def retrieve(self):
+        with self._policies_lock:
+            candidates = [p for p in self._policies if p[-1]]
+            if not candidates:
+                raise self.NothingToDo('encrypt')
+            alice, bob, policy, message_kits = random.choice(candidates)
+            message_kit, enrico = message_kits.pop()  # Retrieve each capsule once; cfrags stay attached.
+        with self._locks[id(bob)]:
+            _hrac, map_id = bob.construct_hrac_and_map_id(alice.stamp.as_umbral_pubkey(), policy.label)
+            if map_id not in bob.treasure_maps:
+                bob.join_policy(policy.label, bytes(alice.stamp), block=True)
+            bob.retrieve(message_kit=message_kit,
+                         data_source=enrico,
+                         alice_verifying_key=alice.stamp.as_umbral_pubkey(),
+                         label=policy.label)
+
+    def revoke(self):
+        with self._policies_lock:
+            if len(self._policies) < 2:
+                raise self.NothingToDo('grant')
+            alice, _bob, policy, _message_kits = self._policies.pop(random.randrange(len(self._policies)))
+        with self._locks[id(alice)]:
+            failed_revocations = alice.revoke(policy)
+        if failed_revocations:
+            raise RuntimeError(f"{len(failed_revocations)} arrangements could not be revoked")
+
+    def _pick_policy(self):
+        with self._policies_lock:
+            if not self._policies:
+                raise self.NothingToDo('grant')
+            return random.choice(self._policies)
+
+    def _timed(self, operation: str) -> None:
+        while True:
+            started = time.perf_counter()
+            try:
+                getattr(self, operation)()
+            except self.NothingToDo as prerequisite:
+                operation = prerequisite.args[0]  # Nothing to act on yet; do the prerequisite instead.
+            except Exception as e:
+                self.stats[operation].record(time.perf_counter() - started, error=e)
+                return
+            else:
+                self.stats[operation].record(time.perf_counter() - started)
+                return
+
+    #
+    # Driver
+    #
+
+    def run(self, rate: float, duration: float) -> float:
+        operations, weights = zip(*self.mix.items())
+        interval = 1 / rate
+        started = next_dispatch = time.perf_counter()
+        while next_dispatch - started < duration:
+            now = time.perf_counter()
+            if now < next_dispatch:
+                time.sleep(next_dispatch - now)
+            elif now - next_dispatch > interval:
+                self.late_dispatches += 1
+            operation, = random.choices(operations, weights=weights)
+            self.executor.submit(self._timed, operation)
+            next_dispatch += interval
+        self.executor.shutdown(wait=True)
+        return time.perf_counter() - started
+
+    def report(self, elapsed: float) -> dict:
+        return {'elapsed': elapsed,
+                'late_dispatches': self.late_dispatches,
+                'operations': {name: stats.summary(elapsed) for name, stats in self.stats.items()}}
+
+
+def paint_report(report: dict) -> None:
+    header = f"{'operation':<10}{'attempts':>10}{'ops/s':>10}{'errors':>10}" \
+             + ''.join(f"{f'p{p} (ms)':>12}" for p in PERCENTILES)
+    click.secho(f"\nCompleted in {report['elapsed']:.1f}s", bold=True)
+    click.secho(header, bold=True)
+    for name, summary in report['operations'].items():
+        row = f"{name:<10}{summary['attempts']:>10}{summary['throughput']:>10.2f}{summary['error_rate']:>10.1%}" \
+              + ''.join(f"{summary[f'p{p}'] * 1000:>12.1f}" for p in PERCENTILES)
+        click.echo(row)
+        for error, count in summary['errors'].items():
+            click.secho(f"    {error}: {count}", fg='red')
+    if report['late_dispatches']:
+        click.secho(f"Fell behind the target rate {report['late_dispatches']} times; "
+                    f"consider raising --workers.", fg='yellow')
+
+
+def spin_up_fleet(quantity: int, starting_port: int) -> list:
+    env = {**os.environ, 'NUCYPHER_SENTRY_LOGS': '0', 'NUCYPHER_FILE_LOGS': '0'}
+    base_args = ['nucypher', 'ursula', 'run', '--dev', '--federated-only']
+    processes = list()
+    for port in range(starting_port, starting_port + quantity):
+        if port == starting_port:
+            args = base_args + ['--rest-port', str(port), '--lonely']
+        else:
+            args = base_args + ['--rest-port', str(port), '--teacher', f'localhost:{starting_port}']
+        processes.append(subprocess.Popen(args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+    return processes
+
+
+def parse_mix(mix: str) -> dict:
+    weights = dict()
+    for term in mix.split(','):
+        operation, weight = term.split('=')
+        if operation not in OPERATIONS:
+            raise click.BadParameter(f"Unknown operation '{operation}'; choose from {', '.join(OPERATIONS)}")
+        weights[operation] = float(weight)
+    return weights
+
+
+@click.command()
+@click.option('--ursulas', help="Number of federated Ursulas to run on localhost", type=click.INT, default=5)
+@click.option('--alices', help="Number of granting Alices", type=click.INT, default=2)
+@click.option('--bobs', help="Number of retrieving Bobs", type=click.INT, default=4)
+@click.option('--rate', help="Target operations per second", type=click.FLOAT, default=2.0)
+@click.option('--duration', help="Seconds of load to generate", type=click.FLOAT, default=60.0)
+@click.option('--mix', help="Relative weights of each operation", type=click.STRING, default=DEFAULT_MIX)
+@click.option('-m', 'm', help="Policy threshold", type=click.INT, default=2)
+@click.option('-n', 'n', help="Policy shares", type=click.INT, default=3)
+@click.option('--workers', help="Maximum number of concurrent operations", type=click.INT, default=16)
+@click.option('--starting-port', help="REST port of the first (seed) Ursula", type=click.INT, default=FLEET_STARTING_PORT)
+@click.option('--no-fleet', help="Use an already-running fleet instead of starting one", is_flag=True)
+@click.option('--json-output', help="Also write the report to this file", type=click.Path())
+def generate_fleet_load(ursulas, alices, bobs, rate, duration, mix, m, n, workers,
+                        starting_port, no_fleet, json_output):
+    mix = parse_mix(mix)
+    processes = list() if no_fleet else spin_up_fleet(quantity=ursulas, starting_port=starting_port)
+    try:
+        click.secho(f"Preparing {alices} Alices and {bobs} Bobs...", fg='blue')
+        generator = FleetLoadGenerator(seed_uri=f'localhost:{starting_port}',
+                                       alices=alices, bobs=bobs,
+                                       m=m, n=n, mix=mix, workers=workers)
+        click.secho(f"Generating {rate} ops/s for {duration}s...", fg='blue')
+        elapsed = generator.run(rate=rate, duration=duration)
+    finally:
+        for process in processes:
+            process.terminate()
+
+    report = generator.report(elapsed)
+    paint_report(report)
+    if json_output:
+        with open(json_output, 'w') as report_file:
+            json.dump(report, report_file, indent=4)
+    sys.exit(1 if any(stats['errors'] for stats in report['operations'].values()) else 0)
+
+
+if __name__ == "__main__":
+    generate_fleet_load()
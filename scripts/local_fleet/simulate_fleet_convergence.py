@@ -0,0 +1,77 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+# Simulates an in-process federated fleet learning about itself on a virtual clock,
+# and reports how long (in simulated seconds) and how many bytes and how much
+# deserialization time it takes to converge on a single fleet state.
+#
+#     python3 scripts/local_fleet/simulate_fleet_convergence.py --ursulas 1000 --initial-peers 3
+
+
+import json
+
+import click
+
+from nucypher.utilities.sandbox.simulation import FleetSimulation
+
+
+@click.command()
+@click.option('--ursulas', help="Number of simulated Ursulas", type=click.IntRange(min=2), default=100)
+@click.option('--initial-peers', help="Number of nodes each Ursula knows at startup (including the seed)",
+              type=click.IntRange(min=1), default=1)
+@click.option('--max-virtual-seconds', help="Give up after this much simulated time", type=click.FLOAT, default=3600)
+@click.option('--sample-every', help="Simulated seconds between timeline samples", type=click.FLOAT, default=30)
+@click.option('--seed', help="Random seed for the initial topology and learning offsets", type=click.INT)
+@click.option('--json-output', help="Also write the report to this file", type=click.Path())
+def simulate_fleet_convergence(ursulas, initial_peers, max_virtual_seconds, sample_every, seed, json_output):
+    simulation = FleetSimulation(quantity=ursulas, initial_peers=initial_peers, seed=seed)
+
+    click.secho(f"Spawning {ursulas} Ursulas...", fg='blue')
+    simulation.spawn()
+    click.secho("Learning...", fg='blue')
+    report = simulation.run(max_virtual_seconds=max_virtual_seconds, sample_every=sample_every)
+
+    for sample in report['timeline']:
+        click.echo(f"t={sample['virtual_time']:>7.0f}s  "
+                   f"rounds={sample['learning_rounds']:>6}  "
+                   f"bytes={sample['bytes_exchanged']:>12}  "
+                   f"deserialization={sample['deserialization_seconds']:>8.3f}s  "
+                   f"converged={sample['converged_nodes']:>6}/{ursulas}  "
+                   f"fleet states={sample['fleet_states']}")
+
+    if report['converged']:
+        click.secho(f"\nConverged after {report['convergence_time']:.0f} simulated seconds "
+                    f"({report['wall_clock_seconds']:.1f}s of wall clock)", fg='green', bold=True)
+    else:
+        click.secho(f"\nDid not converge within {max_virtual_seconds:.0f} simulated seconds", fg='red', bold=True)
+
+    click.echo(f"Learning rounds: {report['learning_rounds']} ({report['learning_errors']} errors)")
+    click.echo(f"Requests: {report['requests']}")
+    click.echo(f"Bytes exchanged: {report['bytes_sent'] + report['bytes_received']} "
+               f"({report['bytes_per_round']:.0f} per round)")
+    click.echo(f"Deserialization: {report['deserialization_seconds']:.3f}s "
+               f"({report['deserialization_seconds_per_round'] * 1000:.3f}ms per round)")
+
+    if json_output:
+        with open(json_output, 'w') as report_file:
+            json.dump(report, report_file, indent=4)
+
+
+if __name__ == "__main__":
+    simulate_fleet_convergence()
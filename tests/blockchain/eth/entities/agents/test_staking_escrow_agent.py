@@ -108,6 +108,43 @@ def test_get_all_stakes(testerchain, agency, token_economics):
     assert token_economics.maximum_allowed_locked > value > token_economics.minimum_allowed_locked
 
 
+@pytest.mark.slow()
+def test_get_stakes_of_stakers(testerchain, agency):
+    _token_agent, staking_agent, _policy_agent = agency
+    staker_account, *other_accounts = testerchain.unassigned_accounts
+
+    all_stakes = staking_agent.get_stakes_of_stakers(staker_addresses=[staker_account, *other_accounts])
+    assert set(all_stakes) == {staker_account, *other_accounts}
+    for address in other_accounts:
+        assert all_stakes[address] == list()
+
+    # Compare with sub-stakes read one call at a time
+    functions = staking_agent.contract.functions
+    expected_stakes = list()
+    for index in range(functions.getSubStakesLength(staker_account).call()):
+        first_period, *others, locked_value = functions.getSubStakeInfo(staker_account, index).call()
+        last_period = functions.getLastPeriodOfSubStake(staker_account, index).call()
+        expected_stakes.append((first_period, last_period, locked_value))
+    assert expected_stakes
+    assert all_stakes[staker_account] == expected_stakes
+
+
+@pytest.mark.slow()
+def test_batch_call(testerchain, agency):
+    _token_agent, staking_agent, _policy_agent = agency
+    staker_account = testerchain.unassigned_accounts[0]
+
+    functions = staking_agent.contract.functions
+    calls = [functions.getCurrentPeriod(),
+             functions.getSubStakesLength(staker_account),
+             functions.getSubStakeInfo(staker_account, 0),
+             functions.getWorkerFromStaker(staker_account)]
+
+    results = testerchain.batch_call(calls)
+    assert results == [call.call() for call in calls]
+    assert testerchain.batch_call([]) == []
+
+
 @pytest.mark.slow()
 def test_stakers_and_workers_relationships(testerchain, agency):
     _token_agent, staking_agent, _policy_agent = agency
@@ -130,6 +167,30 @@ def test_stakers_and_workers_relationships(testerchain, agency):
     assert BlockchainInterface.NULL_ADDRESS == staking_agent.get_staker_from_worker(worker_address=random_address)
 
 
+@pytest.mark.slow()
+def test_read_cache(testerchain, agency):
+    _token_agent, staking_agent, _policy_agent = agency
+    staker_account = testerchain.unassigned_accounts[0]
+
+    read_cache = staking_agent.read_cache
+    read_cache.clear()
+
+    worker = staking_agent.get_worker_from_staker(staker_address=staker_account)
+    misses = read_cache.misses
+    hits = read_cache.hits
+
+    # Same call within the same block is served from the cache
+    assert worker == staking_agent.get_worker_from_staker(staker_account)
+    assert read_cache.hits == hits + 1
+    assert read_cache.misses == misses
+
+    # A new block invalidates prior results
+    period = staking_agent.get_current_period()
+    testerchain.time_travel(periods=1)
+    assert staking_agent.get_current_period() == period + 1
+    assert read_cache.stats['block_number'] == testerchain.client.block_number
+
+
 @pytest.mark.slow()
 def test_get_staker_population(agency, stakers):
     _token_agent, staking_agent, _policy_agent = agency
@@ -0,0 +1,112 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import pytest
+from web3 import HTTPProvider
+
+from nucypher.blockchain.eth.interfaces import BlockchainInterface
+
+
+def read_calls(testerchain, agency):
+    _token_agent, staking_agent, _policy_agent = agency
+    staker_account = testerchain.unassigned_accounts[0]
+    functions = staking_agent.contract.functions
+    return [functions.getCurrentPeriod(),
+            functions.getSubStakesLength(staker_account),
+            functions.getSubStakeInfo(staker_account, 0),
+            functions.getWorkerFromStaker(staker_account)]
+
+
+def raw_call(testerchain, contract_function):
+    call = {'to': contract_function.address, 'data': contract_function._encode_transaction_data()}
+    return testerchain.client.w3.eth.call(call)
+
+
+@pytest.fixture()
+def http_testerchain(testerchain, mocker):
+    """The test chain, as if it were reached over HTTP; JSON-RPC batch requests are for each test to answer."""
+    mocker.patch.object(testerchain, '_provider', HTTPProvider('http://localhost:8545'))
+    post = mocker.patch('nucypher.blockchain.eth.interfaces.requests.post')
+    return testerchain, post
+
+
+def answer_batches(mocker, post, make_response):
+    def respond(_endpoint_uri, json, **kwargs):
+        response = mocker.Mock()
+        response.json.return_value = make_response(json)
+        return response
+    post.side_effect = respond
+
+
+@pytest.mark.slow()
+def test_json_rpc_batch_call(http_testerchain, agency, mocker):
+    testerchain, post = http_testerchain
+    calls = read_calls(testerchain, agency)
+    expected_results = [call.call() for call in calls]
+    raw_results = {call.address + call._encode_transaction_data(): raw_call(testerchain, call) for call in calls}
+
+    def make_response(batch):
+        response = list()
+        for request in batch:
+            call, block_identifier = request['params']
+            assert block_identifier == 'latest'
+            result = raw_results[call['to'] + call['data']]
+            response.append({'jsonrpc': '2.0', 'id': request['id'], 'result': result.hex()})
+        return list(reversed(response))  # Responses may come back in any order
+
+    answer_batches(mocker, post, make_response)
+    mocker.patch.object(BlockchainInterface, 'CALL_BATCH_SIZE', 3)
+
+    assert testerchain.batch_call(calls) == expected_results
+    assert post.call_count == 2  # 4 calls, in batches of 3
+
+
+@pytest.mark.slow()
+@pytest.mark.parametrize('failure', ({'error': {'code': -32000, 'message': 'execution reverted'}}, {}))
+def test_json_rpc_batch_call_failures(http_testerchain, agency, mocker, failure):
+    testerchain, post = http_testerchain
+    calls = read_calls(testerchain, agency)
+
+    def make_response(batch):
+        response = [{'jsonrpc': '2.0', 'id': request['id'], 'result': '0x' + '00' * 32} for request in batch]
+        failed_request = response.pop(1)
+        if failure:
+            response.append({'jsonrpc': '2.0', 'id': failed_request['id'], **failure})
+        return response
+
+    answer_batches(mocker, post, make_response)
+
+    with pytest.raises(BlockchainInterface.BatchCallFailed):
+        testerchain.batch_call(calls)
+
+
+@pytest.mark.slow()
+def test_multicall_batch_call(testerchain, agency, mocker):
+    calls = read_calls(testerchain, agency)
+    expected_results = [call.call() for call in calls]
+
+    multicall = mocker.Mock()
+    aggregate = multicall.functions.aggregate
+    aggregate.return_value.call.return_value = (1, [raw_call(testerchain, call) for call in calls])
+    make_contract = mocker.patch.object(testerchain.client.w3.eth, 'contract', return_value=multicall)
+
+    multicall_address = testerchain.unassigned_accounts[-1]
+    mocker.patch.object(testerchain, 'multicall_address', multicall_address)
+
+    assert testerchain.batch_call(calls, block_identifier=3) == expected_results
+    assert make_contract.call_args[1]['address'] == multicall_address
+    aggregate.assert_called_once_with([(call.address, call._encode_transaction_data()) for call in calls])
+    aggregate.return_value.call.assert_called_once_with(block_identifier=3)
@@ -0,0 +1,59 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from nucypher.blockchain.eth.constants import DISPATCHER_CONTRACT_NAME, STAKING_ESCROW_CONTRACT_NAME
+
+
+def test_contracts_are_cached(testerchain, agency):
+    token_agent, staking_agent, _policy_agent = agency
+
+    contract = testerchain.get_contract_by_name(name=STAKING_ESCROW_CONTRACT_NAME, proxy_name=DISPATCHER_CONTRACT_NAME)
+    assert contract.address == staking_agent.contract_address
+    assert contract is testerchain.get_contract_by_name(name=STAKING_ESCROW_CONTRACT_NAME,
+                                                         proxy_name=DISPATCHER_CONTRACT_NAME)
+
+    # Contract classes are shared between contracts with the same ABI
+    other = testerchain.get_contract_at(address=token_agent.contract_address, abi=contract.abi)
+    assert other.address == token_agent.contract_address
+    assert type(other) is type(contract)
+
+
+def test_proxy_targets_are_cached(testerchain, agency, mocker):
+    token_agent, staking_agent, _policy_agent = agency
+    spy = mocker.spy(testerchain.client.w3.eth, 'call')
+
+    def get_staking_escrow():
+        return testerchain.get_contract_by_name(name=STAKING_ESCROW_CONTRACT_NAME, proxy_name=DISPATCHER_CONTRACT_NAME)
+
+    # Deployer interfaces always read the current targets (one per registered dispatcher)
+    get_staking_escrow()
+    reads_per_lookup = spy.call_count
+    assert reads_per_lookup >= 1
+    get_staking_escrow()
+    assert spy.call_count == 2 * reads_per_lookup
+
+    testerchain.PROXY_TARGET_STALENESS = 60
+    try:
+        get_staking_escrow()
+        assert get_staking_escrow().address == staking_agent.contract_address
+        assert spy.call_count == 3 * reads_per_lookup
+
+        # Unless asked to
+        testerchain.refresh_proxy_targets()
+        get_staking_escrow()
+        assert spy.call_count == 4 * reads_per_lookup
+    finally:
+        del testerchain.PROXY_TARGET_STALENESS
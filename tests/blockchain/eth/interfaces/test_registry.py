@@ -14,9 +14,12 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import json
+
 import pytest
 
 from nucypher.blockchain.eth.interfaces import EthereumContractRegistry
+from nucypher.blockchain.eth.registry import AllocationRegistry, InMemoryAllocationRegistry
 
 
 def test_contract_registry(tempfile_path):
@@ -69,3 +72,48 @@ def test_contract_registry(tempfile_path):
     # Check that searching for an unknown contract raises
     with pytest.raises(EthereumContractRegistry.IllegalRegistry):
         test_registry.search(contract_address=test_addr)
+
+
+def test_contract_registry_reads_are_cached(tempfile_path, mocker):
+    test_registry = EthereumContractRegistry(registry_filepath=tempfile_path)
+    test_registry.enroll(contract_name='TestContract', contract_address='0xDEADBEEF', contract_abi=['fake', 'data'])
+
+    spy = mocker.spy(test_registry, '_read')
+    for _ in range(5):
+        test_registry.search(contract_name='TestContract')
+        test_registry.search(contract_address='0xDEADBEEF')
+        assert list(test_registry.enrolled_names) == ['TestContract']
+    assert spy.call_count == 1
+
+    # Callers get their own copy of the registry's records
+    registry_data = test_registry.read()
+    registry_data.append(['AnotherContract', '0xBEEFDEAD', []])
+    with pytest.raises(EthereumContractRegistry.UnknownContract):
+        test_registry.search(contract_name='AnotherContract')
+
+    # Enrollment invalidates the cache...
+    test_registry.enroll(contract_name='AnotherContract', contract_address='0xBEEFDEAD', contract_abi=[])
+    assert test_registry.search(contract_address='0xBEEFDEAD')[0] == 'AnotherContract'
+
+    # ...and so do changes made to the registry file by others
+    with open(tempfile_path, 'w') as registry_file:
+        registry_file.write(json.dumps([['ThirdContract', '0xFEEDBEEF', []]]))
+    assert test_registry.search(contract_name='ThirdContract') == [('ThirdContract', '0xFEEDBEEF', [])]
+    with pytest.raises(EthereumContractRegistry.UnknownContract):
+        test_registry.search(contract_name='TestContract')
+
+
+def test_allocation_registry_search():
+    allocation_registry = InMemoryAllocationRegistry()
+    for index in range(100):
+        allocation_registry.enroll(beneficiary_address=f'0xBENEFICIARY{index}',
+                                   contract_address=f'0xESCROW{index}',
+                                   contract_abi=['fake', 'data'])
+
+    assert allocation_registry.search(beneficiary_address='0xBENEFICIARY42') == ['0xESCROW42', ['fake', 'data']]
+    assert allocation_registry.search(contract_address='0xESCROW42') == ['0xESCROW42', ['fake', 'data']]
+
+    with pytest.raises(AllocationRegistry.UnknownBeneficiary):
+        allocation_registry.search(beneficiary_address='0xSTRANGER')
+    with pytest.raises(AllocationRegistry.UnknownContract):
+        allocation_registry.search(contract_address='0xSTRANGER')
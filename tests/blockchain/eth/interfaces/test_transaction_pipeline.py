@@ -0,0 +1,127 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import pytest
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+
+from nucypher.blockchain.eth.transactions import NonceAllocator, TransactionPipeline
+from nucypher.crypto.powers import TransactingPower
+from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD
+
+
+def test_nonce_allocator():
+    pending_counts = {'alice': 3, 'bob': 0}
+    allocator = NonceAllocator(get_pending_transaction_count=pending_counts.get)
+
+    assert allocator.allocate('alice') == [3]
+    assert allocator.allocate('alice', quantity=2) == [4, 5]
+    assert allocator.allocate('bob') == [0]
+
+    # Transactions sent by someone else are accounted for
+    pending_counts['alice'] = 10
+    assert allocator.allocate('alice') == [10]
+
+    # After a reset, the chain's count is used again
+    allocator.reset('alice')
+    pending_counts['alice'] = 7
+    assert allocator.allocate('alice') == [7]
+
+
+def test_pipelined_transfers(testerchain, agency):
+    token_agent, _staking_agent, _policy_agent = agency
+    origin, *everybody_else = testerchain.client.accounts
+    recipients = everybody_else[:5]
+
+    testerchain.transacting_power = TransactingPower(blockchain=testerchain,
+                                                     password=INSECURE_DEVELOPMENT_PASSWORD,
+                                                     account=origin)
+    testerchain.transacting_power.activate()
+
+    first_nonce = testerchain.client.w3.eth.getTransactionCount(origin, 'pending')
+    transfers = ((token_agent.contract.functions.transfer(recipient, 1), origin, None) for recipient in recipients)
+    receipts = testerchain.send_transactions(transfers)
+
+    assert len(receipts) == len(recipients)
+    assert all(receipt['status'] == 1 for receipt in receipts)
+    assert testerchain.client.w3.eth.getTransactionCount(origin) == first_nonce + len(recipients)
+
+    nonces = [testerchain.client.get_transaction(receipt['transactionHash'])['nonce'] for receipt in receipts]
+    assert nonces == list(range(first_nonce, first_nonce + len(recipients)))
+    for recipient in recipients:
+        assert token_agent.get_balance(recipient) >= 1
+
+    # Transaction hashes are known before broadcasting
+    with testerchain.transaction_pipeline() as pipeline:
+        transaction = pipeline.sign(token_agent.contract.functions.transfer(recipients[0], 1), sender_address=origin)
+        pipeline.broadcast(transaction)
+    assert pipeline.receipts[0]['transactionHash'] == transaction.txhash
+    assert transaction.nonce == first_nonce + len(recipients)
+
+    # Sequential sends share the same nonces
+    receipt = token_agent.transfer(amount=1, target_address=recipients[0], sender_address=origin)
+    assert testerchain.client.get_transaction(receipt['transactionHash'])['nonce'] == transaction.nonce + 1
+
+
+def test_nonces_are_reset_after_unconfirmed_transactions(testerchain, agency, mocker):
+    token_agent, _staking_agent, _policy_agent = agency
+    origin, recipient, *everybody_else = testerchain.client.accounts
+
+    testerchain.transacting_power = TransactingPower(blockchain=testerchain,
+                                                     password=INSECURE_DEVELOPMENT_PASSWORD,
+                                                     account=origin)
+    testerchain.transacting_power.activate()
+    next_nonce = testerchain.client.w3.eth.getTransactionCount(origin, 'pending')
+
+    # The node drops the transaction, so it's never mined
+    mocker.patch.object(testerchain.client, 'send_raw_transaction', return_value=HexBytes(bytes(32)))
+    mocker.patch.object(testerchain.client, 'wait_for_receipt', side_effect=TimeExhausted)
+    with pytest.raises(TimeExhausted):
+        token_agent.transfer(amount=1, target_address=recipient, sender_address=origin)
+    mocker.stopall()
+
+    # The next transaction doesn't wait behind the dropped one's nonce
+    receipt = token_agent.transfer(amount=1, target_address=recipient, sender_address=origin)
+    assert testerchain.client.get_transaction(receipt['transactionHash'])['nonce'] == next_nonce
+
+
+def test_pipeline_reports_failures():
+
+    class RevertingChain:
+        InterfaceError = RuntimeError
+
+        class client:
+            send_raw_transaction = staticmethod(lambda raw: raw)
+
+        def __init__(self):
+            self.nonces = NonceAllocator(get_pending_transaction_count=lambda sender: 0)
+
+        def _sign_transaction(self, contract_function, sender_address, nonce, payload=None):
+            return bytes([nonce]), contract_function
+
+        def _confirm_transaction(self, txhash, transaction_name, sender_address):
+            if transaction_name == 'REVERT':
+                raise self.InterfaceError(f"Transaction {txhash} reverted")
+            return {'transactionHash': txhash, 'status': 1}
+
+    with pytest.raises(TransactionPipeline.TransactionFailed):
+        with TransactionPipeline(blockchain=RevertingChain()) as pipeline:
+            succeeding = pipeline.submit('TRANSFER', sender_address='alice')
+            failing = pipeline.submit('REVERT', sender_address='alice')
+
+    assert succeeding.result() == {'transactionHash': b'\x00', 'status': 1}
+    assert isinstance(failing.exception(), RuntimeError)
+    assert len(pipeline) == 2
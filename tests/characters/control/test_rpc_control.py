@@ -66,6 +66,26 @@ def test_alice_rpc_character_control_derive_policy_encrypting_key(alice_rpc_test
                                            specification=alice_specification)
 
 
+def test_rpc_batch_responses_are_ordered_and_isolated(alice_rpc_test_client):
+    derive = {'method': 'derive_policy_encrypting_key', 'params': {'label': 'test'}}
+    bogus = {'method': 'no_such_method', 'params': {}}
+    batch = [derive] * 10 + [bogus] + [derive] * 10
+
+    rpc_responses = alice_rpc_test_client.send(request=batch)
+    assert len(rpc_responses) == len(batch)
+
+    # The failed request doesn't take the rest of the batch down with it...
+    failed_response = rpc_responses[10]
+    assert failed_response.error_code == -32601
+
+    # ...and the rest are answered in request order.
+    successful_responses = rpc_responses[:10] + rpc_responses[11:]
+    assert all(response.success for response in successful_responses)
+    response_ids = [response.id for response in successful_responses]
+    assert response_ids == sorted(response_ids)
+    assert response_ids[-1] - response_ids[0] == len(batch) - 1
+
+
 def test_alice_rpc_character_control_grant(alice_rpc_test_client, grant_control_request):
     method_name, params = grant_control_request
     request_data = {'method': method_name, 'params': params}
@@ -15,6 +15,8 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from bytestring_splitter import VariableLengthBytestring
+
 from nucypher.characters.lawful import Ursula
 
 
@@ -23,3 +25,32 @@ def test_serialize_ursula(federated_ursulas):
     ursula_as_bytes = bytes(ursula)
     ursula_object = Ursula.from_bytes(ursula_as_bytes, federated_only=True)
     assert ursula == ursula_object
+
+
+def test_batch_from_bytes_filters_before_deserializing(federated_ursulas):
+    ursulas = list(federated_ursulas)
+    chosen_one = ursulas[0]
+
+    checksum_address, timestamp, domains = Ursula.peek_bytes(bytes(chosen_one)[2:])  # Strip the version
+    assert checksum_address == chosen_one.checksum_address
+    assert timestamp == chosen_one.timestamp
+    assert domains == set(chosen_one.serving_domains)
+
+    # Duplicate entries are only materialized once.
+    payload = b''.join(bytes(VariableLengthBytestring(bytes(u))) for u in ursulas + [chosen_one])
+    assert len(Ursula.batch_from_bytes(payload, federated_only=True)) == len(ursulas)
+
+    peeked = []
+
+    def node_filter(checksum_address, timestamp, domains):
+        peeked.append(checksum_address)
+        return checksum_address == chosen_one.checksum_address
+
+    strangers = Ursula.batch_from_bytes(payload, federated_only=True, node_filter=node_filter)
+    assert len(peeked) == len(ursulas)
+    assert strangers == [chosen_one]
+
+    # The certificate survives the round trip.
+    stranger = strangers[0]
+    assert bytes(stranger) == bytes(chosen_one)
+    assert stranger.certificate == chosen_one.certificate
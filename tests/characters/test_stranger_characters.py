@@ -0,0 +1,79 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+
+from umbral.keys import UmbralPrivateKey
+
+from nucypher.characters.base import StrangerCache
+from nucypher.characters.lawful import Alice, Bob
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.network.nicknames import nickname_from_seed
+
+
+def test_strangers_are_remembered_by_verifying_key(federated_bob):
+    Bob._stranger_cache.clear()
+    bobs_verifying_key = federated_bob.stamp.as_umbral_pubkey()
+
+    stranger_bob = Bob.from_public_keys(verifying_key=bobs_verifying_key, federated_only=True)
+    assert Bob.from_public_keys(verifying_key=bobs_verifying_key, federated_only=True) is stranger_bob
+    assert stranger_bob.stamp == federated_bob.stamp
+
+    # Each Character keeps its own strangers.
+    stranger_alice = Alice.from_public_keys(verifying_key=bobs_verifying_key, federated_only=True)
+    assert stranger_alice is not stranger_bob
+    assert isinstance(stranger_alice, Alice)
+
+    # Strangers built from more than a verifying key are not cached.
+    fully_specified = Bob.from_public_keys(verifying_key=bobs_verifying_key,
+                                           encrypting_key=federated_bob.public_keys(DecryptingPower),
+                                           federated_only=True)
+    assert fully_specified is not stranger_bob
+
+
+def test_stranger_cache_evicts_least_recently_used():
+    cache = StrangerCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' is now the oldest
+    cache.put('c', 3)
+
+    assert 'b' not in cache
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_stranger_nickname_is_derived_lazily():
+    verifying_key = UmbralPrivateKey.gen_key().get_pubkey()
+    stranger = Bob.from_public_keys(verifying_key=verifying_key, federated_only=True)
+    assert stranger._nickname is None
+
+    nickname = stranger.nickname
+    assert nickname
+    assert stranger._nickname == nickname
+    assert stranger.nickname_metadata
+
+
+def test_nickname_from_seed_leaves_global_random_alone():
+    random.seed(42)
+    expected = random.random()
+
+    random.seed(42)
+    first = nickname_from_seed("0xdeadbeef")
+    second = nickname_from_seed("0xdeadbeef")
+    assert random.random() == expected
+    assert first == second
@@ -1,5 +1,6 @@
 import os
 
+import pytest
 import pytest_twisted
 from twisted.internet import threads
 from twisted.internet.task import Clock
@@ -11,6 +12,7 @@ from nucypher.blockchain.eth.token import NU
 from nucypher.characters.chaotic import Felix
 from nucypher.cli.main import nucypher_cli
 from nucypher.config.characters import FelixConfiguration
+from nucypher.keystore.threading import ThreadedSession
 from nucypher.utilities.sandbox.constants import (
     TEMPORARY_DOMAIN,
     TEST_PROVIDER_URI,
@@ -93,6 +95,8 @@ def test_run_felix(click_runner,
         return run_result
 
     # A (mocked) client requests Felix's services
+    felixes = list()
+
     def request_felix_landing_page(_result):
 
         # Init an equal Felix to the already running one.
@@ -101,6 +105,7 @@ def test_run_felix(click_runner,
         felix_config.attach_keyring()
         felix_config.keyring.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
         felix = felix_config.produce()
+        felixes.append(felix)
 
         # Make a flask app
         web_app = felix.make_web_app()
@@ -145,7 +150,110 @@ def test_run_felix(click_runner,
         # new_eth_balance = original_eth_balance + testerchain.w3.fromWei(Felix.ETHER_AIRDROP_AMOUNT, 'ether')
         assert staker.eth_balance == original_eth_balance
 
+        # Every journaled disbursement was settled
+        felix, = felixes
+        with ThreadedSession(felix.db_engine) as session:
+            assert session.query(felix.Disbursement).count() == 0
+
     staged_airdrops = Felix._AIRDROP_QUEUE
     next_airdrop = staged_airdrops[0]
     next_airdrop.addCallback(confirm_airdrop)
     yield next_airdrop
+
+
+@pytest.fixture()
+def felix_configuration_file(click_runner, testerchain, agency, mock_primary_registry_filepath, tmpdir, mocker):
+    """A Felix configured from scratch, with its database created, in a configuration root of its own."""
+    os.environ['NUCYPHER_FELIX_DB_SECRET'] = INSECURE_DEVELOPMENT_PASSWORD
+
+    # Simulate "Reconnection"
+    real_attach_provider = BlockchainDeployerInterface._attach_provider
+    cached_blockchain = BlockchainDeployerInterface.reconnect()
+    cached_blockchain.registry.commit(filepath=mock_primary_registry_filepath)
+
+    def attach_cached_provider(interface, *args, **kwargs):
+        real_attach_provider(interface, provider=cached_blockchain.provider)
+    mocker.patch.object(BlockchainDeployerInterface, '_attach_provider', attach_cached_provider)
+
+    # Mock live contract registry reads
+    mocker.patch.object(EthereumContractRegistry, 'read', lambda *a, **kw: cached_blockchain.registry.read())
+
+    envvars = {'NUCYPHER_KEYRING_PASSWORD': INSECURE_DEVELOPMENT_PASSWORD,
+               'NUCYPHER_FELIX_DB_SECRET': INSECURE_DEVELOPMENT_PASSWORD}
+    config_root = str(tmpdir.mkdir('felix'))
+
+    init_args = ('felix', 'init',
+                 '--registry-filepath', mock_primary_registry_filepath,
+                 '--checksum-address', testerchain.client.accounts[0],
+                 '--config-root', config_root,
+                 '--network', TEMPORARY_DOMAIN,
+                 '--no-registry',
+                 '--provider', TEST_PROVIDER_URI)
+    result = click_runner.invoke(nucypher_cli, init_args, catch_exceptions=False, env=envvars)
+    assert result.exit_code == 0
+
+    configuration_file_location = os.path.join(config_root, FelixConfiguration.generate_filename())
+    db_args = ('felix', 'createdb',
+               '--registry-filepath', mock_primary_registry_filepath,
+               '--config-file', configuration_file_location,
+               '--provider', TEST_PROVIDER_URI)
+    result = click_runner.invoke(nucypher_cli, db_args, catch_exceptions=False, env=envvars)
+    assert result.exit_code == 0
+
+    return configuration_file_location
+
+
+@pytest_twisted.inlineCallbacks
+def test_felix_settles_interrupted_airdrops(testerchain, felix_configuration_file, mocker):
+    felix_config = FelixConfiguration.from_configuration_file(filepath=felix_configuration_file)
+    felix_config.attach_keyring()
+    felix_config.keyring.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
+    felix = felix_config.produce()
+    felix.make_web_app()
+
+    # One journaled disbursement was mined, one was never mined, and one is still pending.
+    mined_txhash = testerchain.client.send_transaction({'from': testerchain.client.accounts[0],
+                                                        'to': testerchain.client.accounts[1],
+                                                        'value': 1})
+    never_mined_txhash = '0x' + 'ab' * 32
+    pending_txhash = '0x' + 'cd' * 32
+
+    real_get_transaction = felix.blockchain.client.get_transaction
+
+    def get_transaction(transaction_hash):
+        if transaction_hash == pending_txhash:
+            return {'hash': pending_txhash, 'blockNumber': None}
+        return real_get_transaction(transaction_hash)
+    mocker.patch.object(felix.blockchain.client, 'get_transaction', side_effect=get_transaction)
+
+    amount = NU(1, 'NU').to_nunits()
+    mined, never_mined, pending = testerchain.client.accounts[1:4]
+    journal = ((mined, mined_txhash.hex()), (never_mined, never_mined_txhash), (pending, pending_txhash))
+    with ThreadedSession(felix.db_engine) as session:
+        for nonce, (address, txhash) in enumerate(journal):
+            recipient = felix.Recipient(address=address)
+            session.add(recipient)
+            session.flush()
+            session.add(felix.Disbursement(recipient_id=recipient.id, txhash=txhash, amount=str(amount), nonce=nonce))
+        session.commit()
+
+    do_airdrop = mocker.patch.object(felix, '_Felix__do_airdrop')
+    yield felix.airdrop_tokens()
+
+    with ThreadedSession(felix.db_engine) as session:
+        journal = session.query(felix.Disbursement).all()
+        assert [entry.txhash for entry in journal] == [pending_txhash]
+
+        # The mined disbursement was credited, and its recipient isn't due another one yet
+        credited = session.query(felix.Recipient).filter_by(address=mined).one()
+        assert int(credited.total_received) == amount
+        assert credited.last_disbursement_time is not None
+
+        # The never-mined disbursement was forgotten, so its recipient is airdropped again
+        forgotten = session.query(felix.Recipient).filter_by(address=never_mined).one()
+        assert int(forgotten.total_received) == 0
+
+    candidates = {candidate.address for candidate in do_airdrop.call_args[1]['candidates']}
+    assert never_mined in candidates
+    assert mined not in candidates
+    assert pending not in candidates  # Still pending; Skipped until it's settled
@@ -30,14 +30,14 @@ def test_echo_nucypher_version(click_runner):
 
 @pytest.mark.parametrize('command', (('--help', ), tuple()))
 def test_nucypher_help_message(click_runner, command):
-    entry_points = {command.name for command in ENTRY_POINTS}
+    entry_points = set(ENTRY_POINTS)
     result = click_runner.invoke(nucypher_cli, tuple(), catch_exceptions=False)
     assert result.exit_code == 0
     assert '[OPTIONS] COMMAND [ARGS]' in result.output, 'Missing or invalid help text was produced.'
     assert all(e in result.output for e in entry_points)
 
 
-@pytest.mark.parametrize('entry_point', tuple(command.name for command in ENTRY_POINTS))
+@pytest.mark.parametrize('entry_point', tuple(ENTRY_POINTS))
 def test_character_help_messages(click_runner, entry_point):
     help_args = (entry_point, '--help')
     result = click_runner.invoke(nucypher_cli, help_args, catch_exceptions=False)
@@ -73,6 +73,23 @@ def test_ursula_command_help(protocol, ursula):
     assert protocol.prompt in FakeTransport.mock_output
 
 
+def test_ursula_command_arguments(protocol, ursula, mocker):
+    protocol.transport = mocker.Mock()
+
+    with capture_output() as (out, err):
+        protocol.lineReceived(line=b'cycle_teacher now')
+    assert "Invalid arguments for 'cycle_teacher'" in out.getvalue()
+
+    with capture_output() as (out, err):
+        protocol.lineReceived(line=b'profile soon')
+    assert "positive number of seconds" in out.getvalue()
+
+    # Errors raised by the command itself aren't mistaken for bad arguments
+    mocker.patch.object(ursula, 'cycle_teacher_node', side_effect=TypeError("Not an argument error"))
+    with pytest.raises(TypeError, match="Not an argument error"):
+        protocol.lineReceived(line=b'cycle_teacher')
+
+
 def test_ursula_command_status(protocol, ursula):
 
     with capture_output() as (out, err):
@@ -1,11 +1,14 @@
+import os
+
 import pytest
 
 from umbral.keys import UmbralPrivateKey
 from umbral.signing import Signer
 
 from nucypher.config.keyring import NucypherKeyring
-from nucypher.crypto.powers import DelegatingPower, DecryptingPower
+from nucypher.crypto.powers import DelegatingPower, DecryptingPower, SigningPower
 from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD
+from constant_sorrow import constants
 from constant_sorrow.constants import FEDERATED_ADDRESS
 
 
@@ -47,3 +50,82 @@ def test_generate_alice_keyring(tmpdir):
     another_delegating_pubkey = another_delegating_power.get_pubkey_from_label(label)
 
     assert delegating_pubkey == another_delegating_pubkey
+
+
+def test_derived_label_keys_are_cached_and_cleared_on_lock(tmpdir):
+    keyring = NucypherKeyring.generate(
+        checksum_address=FEDERATED_ADDRESS,
+        password=INSECURE_DEVELOPMENT_PASSWORD,
+        encrypting=True,
+        rest=False,
+        keyring_root=tmpdir
+    )
+    keyring.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
+    delegating_power = keyring.derive_crypto_power(DelegatingPower)
+
+    label = b'cached'
+    decrypting_power = delegating_power.get_decrypting_power_from_label(label)
+    another_decrypting_power = delegating_power.get_decrypting_power_from_label(label)
+    assert another_decrypting_power is not decrypting_power  # Each caller gets its own...
+    assert another_decrypting_power.keypair._privkey is decrypting_power.keypair._privkey  # ...of the same key
+    assert delegating_power.get_pubkey_from_label(label) == decrypting_power.public_key()
+
+    keyring.lock()
+    assert decrypting_power.keypair._privkey is constants.PUBLIC_ONLY
+    assert another_decrypting_power.keypair._privkey is constants.PUBLIC_ONLY
+
+    # Still derivable, and to the same key, after the cache is gone.
+    rederived_power = delegating_power.get_decrypting_power_from_label(label)
+    assert rederived_power is not decrypting_power
+    assert rederived_power.public_key() == decrypting_power.public_key()
+
+
+def test_derived_label_keys_expire():
+    now = 1000.0
+    delegating_power = DelegatingPower(label_cache_size=2, label_cache_ttl=10)
+    delegating_power._clock = lambda: now
+
+    cached_keys = delegating_power._DelegatingPower__label_keys
+
+    first = delegating_power.get_decrypting_power_from_label(b'first')
+    cached_first, _expiry = cached_keys[b'first']
+    delegating_power.get_decrypting_power_from_label(b'second')
+    delegating_power.get_decrypting_power_from_label(b'third')  # Evicts the least recently used label
+    assert b'first' not in cached_keys
+    assert cached_first._privkey is constants.PUBLIC_ONLY
+    assert first.keypair._privkey is not constants.PUBLIC_ONLY  # Still usable by whoever holds it
+
+    third = delegating_power.get_decrypting_power_from_label(b'third')
+    cached_third, _expiry = cached_keys[b'third']
+    now += 11
+    rederived_third = delegating_power.get_decrypting_power_from_label(b'third')
+    assert cached_third._privkey is constants.PUBLIC_ONLY
+    assert third.keypair._privkey is not constants.PUBLIC_ONLY
+    assert rederived_third.public_key() == third.public_key()
+
+
+def test_keyfiles_are_read_once_per_unlock(tmpdir):
+    keyring = NucypherKeyring.generate(
+        checksum_address=FEDERATED_ADDRESS,
+        password=INSECURE_DEVELOPMENT_PASSWORD,
+        encrypting=True,
+        rest=False,
+        keyring_root=tmpdir
+    )
+    keyring.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
+    decrypting_pubkey = keyring.derive_crypto_power(DecryptingPower).public_key()
+
+    # Everything needed to derive powers was read when unlocking.
+    private_key_dir = os.path.join(tmpdir, 'private')
+    moved_key_dir = os.path.join(tmpdir, 'moved')
+    os.rename(private_key_dir, moved_key_dir)
+    try:
+        assert keyring.derive_crypto_power(DecryptingPower).public_key() == decrypting_pubkey
+        assert keyring.derive_crypto_power(SigningPower).public_key() == keyring.signing_public_key
+        assert keyring.derive_crypto_power(DelegatingPower).get_pubkey_from_label(b'label')
+
+        keyring.lock()
+        with pytest.raises(NucypherKeyring.KeyringLocked):
+            keyring.derive_crypto_power(DecryptingPower)
+    finally:
+        os.rename(moved_key_dir, private_key_dir)
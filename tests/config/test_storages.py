@@ -15,12 +15,17 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
+import tempfile
+
 import pytest
+from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 
 from nucypher.characters.lawful import Ursula
 from nucypher.config.storages import (
     ForgetfulNodeStorage,
     TemporaryFileBasedNodeStorage,
+    SQLiteNodeStorage,
     NodeStorage
 )
 from nucypher.utilities.sandbox.constants import MOCK_URSULA_DB_FILEPATH, MOCK_URSULA_STARTING_PORT
@@ -112,3 +117,49 @@ class TestTemporaryFileBasedNodeStorage(BaseTestNodeStorageBackends):
     storage_backend = TemporaryFileBasedNodeStorage(character_class=BaseTestNodeStorageBackends.character_class,
                                                     federated_only=BaseTestNodeStorageBackends.federated_only)
     storage_backend.initialize()
+
+
+class TestSQLiteNodeStorage(BaseTestNodeStorageBackends):
+    __storage_root = tempfile.mkdtemp(prefix='nucypher-tmp-sqlite-')
+    storage_backend = SQLiteNodeStorage(character_class=BaseTestNodeStorageBackends.character_class,
+                                        federated_only=BaseTestNodeStorageBackends.federated_only,
+                                        db_filepath=os.path.join(__storage_root, SQLiteNodeStorage.DB_FILENAME))
+    storage_backend.initialize()
+
+    def test_bulk_upsert_and_lazy_reads(self, light_ursula):
+        node_storage = self.storage_backend
+        node_storage.clear()
+
+        nodes = [Ursula(rest_host='127.0.0.1', db_filepath=MOCK_URSULA_DB_FILEPATH, rest_port=port,
+                        federated_only=True)
+                 for port in range(MOCK_URSULA_STARTING_PORT, MOCK_URSULA_STARTING_PORT + 10)]
+        node_storage.store_nodes(nodes)
+        node_storage.store_nodes(nodes)  # Upsert; no duplicates
+        assert node_storage.all(federated_only=True) == set(nodes)
+
+        lazy_nodes = node_storage.iter_nodes(federated_only=True)
+        assert next(lazy_nodes) in nodes
+
+        # Stored nodes are read a page at a time, newest first
+        node_storage.PAGE_SIZE = 3
+        try:
+            stored_nodes = list(node_storage.iter_nodes(federated_only=True))
+        finally:
+            del node_storage.PAGE_SIZE
+        assert len(stored_nodes) == len(nodes)
+        assert set(stored_nodes) == set(nodes)
+        timestamps = [node.timestamp.epoch for node in stored_nodes]
+        assert timestamps == sorted(timestamps, reverse=True)
+        latest = max(node.timestamp.epoch for node in nodes)
+        assert set(node_storage.iter_nodes(federated_only=True, updated_since=latest)) == set()
+
+    def test_store_certificate_in_database(self, light_ursula):
+        node_storage = self.storage_backend
+        certificate_filepath = node_storage.store_node_certificate(certificate=light_ursula.certificate)
+        assert certificate_filepath is CERTIFICATE_NOT_SAVED
+        assert os.listdir(os.path.dirname(node_storage.db_filepath)) == [SQLiteNodeStorage.DB_FILENAME]
+
+        certificate = node_storage.get(checksum_address=light_ursula.checksum_address,
+                                       federated_only=True,
+                                       certificate_only=True)
+        assert certificate == light_ursula.certificate
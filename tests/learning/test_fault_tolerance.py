@@ -11,7 +11,7 @@ from constant_sorrow.constants import NOT_SIGNED
 from nucypher.characters.base import Character
 from nucypher.crypto.powers import TransactingPower
 from nucypher.network.nicknames import nickname_from_seed
-from nucypher.network.nodes import FleetStateTracker
+from nucypher.network.nodes import FleetStateTracker, VerificationCache
 from nucypher.utilities.sandbox.middleware import MockRestMiddleware
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas, make_ursula_for_staker
 
@@ -55,6 +55,36 @@ def test_blockchain_ursula_stamp_verification_tolerance(blockchain_ursulas):
     assert blockchain_teacher in lonely_blockchain_learner.known_nodes
 
 
+def test_blockchain_ursula_verification_cache(testerchain, blockchain_ursulas, mocker):
+    learner, verified_node, *the_others = list(blockchain_ursulas)
+    verification_cache = VerificationCache()
+
+    verified_node.verify_node(force=True,
+                              network_middleware=MockRestMiddleware(),
+                              certificate_filepath="quietorl",
+                              verification_cache=verification_cache)
+    assert verification_cache.misses == 1
+    assert len(verification_cache) == 1
+
+    # Forced re-verification in the same period skips the on-chain checks
+    mocker.patch.object(verified_node, '_worker_is_bonded_to_staker',
+                        side_effect=lambda: pytest.fail("Blockchain read despite a cached result"))
+    verified_node.verify_node(force=True,
+                              network_middleware=MockRestMiddleware(),
+                              certificate_filepath="quietorl",
+                              verification_cache=verification_cache)
+    assert verification_cache.hits == 1
+    assert verified_node.verified_worker
+
+    # A new period invalidates all prior results
+    period = verification_cache.period
+    testerchain.time_travel(periods=1)
+    assert not verification_cache.is_verified(staker_address=verified_node.checksum_address,
+                                              worker_address=verified_node.worker_address,
+                                              period=period + 1)
+    assert len(verification_cache) == 0
+
+
 @pytest.mark.skip("See Issue #1075")  # TODO: Issue #1075
 def test_invalid_workers_tolerance(testerchain,
                                    blockchain_ursulas,
@@ -21,6 +21,7 @@ import pytest_twisted as pt
 from twisted.internet.threads import deferToThread
 
 from nucypher.network.middleware import RestMiddleware
+from nucypher.utilities.sandbox.middleware import NodeIsDownMiddleware
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 
 
@@ -39,6 +40,37 @@ def test_proper_seed_node_instantiation(ursula_federated_test_config):
     assert firstula in any_other_ursula.known_nodes
 
 
+def test_learning_starts_without_waiting_for_unresponsive_seed_nodes(ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+
+    down_seed, up_seed = lonely_ursula_maker().pop(), lonely_ursula_maker().pop()
+    middleware = NodeIsDownMiddleware()
+    middleware.node_is_down(down_seed)
+
+    seed_nodes = [down_seed.seed_node_metadata(), up_seed.seed_node_metadata()]
+    any_other_ursula = lonely_ursula_maker(seed_nodes=seed_nodes, network_middleware=middleware).pop()
+    any_other_ursula.SEEDNODE_RETRY_ATTEMPTS = 1
+
+    try:
+        any_other_ursula.start_learning_loop(now=True)
+        assert up_seed in any_other_ursula.known_nodes
+        assert down_seed not in any_other_ursula.known_nodes
+
+        # Wait for the unresponsive seednode's attempt to run its course.
+        any_other_ursula.load_seednodes()
+        assert not any_other_ursula.done_seeding
+
+        # It's benched, to be retried by a later cycle.
+        assert any_other_ursula.teacher_scheduler.is_backed_off(down_seed.checksum_address)
+        assert down_seed.seed_node_metadata() in any_other_ursula.unresponsive_seed_nodes
+        assert down_seed not in any_other_ursula.known_nodes
+    finally:
+        any_other_ursula.stop_learning_loop()
+
+
 @pt.inlineCallbacks
 def test_get_cert_from_running_seed_node(ursula_federated_test_config):
     lonely_ursula_maker = partial(make_federated_ursulas,
@@ -0,0 +1,51 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+from nucypher.utilities.sandbox.simulation import FleetSimulation
+
+
+def test_simulated_fleet_converges_on_a_virtual_clock(ursula_federated_test_config):
+    simulation = FleetSimulation(quantity=6, initial_peers=1, seed=1, ursula_config=ursula_federated_test_config)
+    simulation.spawn()
+
+    # Everyone starts out knowing only the seed.
+    seed, *others = simulation.ursulas
+    assert all(list(ursula.known_nodes) == [seed] for ursula in others)
+    assert not simulation.converged()
+
+    report = simulation.run(max_virtual_seconds=600, sample_every=10)
+
+    assert report['converged']
+    assert simulation.converged()
+    assert len(simulation.fleet_states()) == 1
+    assert report['convergence_time'] <= simulation.clock.seconds() <= 600
+
+    assert report['learning_rounds'] > 0
+    assert report['requests'] > 0
+    assert report['bytes_received'] > 0
+    assert report['bytes_per_round'] > 0
+    assert report['deserialization_seconds'] > 0
+
+    timeline = report['timeline']
+    assert timeline[-1]['converged_nodes'] == simulation.quantity
+    assert timeline[-1]['fleet_states'] == 1
+    assert sum(sample['learning_rounds'] for sample in timeline) == report['learning_rounds']
+
+    # The learning loops are left stopped.
+    assert not any(ursula._learning_task.running for ursula in simulation.ursulas)
@@ -1,6 +1,10 @@
 from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
 from hendrix.experience import crosstown_traffic
 from hendrix.utils.test_utils import crosstownTaskListDecoratorFactory
+import pytest
+
+from nucypher.characters.lawful import Ursula
+from nucypher.network.nodes import FleetStateTracker
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 from functools import partial
 
@@ -106,3 +110,39 @@ def test_state_is_recorded_after_learning(federated_ursulas, ursula_federated_te
 
     assert len(states[0].nodes) == 2  # This and one other.
     assert len(states[1].nodes) == len(federated_ursulas) + 1  # Again, accounting for this Learner.
+
+
+def test_known_nodes_are_indexed(federated_ursulas):
+    tracker = FleetStateTracker()
+    for ursula in federated_ursulas:
+        tracker[ursula.checksum_address] = ursula
+
+    some_ursula = list(federated_ursulas)[0]
+    assert some_ursula in tracker
+    assert tracker.by_stamp(some_ursula.stamp) is some_ursula
+    assert tracker.by_stamp(some_ursula.stamp.as_umbral_pubkey()) is some_ursula
+    assert tracker.by_rest_interface(some_ursula.rest_interface.host,
+                                     some_ursula.rest_interface.port) is some_ursula
+
+    domain = list(some_ursula.serving_domains)[0]
+    assert set(tracker.serving([domain])) == {u for u in federated_ursulas if domain in u.serving_domains}
+    assert not tracker.serving(["not-a-real-domain"])
+
+    # Replacing a node re-indexes it.
+    stranger = Ursula.from_bytes(bytes(some_ursula), federated_only=True)
+    stranger.serving_domains = {"another-domain"}
+    tracker[some_ursula.checksum_address] = stranger
+    assert tracker.by_stamp(some_ursula.stamp) is stranger
+    assert tracker.addresses_serving(["another-domain"]) == {some_ursula.checksum_address}
+    assert some_ursula.checksum_address not in tracker.addresses_serving([domain])
+
+    # Nodes whose stamps aren't known are not members.
+    assert some_ursula not in FleetStateTracker()
+
+    # Clearing the tracker clears its indexes, too.
+    tracker.clear()
+    assert not tracker
+    assert stranger not in tracker
+    assert not tracker.serving(["another-domain"])
+    with pytest.raises(KeyError):
+        tracker.by_stamp(some_ursula.stamp)
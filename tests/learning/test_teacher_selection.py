@@ -0,0 +1,103 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+from collections import namedtuple
+
+from nucypher.network.nodes import TeacherScheduler
+from nucypher.utilities.sandbox.middleware import NodeIsDownMiddleware
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1_000_000
+
+    def __call__(self):
+        return self.now
+
+
+FakeNode = namedtuple('FakeNode', 'checksum_address')
+
+
+def test_teacher_scheduler_prefers_fast_fresh_teachers():
+    clock = FakeClock()
+    scheduler = TeacherScheduler(clock=clock)
+    fast, slow, untried = FakeNode('0xfast'), FakeNode('0xslow'), FakeNode('0xuntried')
+
+    scheduler.record_success(fast.checksum_address, latency=0.1)
+    scheduler.record_success(slow.checksum_address, latency=3)
+    assert scheduler.rank([slow, untried, fast]) == [fast, untried, slow]
+
+    # As their last success ages, teachers lose their freshness
+    score = scheduler.score(fast.checksum_address)
+    clock.now += TeacherScheduler.STALE_AFTER
+    assert scheduler.score(fast.checksum_address) > score
+
+
+def test_teacher_scheduler_backs_off_failing_teachers():
+    clock = FakeClock()
+    scheduler = TeacherScheduler(clock=clock)
+    flaky, steady = FakeNode('0xflaky'), FakeNode('0xsteady')
+
+    scheduler.record_failure(flaky.checksum_address)
+    assert scheduler.is_backed_off(flaky.checksum_address)
+    assert scheduler.rank([flaky, steady]) == [steady]
+
+    clock.now += TeacherScheduler.BASE_BACKOFF
+    assert not scheduler.is_backed_off(flaky.checksum_address)
+
+    # The backoff doubles with each consecutive failure...
+    scheduler.record_failure(flaky.checksum_address)
+    clock.now += TeacherScheduler.BASE_BACKOFF
+    assert scheduler.is_backed_off(flaky.checksum_address)
+    assert scheduler.details(flaky.checksum_address)['failures'] == 2
+
+    # ...but if everyone is backed off, we still get the teacher who'll be back soonest:
+    # flaky is backed off for another BASE_BACKOFF / 2, steady for a whole BASE_BACKOFF.
+    clock.now += TeacherScheduler.BASE_BACKOFF / 2
+    assert scheduler.is_backed_off(flaky.checksum_address)
+    scheduler.record_failure(steady.checksum_address)
+    assert scheduler.rank([flaky, steady]) == [flaky]
+    assert scheduler.rank([steady, flaky]) == [flaky]
+
+    # A success wipes the slate clean.
+    scheduler.record_success(flaky.checksum_address, latency=0.5)
+    assert scheduler.details(flaky.checksum_address)['failures'] == 0
+    assert not scheduler.is_backed_off(flaky.checksum_address)
+
+
+def test_learner_skips_unresponsive_teacher(federated_ursulas):
+    learner, down_teacher, *others = list(federated_ursulas)
+    original_middleware = learner.network_middleware
+    learner.network_middleware = NodeIsDownMiddleware()
+    learner.network_middleware.node_is_down(down_teacher)
+
+    learner._current_teacher_node = down_teacher
+    try:
+        learner.learn_from_teacher_node()
+    finally:
+        learner.network_middleware = original_middleware
+
+    details = learner.known_nodes.abridged_node_details(down_teacher, teacher_scheduler=learner.teacher_scheduler)
+    assert details['teacher']['failures'] == 1
+    assert details['teacher']['backed_off']
+
+    # The unresponsive teacher isn't picked again until its backoff expires.
+    learner.teacher_nodes.clear()
+    learner.select_teacher_nodes()
+    assert down_teacher not in learner.teacher_nodes
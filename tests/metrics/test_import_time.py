@@ -0,0 +1,89 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Cold-start import benchmarks for the CLI, from `python -X importtime` in a fresh interpreter.
+Which modules were imported is read from the interpreter's sys.modules as it exits, since
+-X importtime doesn't report modules imported with importlib (as the CLI's commands are).
+
+`nucypher --help` should only import the CLI's entry point, and a federated `nucypher bob`
+must not import the deployers, the solidity compiler, geth or eth-tester.  Run with -s to see
+the total import time and the most expensive top-level imports of each.
+"""
+
+import subprocess
+import sys
+from collections import namedtuple
+
+import pytest
+
+ImportTiming = namedtuple('ImportTiming', ('module', 'self_us', 'cumulative_us', 'depth'))
+
+LOADED_MODULE = 'loaded module:'
+RUN_CLI = ('import atexit, sys; '
+           f'atexit.register(lambda: print(*("{LOADED_MODULE}" + m for m in sorted(sys.modules)), sep="\\n", file=sys.stderr)); '
+           'from nucypher.cli.main import nucypher_cli; nucypher_cli()')
+REPORTED_IMPORTS = 10
+
+
+def import_times(*cli_args) -> tuple:
+    """The import timings, and the names of all the modules loaded, of a CLI invocation."""
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', RUN_CLI, *cli_args],
+                             stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE,
+                             universal_newlines=True)
+    assert process.returncode == 0, process.stderr
+
+    timings, loaded_modules = list(), set()
+    for line in process.stderr.splitlines():
+        if line.startswith(LOADED_MODULE):
+            loaded_modules.add(line[len(LOADED_MODULE):])
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth))
+    return timings, loaded_modules
+
+
+def report(title: str, timings: list) -> None:
+    top_level = [t for t in timings if t.depth == 0]
+    total = sum(t.cumulative_us for t in top_level)
+    print(f"\n{title}: {len(timings)} modules, {total / 1000:.0f} ms")
+    for timing in sorted(top_level, key=lambda t: t.cumulative_us, reverse=True)[:REPORTED_IMPORTS]:
+        print(f"  {timing.cumulative_us / 1000:8.1f} ms  {timing.module}")
+
+
+@pytest.mark.slow
+def test_help_cold_start():
+    timings, imported = import_times('--help')
+    report('nucypher --help', timings)
+
+    assert 'nucypher.cli.main' in imported
+    assert not any(module.startswith('nucypher.characters') for module in imported)
+    assert 'web3' not in imported
+
+
+@pytest.mark.slow
+def test_federated_bob_cold_start():
+    timings, imported = import_times('bob', '--help')  # Everything `bob run --federated-only` imports before running
+    report('nucypher bob', timings)
+
+    assert 'nucypher.cli.characters.bob' in imported
+    for heavyweight in ('nucypher.blockchain.eth.deployers', 'nucypher.blockchain.eth.sol.compile',
+                        'nucypher.utilities.sandbox.middleware', 'solc', 'geth', 'eth_tester'):
+        assert heavyweight not in imported
@@ -0,0 +1,275 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Micro-benchmarks for the protocol hot paths, run in-process over MockRestMiddleware.
+
+Requires the 'benchmark' extra (pytest-benchmark).  To record a JSON baseline for the current commit:
+
+    pytest tests/metrics/test_protocol_benchmarks.py --benchmark-only \
+        --benchmark-storage=tests/metrics/results/benchmarks --benchmark-autosave
+
+...and to compare a later commit against the most recent baseline, failing on a 10% slowdown:
+
+    pytest tests/metrics/test_protocol_benchmarks.py --benchmark-only \
+        --benchmark-storage=tests/metrics/results/benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Each benchmark runs a fixed number of rounds so that the suite stays cheap when collected with the rest of the tests.
+"""
+
+import datetime
+import os
+
+import maya
+import pytest
+from bytestring_splitter import VariableLengthBytestring
+from constant_sorrow.constants import NON_PAYMENT
+
+from nucypher.characters.lawful import Enrico, Ursula
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.network.nodes import FleetStateTracker
+from nucypher.policy.models import WorkOrder
+from nucypher.utilities.sandbox.constants import MOCK_POLICY_DEFAULT_M, NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK
+from nucypher.utilities.sandbox.middleware import MockRestMiddleware
+from nucypher.utilities.sandbox.policy import generate_random_label
+
+pytest.importorskip('pytest_benchmark')
+
+
+LIGHT_ROUNDS = 50
+HEAVY_ROUNDS = 5
+
+
+def run_with_fresh_arguments(benchmark, function, setup, rounds):
+    """
+    Benchmarks `function` over `rounds`, calling `setup` (untimed) before each round to produce its arguments.
+    """
+    def fresh_arguments():
+        return setup(), {}
+    return benchmark.pedantic(function, setup=fresh_arguments, rounds=rounds, iterations=1)
+
+
+@pytest.fixture(scope='module')
+def bob_following_the_policy(federated_bob, federated_ursulas, enacted_federated_policy):
+    treasure_map = enacted_federated_policy.treasure_map
+    federated_bob.treasure_maps[treasure_map.public_id()] = treasure_map
+    for ursula in federated_ursulas:
+        federated_bob.remember_node(ursula)
+    return federated_bob
+
+
+def make_capsules(quantity, policy, alice, bob):
+    enrico = Enrico(policy_encrypting_key=policy.public_key)
+    capsules = list()
+    for i in range(quantity):
+        message_kit, _signature = enrico.encrypt_message(f"Benchmark message {i}".encode())
+        capsule = message_kit.capsule
+        capsule.set_correctness_keys(delegating=policy.public_key,
+                                     receiving=bob.public_keys(DecryptingPower),
+                                     verifying=alice.stamp.as_umbral_pubkey())
+        capsules.append(capsule)
+    return capsules
+
+
+#
+# Node Serialization
+#
+
+def test_benchmark_ursula_serialization(benchmark, federated_ursulas):
+    benchmark.group = 'serialization'
+    ursula = list(federated_ursulas)[0]
+    ursula_as_bytes = benchmark.pedantic(bytes, args=(ursula,), rounds=LIGHT_ROUNDS)
+    assert Ursula.from_bytes(ursula_as_bytes, federated_only=True) == ursula
+
+
+def test_benchmark_ursula_deserialization(benchmark, federated_ursulas):
+    benchmark.group = 'serialization'
+    ursula = list(federated_ursulas)[0]
+    ursula_as_bytes = bytes(ursula)
+    stranger = benchmark.pedantic(Ursula.from_bytes,
+                                  args=(ursula_as_bytes,),
+                                  kwargs={'federated_only': True},
+                                  rounds=LIGHT_ROUNDS)
+    assert stranger == ursula
+
+
+def test_benchmark_batch_from_bytes(benchmark, federated_ursulas):
+    benchmark.group = 'serialization'
+    payload = b''.join(bytes(VariableLengthBytestring(bytes(u))) for u in federated_ursulas)
+    strangers = benchmark.pedantic(Ursula.batch_from_bytes,
+                                   args=(payload,),
+                                   kwargs={'federated_only': True},
+                                   rounds=LIGHT_ROUNDS)
+    assert len(strangers) == len(federated_ursulas)
+
+
+#
+# Fleet State
+#
+
+def test_benchmark_record_new_fleet_state(benchmark, federated_ursulas):
+    benchmark.group = 'fleet-state'
+
+    def fresh_tracker():
+        tracker = FleetStateTracker()
+        for ursula in federated_ursulas:
+            tracker[ursula.checksum_address] = ursula
+        return (tracker,)
+
+    checksum, state = run_with_fresh_arguments(benchmark,
+                                               FleetStateTracker.record_fleet_state,
+                                               setup=fresh_tracker,
+                                               rounds=LIGHT_ROUNDS)
+    assert len(state.nodes) == len(federated_ursulas)
+
+
+def test_benchmark_record_unchanged_fleet_state(benchmark, federated_ursulas):
+    benchmark.group = 'fleet-state'
+    tracker = FleetStateTracker()
+    for ursula in federated_ursulas:
+        tracker[ursula.checksum_address] = ursula
+    tracker.record_fleet_state()
+
+    assert benchmark.pedantic(tracker.record_fleet_state, rounds=LIGHT_ROUNDS) is None  # No news
+    assert len(tracker.states) == 1
+
+
+#
+# Re-encryption
+#
+
+@pytest.mark.parametrize('number_of_capsules', (1, 10, 100))
+def test_benchmark_reencrypt_via_rest(benchmark,
+                                      number_of_capsules,
+                                      federated_alice,
+                                      bob_following_the_policy,
+                                      enacted_federated_policy):
+    benchmark.group = 'reencryption'
+    bob = bob_following_the_policy
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = bob.known_nodes[node_id]
+    capsules = make_capsules(number_of_capsules, enacted_federated_policy, federated_alice, bob)
+
+    def fresh_work_order():
+        return (WorkOrder.construct_by_bob(arrangement_id, capsules, ursula, bob),)
+
+    cfrags = run_with_fresh_arguments(benchmark,
+                                      bob.network_middleware.reencrypt,
+                                      setup=fresh_work_order,
+                                      rounds=HEAVY_ROUNDS)
+    assert len(cfrags) == number_of_capsules
+
+
+@pytest.mark.parametrize('number_of_capsules', (1, 10, 100))
+def test_benchmark_construct_work_order(benchmark,
+                                        number_of_capsules,
+                                        federated_alice,
+                                        bob_following_the_policy,
+                                        enacted_federated_policy):
+    benchmark.group = 'work-orders'
+    bob = bob_following_the_policy
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = bob.known_nodes[node_id]
+    capsules = make_capsules(number_of_capsules, enacted_federated_policy, federated_alice, bob)
+
+    work_order = benchmark.pedantic(WorkOrder.construct_by_bob,
+                                    args=(arrangement_id, capsules, ursula, bob),
+                                    rounds=HEAVY_ROUNDS)
+    assert len(work_order) == number_of_capsules
+
+
+@pytest.mark.parametrize('number_of_capsules', (1, 10, 100))
+def test_benchmark_work_order_from_rest_payload(benchmark,
+                                                number_of_capsules,
+                                                federated_alice,
+                                                bob_following_the_policy,
+                                                enacted_federated_policy):
+    benchmark.group = 'work-orders'
+    bob = bob_following_the_policy
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = bob.known_nodes[node_id]
+    capsules = make_capsules(number_of_capsules, enacted_federated_policy, federated_alice, bob)
+    work_order = WorkOrder.construct_by_bob(arrangement_id, capsules, ursula, bob)
+
+    received_work_order = benchmark.pedantic(WorkOrder.from_rest_payload,
+                                             kwargs={'arrangement_id': arrangement_id,
+                                                     'rest_payload': work_order.payload(),
+                                                     'ursula': ursula,
+                                                     'alice_address': work_order.alice_address},
+                                             rounds=HEAVY_ROUNDS)
+    assert received_work_order.receipt_signature == work_order.receipt_signature
+
+
+#
+# Policies
+#
+
+def test_benchmark_policy_enact(benchmark, federated_alice, federated_bob, federated_ursulas):
+    benchmark.group = 'policies'
+    network_middleware = MockRestMiddleware()
+
+    def fresh_policy():
+        expiration = maya.now() + datetime.timedelta(days=5)
+        policy = federated_alice.create_policy(federated_bob,
+                                               label=generate_random_label(),
+                                               m=MOCK_POLICY_DEFAULT_M,
+                                               n=NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK,
+                                               expiration=expiration)
+        policy.make_arrangements(network_middleware,
+                                 value=NON_PAYMENT,
+                                 expiration=expiration,
+                                 handpicked_ursulas=federated_ursulas)
+        return policy, network_middleware
+
+    def enact(policy, network_middleware):
+        policy.enact(network_middleware)
+        return policy
+
+    policy = run_with_fresh_arguments(benchmark, enact, setup=fresh_policy, rounds=HEAVY_ROUNDS)
+    assert len(policy.treasure_map) == NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK
+
+
+def test_benchmark_alice_grant(benchmark, federated_alice, federated_bob, federated_ursulas):
+    benchmark.group = 'policies'
+
+    def fresh_label():
+        return (b'label://' + os.urandom(32),)
+
+    def grant(label):
+        return federated_alice.grant(bob=federated_bob,
+                                     label=label,
+                                     m=MOCK_POLICY_DEFAULT_M,
+                                     n=NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK,
+                                     expiration=maya.now() + datetime.timedelta(days=5),
+                                     handpicked_ursulas=federated_ursulas)
+
+    policy = run_with_fresh_arguments(benchmark, grant, setup=fresh_label, rounds=HEAVY_ROUNDS)
+    assert policy.bob == federated_bob
+
+
+def test_benchmark_bob_retrieve(benchmark, federated_alice, bob_following_the_policy, enacted_federated_policy):
+    benchmark.group = 'policies'
+    bob = bob_following_the_policy
+    enrico = Enrico(policy_encrypting_key=enacted_federated_policy.public_key)
+    alices_verifying_key = federated_alice.stamp.as_umbral_pubkey()
+
+    def fresh_message_kit():
+        message_kit, _signature = enrico.encrypt_message(b"Welcome to the benchmark.")
+        return message_kit, enrico, alices_verifying_key, enacted_federated_policy.label
+
+    cleartexts = run_with_fresh_arguments(benchmark, bob.retrieve, setup=fresh_message_kit, rounds=HEAVY_ROUNDS)
+    assert cleartexts == [b"Welcome to the benchmark."]
@@ -0,0 +1,90 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Startup-time benchmarks for what `nucypher ursula run` and `nucypher alice run` do before serving:
+restore the configuration file, unlock the keyring, derive the character's powers and produce it.
+
+Requires the 'benchmark' extra (pytest-benchmark); See test_protocol_benchmarks for recording and comparing baselines.
+Unlocking runs the password KDF, so each benchmark only runs a few rounds.
+"""
+
+import pytest
+
+from nucypher.config.characters import AliceConfiguration, UrsulaConfiguration
+from nucypher.network.nodes import FleetStateTracker
+from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD, TEMPORARY_DOMAIN
+
+pytest.importorskip('pytest_benchmark')
+
+
+STARTUP_ROUNDS = 3
+DERIVATION_ROUNDS = 20
+
+configuration_classes = (UrsulaConfiguration, AliceConfiguration)
+
+
+@pytest.fixture(scope='module', params=configuration_classes, ids=lambda c: c._NAME)
+def persistent_configuration(request, tmpdir_factory):
+    configuration_class = request.param
+    config_root = str(tmpdir_factory.mktemp(configuration_class._NAME))
+    configuration = configuration_class.generate(password=INSECURE_DEVELOPMENT_PASSWORD,
+                                                 config_root=config_root,
+                                                 federated_only=True,
+                                                 domains={TEMPORARY_DOMAIN},
+                                                 download_registry=False)
+    yield configuration
+    configuration.cleanup()
+
+
+def restore(configuration):
+    return configuration.__class__.from_configuration_file(filepath=configuration.filepath)
+
+
+def test_startup_unlock(benchmark, persistent_configuration):
+
+    def setup():
+        configuration = restore(persistent_configuration)
+        configuration.attach_keyring()
+        return (configuration.keyring, ), {}
+
+    def unlock(keyring):
+        keyring.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
+
+    benchmark.pedantic(unlock, setup=setup, rounds=STARTUP_ROUNDS)
+
+
+def test_startup_derive_power_ups(benchmark, persistent_configuration):
+    configuration = restore(persistent_configuration)
+    configuration.attach_keyring()
+    configuration.keyring.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
+
+    power_ups = benchmark.pedantic(configuration.derive_node_power_ups, rounds=DERIVATION_ROUNDS)
+    assert len(power_ups) == len(configuration.CHARACTER_CLASS._default_crypto_powerups)
+
+
+def test_startup_from_configuration_file_to_character(benchmark, persistent_configuration):
+
+    def start_up():
+        configuration = restore(persistent_configuration)
+        configuration.attach_keyring()
+        configuration.keyring.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
+        return configuration.produce()
+
+    character = benchmark.pedantic(start_up, rounds=STARTUP_ROUNDS)
+    assert isinstance(character, persistent_configuration.CHARACTER_CLASS)
+    assert isinstance(character.known_nodes, FleetStateTracker)
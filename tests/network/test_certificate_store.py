@@ -0,0 +1,118 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import ssl
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding, NoEncryption, PrivateFormat
+
+from nucypher.crypto.api import generate_self_signed_certificate
+from nucypher.network.middleware import CertificateStore, NucypherMiddlewareClient
+
+NULL_ADDRESS = '0x' + '0' * 40
+
+
+def test_certificate_store_caches_ssl_context_per_certificate(federated_ursulas):
+    first_ursula, second_ursula, *others = list(federated_ursulas)
+    certificate_store = CertificateStore(max_entries=2)
+
+    session = certificate_store.session(first_ursula.certificate)
+    ssl_context = certificate_store.ssl_context(first_ursula.certificate)
+    assert isinstance(ssl_context, ssl.SSLContext)
+    assert ssl_context.verify_mode == ssl.CERT_REQUIRED
+    assert ssl_context.cert_store_stats()['x509'] == 1  # Not a CA, so get_ca_certs() would not list it
+
+    # Built only once per certificate
+    assert certificate_store.session(first_ursula.certificate) is session
+    assert certificate_store.ssl_context(first_ursula.certificate) is ssl_context
+    assert first_ursula.certificate in certificate_store
+    assert second_ursula.certificate not in certificate_store
+
+    # The least recently used certificate is evicted first
+    certificate_store.session(second_ursula.certificate)
+    certificate_store.session(first_ursula.certificate)
+    certificate_store.session(others[0].certificate)
+    assert len(certificate_store) == 2
+    assert first_ursula.certificate in certificate_store
+    assert second_ursula.certificate not in certificate_store
+
+    certificate_store.forget(first_ursula.certificate)
+    assert first_ursula.certificate not in certificate_store
+
+
+@pytest.fixture(scope='module')
+def tls_servers():
+    """Two local HTTPS servers, each presenting its own self-signed certificate."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'OK')
+
+        def log_message(self, *args):
+            pass
+
+    servers = list()
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(2):
+            certificate, private_key = generate_self_signed_certificate(host='127.0.0.1',
+                                                                        checksum_address=NULL_ADDRESS,
+                                                                        curve=ec.SECP384R1())
+            certificate_filepath = os.path.join(directory, f'{index}.pem')
+            with open(certificate_filepath, 'wb') as certificate_file:
+                certificate_file.write(private_key.private_bytes(Encoding.PEM,
+                                                                 PrivateFormat.TraditionalOpenSSL,
+                                                                 NoEncryption()))
+                certificate_file.write(certificate.public_bytes(Encoding.PEM))
+
+            server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            server_context.load_cert_chain(certificate_filepath)
+            server = HTTPServer(('127.0.0.1', 0), Handler)
+            server.socket = server_context.wrap_socket(server.socket, server_side=True)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            servers.append((server, certificate))
+
+        yield servers
+
+    for server, _certificate in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pinned_requests_trust_only_the_pinned_certificate(tls_servers):
+    (first_server, first_certificate), (second_server, second_certificate) = tls_servers
+    client = NucypherMiddlewareClient()
+    client.certificate_store = CertificateStore()
+
+    response = client.get('status', host='127.0.0.1', port=first_server.server_port, certificate=first_certificate)
+    assert response.status_code == 200
+
+    # Making a request did not add any CA certificates to the pinned context...
+    ssl_context = client.certificate_store.ssl_context(first_certificate)
+    assert ssl_context.cert_store_stats()['x509'] == 1
+    assert ssl_context.verify_mode == ssl.CERT_REQUIRED
+
+    # ...so the pin still rejects any other certificate.
+    with pytest.raises(requests.exceptions.SSLError):
+        client.get('status', host='127.0.0.1', port=second_server.server_port, certificate=first_certificate)
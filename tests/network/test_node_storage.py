@@ -15,11 +15,15 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
+
 import maya
 import pytest
 import pytest_twisted as pt
 from twisted.internet.threads import deferToThread
 
+from nucypher.characters.lawful import Ursula
+from nucypher.config.storages import SQLiteNodeStorage
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 
 
@@ -53,3 +57,38 @@ def test_one_node_stores_a_bunch_of_others(federated_ursulas, ursula_federated_t
     assert list(newcomer.known_nodes)
     assert len(list(newcomer.known_nodes)) == len(list(newcomer.node_storage.all(True)))
     assert set(list(newcomer.known_nodes)) == set(list(newcomer.node_storage.all(True)))
+
+
+def test_learned_nodes_are_stored_in_one_batch(federated_ursulas, ursula_federated_test_config, tmpdir, mocker):
+    teacher = list(federated_ursulas)[3]
+    node_storage = SQLiteNodeStorage(character_class=Ursula,
+                                     federated_only=True,
+                                     db_filepath=os.path.join(str(tmpdir), SQLiteNodeStorage.DB_FILENAME))
+    node_storage.initialize()
+
+    newcomer = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                      quantity=1,
+                                      know_each_other=False,
+                                      save_metadata=True,
+                                      node_storage=node_storage,
+                                      lonely=True).pop()
+    newcomer.remember_node(teacher)
+
+    store_nodes = mocker.spy(node_storage, 'store_nodes')
+    store_node_metadata = mocker.spy(node_storage, 'store_node_metadata')
+    new_nodes = newcomer.learn_from_teacher_node()
+
+    assert new_nodes
+    store_nodes.assert_called_once_with(new_nodes)
+    store_node_metadata.assert_not_called()
+    assert node_storage.all(federated_only=True) == set(newcomer.known_nodes)
+
+    # Nodes read back from storage aren't written again.
+    iter_nodes = mocker.spy(node_storage, 'iter_nodes')
+    newcomer.read_nodes_from_storage()
+    iter_nodes.assert_called_once_with(federated_only=True)
+    store_nodes.assert_called_once()
+    store_node_metadata.assert_not_called()
+
+    # And no certificate files were written along the way.
+    assert os.listdir(str(tmpdir)) == [SQLiteNodeStorage.DB_FILENAME]
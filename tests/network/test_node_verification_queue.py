@@ -0,0 +1,123 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+from collections import namedtuple
+
+import maya
+
+from nucypher.network.server import NodeVerificationQueue
+
+FakeNode = namedtuple('FakeNode', ('checksum_address', 'timestamp'))
+
+
+def test_verification_queue_coalesces_and_bounds_work():
+    dispatched = []
+    verified = []
+
+    def verifier(node):
+        verified.append(node)
+        return node.checksum_address != '0xbad'
+
+    queue = NodeVerificationQueue(verifier=verifier, dispatcher=dispatched.append, workers=2, max_size=3)
+
+    now = maya.now()
+    node = FakeNode('0xnew', now)
+
+    # Many learners announce the same node; it's only queued once.
+    assert queue.enqueue(node)
+    assert not queue.enqueue(FakeNode('0xnew', now))
+    assert queue.is_pending('0xnew', now)
+    assert queue.coalesced == 2
+
+    # ...but a fresher announcement is new work.
+    assert queue.enqueue(FakeNode('0xnew', now.add(seconds=1)))
+    assert queue.enqueue(FakeNode('0xbad', now))
+
+    # Overload
+    assert not queue.enqueue(FakeNode('0xoverflow', now))
+    assert queue.dropped == 1
+    assert queue.stats['depth'] == 3
+
+    # No more than the configured number of workers were dispatched.
+    assert len(dispatched) == 2
+    for work in dispatched:
+        work()
+
+    assert len(verified) == 3
+    stats = queue.stats
+    assert stats['depth'] == 0
+    assert stats['workers'] == 0
+    assert stats['verified'] == 2
+    assert stats['failed'] == 1
+    assert stats['max_latency'] >= stats['mean_latency'] >= 0
+
+    # Once done, the same node may be verified again.
+    assert not queue.is_pending('0xnew', now)
+    assert queue.enqueue(node)
+    assert len(dispatched) == 3
+
+
+def test_verification_queue_survives_failed_dispatches():
+    verified = []
+
+    def failing_dispatcher(work):
+        raise RuntimeError("No threads left")
+
+    queue = NodeVerificationQueue(verifier=verified.append, dispatcher=failing_dispatcher, workers=1)
+    now = maya.now()
+
+    # Nothing is left behind to be reported as pending, or to hold a worker slot
+    assert not queue.enqueue(FakeNode('0xnew', now))
+    assert not queue.is_pending('0xnew', now)
+    assert queue.stats['workers'] == 0
+    assert queue.stats['depth'] == 0
+
+    dispatched = []
+    queue.dispatcher = dispatched.append
+    assert queue.enqueue(FakeNode('0xnew', now))
+    dispatched.pop()()
+    assert verified == [FakeNode('0xnew', now)]
+
+
+def test_verification_queue_replaces_dropped_workers():
+    clock = [0]
+    dispatched = []
+    verified = []
+    queue = NodeVerificationQueue(verifier=verified.append,
+                                  dispatcher=dispatched.append,
+                                  workers=1,
+                                  clock=lambda: clock[0])
+
+    now = maya.now()
+    assert queue.enqueue(FakeNode('0xnew', now))
+    dropped_worker = dispatched.pop()  # ...and never run
+    assert queue.is_pending('0xnew', now)
+    assert not dispatched
+
+    # Once the dropped worker is given up on, the next announcement dispatches another one
+    clock[0] += NodeVerificationQueue.DISPATCH_TIMEOUT + 1
+    assert queue.is_pending('0xnew', now)
+    assert len(dispatched) == 1
+    dispatched.pop()()
+    assert verified == [FakeNode('0xnew', now)]
+    assert not queue.is_pending('0xnew', now)
+    assert queue.stats['workers'] == 0
+
+    # A late start of the dropped worker doesn't unbalance the worker count
+    dropped_worker()
+    assert queue.stats['workers'] == 0
@@ -0,0 +1,86 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import pytest
+
+from nucypher.config.characters import UrsulaConfiguration
+from nucypher.utilities.metrics import MetricsRegistry, REGISTRY
+
+
+def test_metrics_registry_rendering():
+    registry = MetricsRegistry()
+
+    requests = registry.counter('test_requests_total', 'Requests', labelnames=('endpoint',))
+    requests.labels('public_information').inc()
+    requests.labels(endpoint='public_information').inc(2)
+
+    # Registration is idempotent...
+    assert registry.counter('test_requests_total', 'Requests', labelnames=('endpoint',)) is requests
+    # ...but not across types.
+    with pytest.raises(MetricsRegistry.MetricTypeMismatch):
+        registry.gauge('test_requests_total', 'Requests')
+    with pytest.raises(ValueError):
+        requests.inc(-1)
+
+    known_nodes = registry.gauge('test_known_nodes', 'Known nodes')
+    known_nodes.set_function(lambda: 42)
+
+    durations = registry.histogram('test_duration_seconds', 'Durations', buckets=(0.1, 1))
+    durations.observe(0.05)
+    durations.observe(0.5)
+    with durations.time():
+        pass
+
+    rendering = registry.render()
+    assert '# TYPE test_requests_total counter' in rendering
+    assert 'test_requests_total{endpoint="public_information"} 3.0' in rendering
+    assert 'test_known_nodes 42.0' in rendering
+    assert 'test_duration_seconds_bucket{le="0.1"} 2.0' in rendering
+    assert 'test_duration_seconds_bucket{le="1.0"} 3.0' in rendering
+    assert 'test_duration_seconds_bucket{le="+Inf"} 3.0' in rendering
+    assert 'test_duration_seconds_count 3.0' in rendering
+
+
+def test_ursula_serves_metrics(federated_ursulas):
+    ursula_config = UrsulaConfiguration(dev_mode=True, federated_only=True, known_nodes=federated_ursulas)
+    ursula = ursula_config(serve_metrics=True)
+    client = ursula.rest_app.test_client()
+
+    response = client.get('/public_information')
+    assert response.status_code == 200
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.headers['Content-Type'] == REGISTRY.CONTENT_TYPE
+
+    rendering = response.data.decode()
+    assert 'nucypher_http_requests_total{endpoint="public_information",method="GET",status="200"}' in rendering
+    assert f'nucypher_known_nodes {float(len(ursula.known_nodes))}' in rendering
+    assert 'nucypher_learning_round_duration_seconds_count' in rendering
+
+    # Each node's gauges are its own
+    assert 'nucypher_known_nodes' not in REGISTRY
+    other_ursula = UrsulaConfiguration(dev_mode=True, federated_only=True)(serve_metrics=True)
+    other_rendering = other_ursula.rest_app.test_client().get('/metrics').data.decode()
+    assert f'nucypher_known_nodes {float(len(other_ursula.known_nodes))}' in other_rendering
+    rendering = client.get('/metrics').data.decode()
+    assert f'nucypher_known_nodes {float(len(ursula.known_nodes))}' in rendering
+
+    # Off by default
+    ursula_without_metrics = ursula_config()
+    assert ursula_without_metrics.rest_app.test_client().get('/metrics').status_code == 404
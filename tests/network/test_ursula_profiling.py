@@ -0,0 +1,84 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+import os
+import threading
+import time
+
+from nucypher.utilities.profiling import SamplingProfiler, profile_for
+
+
+def busy_wait(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(100))
+
+
+def test_sampling_profiler_writes_collapsed_stacks(tmpdir):
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_wait, args=(stop,), name='busy-worker')
+    worker.start()
+
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    time.sleep(0.1)
+    samples = profiler.stop()
+    stop.set()
+    worker.join()
+
+    assert not profiler.running
+    assert profiler.sample_count > 0
+    assert any(stack.startswith('busy-worker;') and 'busy_wait' in stack for stack in samples)
+    # The sampler never records itself
+    assert not any(stack.startswith('sampling-profiler;') for stack in samples)
+
+    filepath = profiler.write(os.path.join(tmpdir, 'profile.folded'))
+    with open(filepath) as profile_file:
+        lines = profile_file.read().splitlines()
+    assert len(lines) == len(samples)
+    for line in lines:
+        stack, count = line.rsplit(' ', 1)
+        assert samples[stack] == int(count)
+
+
+def test_profile_for_dumps_to_output_dir(tmpdir):
+    written = threading.Event()
+    dumps = list()
+
+    def callback(filepath):
+        dumps.append(filepath)
+        written.set()
+
+    profile_for(seconds=0.05, output_dir=str(tmpdir), interval=0.001, prefix='ursula-test', callback=callback)
+    assert written.wait(timeout=5)
+
+    filepath, = dumps
+    assert os.path.dirname(filepath) == str(tmpdir)
+    assert os.path.basename(filepath).startswith('ursula-test-')
+    assert filepath.endswith(f'.{SamplingProfiler.FILE_EXTENSION}')
+    assert os.path.isfile(filepath)
+
+
+def test_rest_app_reports_endpoint_timing(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+    response = ursula.rest_app.test_client().get('/public_information')
+    assert response.status_code == 200
+
+    name, duration = response.headers['Server-Timing'].split(';dur=')
+    assert name == 'public_information'
+    assert float(duration) >= 0